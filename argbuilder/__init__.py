@@ -1 +1,21 @@
-from .public import *  # noqa: F403
+from typing import TYPE_CHECKING, Any
+if TYPE_CHECKING:
+    from .public import *  # noqa: F403
+
+
+__all__ = (
+    'ArgParser',
+    'arg',
+    'Flag',
+    'RememberMode',
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Load the public API on first use, so `import argbuilder` on its own costs next to nothing."""
+    if name not in __all__:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    from . import public
+    value = getattr(public, name)
+    globals()[name] = value
+    return value
@@ -1,12 +1,13 @@
 from ..utils import SpecialKey
-from .base import ParsedArgument
+from .base import TextArgument
 
+from bisect import bisect_left
 from enum import Enum
 from functools import cached_property
 
 from typing import TYPE_CHECKING, Optional, Any
 if TYPE_CHECKING:
-    from ..builder import Builder
+    from ..engine import Engine
 
 
 __all__ = (
@@ -14,9 +15,16 @@ __all__ = (
 )
 
 
-class EnumArgument(ParsedArgument[Enum]):
+class EnumArgument(TextArgument[Enum]):
     options: list[Enum]
     enum_cls: type[Enum]
+    options_by_name: dict[str, Enum]
+    options_by_value: dict[str, Enum]
+    options_by_lower_name: dict[str, Enum]
+    options_by_lower_value: dict[str, Enum]
+    prefix_keys: list[str]  # every name and value string, sorted
+    prefix_owners: list[int]  # index of the option each prefix key belongs to
+    REWRITES_ON_PARSE: bool = True  # a parsed value is shown by its name, "2" becomes "GREEN"
     def after_init(self) -> None:
         self.check_everything_is_valid_type(Enum)
         if self.options is None or len(self.options) == 0:
@@ -24,56 +32,66 @@ class EnumArgument(ParsedArgument[Enum]):
         if len(self.string_value) > 0:
             self.string_value = self.string_value.split('.', 1)[-1]
         self.enum_cls = type(self.options[0])
+        self.build_index()
         return super().after_init()
 
+    def build_index(self) -> None:
+        self.options_by_name = {}
+        self.options_by_value = {}
+        self.options_by_lower_name = {}
+        self.options_by_lower_value = {}
+        keys: list[tuple[str, int]] = []
+        for i, option in enumerate(self.options):
+            option_value: str = str(option.value)
+            self.options_by_name.setdefault(option.name, option)
+            self.options_by_value.setdefault(option_value, option)
+            self.options_by_lower_name.setdefault(option.name.lower(), option)
+            self.options_by_lower_value.setdefault(option_value.lower(), option)
+            keys.append((option.name, i))
+            keys.append((option_value, i))
+        keys.sort()
+        self.prefix_keys = [key for key, _ in keys]
+        self.prefix_owners = [owner for _, owner in keys]
+
+    def several_start_with(self, prefix: str) -> bool:
+        """Whether more than one option has a name or value starting with the prefix."""
+        first_owner: Optional[int] = None
+        for i in range(bisect_left(self.prefix_keys, prefix), len(self.prefix_keys)):
+            if not self.prefix_keys[i].startswith(prefix):
+                break
+            owner = self.prefix_owners[i]
+            if first_owner is None:
+                first_owner = owner
+            elif owner != first_owner:
+                return True  # an option has at most two keys, so this is reached within three steps
+        return False
+
     def raw_get_value(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> Enum:
-        possible_values: list[Optional[Enum]] = [
-            None, None, None, None,
-        ]
-        starting_with_count: int = 0
-        for option in self.options:
-            if option.name.startswith(self.string_value) or str(option.value).startswith(self.string_value):
-                starting_with_count += 1
-                if starting_with_count > 1:
+        value: Optional[Enum] = self.options_by_name.get(self.string_value, None)
+        if value is None and not self.several_start_with(self.string_value):
+            lowered: str = self.string_value.lower()
+            for option in (
+                self.options_by_value.get(self.string_value, None),
+                self.options_by_lower_name.get(lowered, None),
+                self.options_by_lower_value.get(lowered, None),
+            ):
+                if option is not None:
+                    value = option
                     break
-        check_things_other_than_name: bool = starting_with_count <= 1
-        lowered: str = self.string_value.lower()
-        for option in self.options:
-            if option.name == self.string_value and possible_values[0] is None:
-                possible_values[0] = option
-            if not check_things_other_than_name:
-                continue
-            if option.name.lower() == lowered and possible_values[2] is None:
-                possible_values[2] = option
-            option_value: str = str(option.value)
-            if option_value == self.string_value and possible_values[1] is None:
-                possible_values[1] = option
-            if option_value.lower() == lowered and possible_values[3] is None:
-                possible_values[3] = option
-
-        try:
-            value: Enum = next((value for value in possible_values if value is not None))
-            self.string_value = value.name
-            builder.inner_index = len(value.name)
-            return value
-        except StopIteration:
+        if value is None:
             raise ValueError(f'Invalid value {self.string_value} for {self.name}')
-
-    def raw_display(
-        self,
-        *,
-        builder: 'Builder[Any]',
-    ) -> str:
-        return self.string_value
+        self.string_value = value.name
+        builder.inner_index = len(value.name)
+        return value
 
     def raw_highlighted_range(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> tuple[int, int]:
         return self.one_letter_highlight(builder=builder)
 
@@ -81,18 +99,18 @@ class EnumArgument(ParsedArgument[Enum]):
     def type_string(self) -> str:
         return f'{self.enum_cls.__name__.title()}'
 
-    def handle_char(
+    def handle_text(
         self,
-        char: str,
+        text: str,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> None:
-        return self.regular_char_handling(char, builder=builder)
+        return self.regular_text_handling(text, builder=builder)
 
     def handle_special_key(
         self,
         special_key: SpecialKey,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> None:
         return self.regular_special_key_handling(special_key, builder=builder)
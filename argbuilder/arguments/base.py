@@ -1,9 +1,10 @@
 from ..utils import (
     AllowedTypes,
+    MISSING,
     SpecialKey,
-    colour,
+    TextBuffer,
 )
-from ..command import SetCommand
+from ..command import EditCommand, SetCommand
 
 from abc import (
     ABC,
@@ -20,12 +21,14 @@ from typing import (
 )
 
 if TYPE_CHECKING:
-    from ..builder import Builder
-    from ..flags import Flag
+    from ..engine import Engine
+    from ..flags import Flag, FlagPlan
+    from ..utils import Styled
 
 
 __all__ = (
     'ParsedArgument',
+    'TextArgument',
 )
 
 
@@ -40,13 +43,18 @@ class ParsedArgument(ABC, Generic[Value]):
     default: Optional[Value]
     allow_none: bool
     is_none: bool
-    string_value: str
+    buffer: TextBuffer
     value_is_default: bool
-    options: Optional[list[Value]]
+    options: Optional[list[Value]]  # in display order
+    option_set: Optional[frozenset[Value]]  # the same options, for membership checks
     flags: list['Flag']
+    flag_plan: 'FlagPlan'
     remember: Optional[bool | int]
     prefix: Optional[str]
     suffix: Optional[str]
+    _value: Value  # MISSING if not parsed yet
+    _is_valid: Optional[bool]  # validity without the volatile flags, None if not checked yet
+    REWRITES_ON_PARSE: bool = False  # parsing may rewrite string_value, so edits can not be stored as deltas
     def __init__(
         self,
         *,
@@ -58,6 +66,7 @@ class ParsedArgument(ABC, Generic[Value]):
         allow_none: bool,
         options: Optional[list[Value]],
         flags: Optional[list['Flag']],
+        flag_plan: 'FlagPlan',
         remember: Optional[bool | int],
         prefix: Optional[str],
         suffix: Optional[str],
@@ -69,13 +78,17 @@ class ParsedArgument(ABC, Generic[Value]):
         self.default = default
         self.allow_none = allow_none
         self.is_none = self.allow_none and self.default is None
-        self.string_value = str(self.default if self.default is not None else '')
+        self.buffer = TextBuffer(str(self.default if self.default is not None else ''))
         self.value_is_default = self.has_default
         self.options = options
+        self.option_set = frozenset(options) if options is not None else None
         self.flags = flags or []
+        self.flag_plan = flag_plan
         self.remember = remember
         self.prefix = prefix
         self.suffix = suffix
+        self._value = MISSING
+        self._is_valid = None
         self.after_init()
 
     def after_init(self) -> None:
@@ -85,23 +98,38 @@ class ParsedArgument(ABC, Generic[Value]):
     def required(self) -> bool:
         return not self.has_default
 
+    @property
+    def string_value(self) -> str:
+        return str(self.buffer)
+
+    @string_value.setter
+    def string_value(self, string_value: str) -> None:
+        self.buffer.set(string_value)
+
     def raw_set_string_value_and_is_none(
         self,
         string_value: str,
         is_none: bool,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> None:
         """Raises ValueError if the string value is invalid."""
         before_string_value = self.string_value
         before_is_none = self.is_none
         self.string_value = string_value
         self.is_none = is_none
+        self.invalidate()
         if not self.value_is_valid(builder=builder):
             self.string_value = before_string_value
             self.is_none = before_is_none
+            self.invalidate()
             raise ValueError('Invalid value')
 
+    def invalidate(self) -> None:
+        """Forget the cached value and validity, this has to be called whenever `string_value` or `is_none` is changed."""
+        self._value = MISSING
+        self._is_valid = None
+
     def check_everything_is_valid_type(
         self,
         cls: type,
@@ -110,9 +138,10 @@ class ParsedArgument(ABC, Generic[Value]):
         if self.default is not None and not isinstance(self.default, cls):
             raise ValueError(f'Default is not of type {cls}')
         if self.options is not None:
+            assert self.option_set is not None
             if len(self.options) == 0:
                 raise ValueError('Options cannot be empty')
-            if len(self.options) != len(set(self.options)):
+            if len(self.options) != len(self.option_set):
                 raise ValueError('Options contain duplicates')
             if not all(isinstance(o, cls) for o in self.options):
                 raise ValueError(f'Options are not all of type {cls}')
@@ -120,7 +149,20 @@ class ParsedArgument(ABC, Generic[Value]):
     def value_is_valid(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
+    ) -> bool:
+        if self._is_valid is None:
+            self._is_valid = self._stable_value_is_valid(builder=builder)
+        if not self._is_valid:
+            return False
+        if self.is_none or not self.flag_plan.is_volatile:
+            return True
+        return self.flag_plan.check_volatile(self, self.get_value(builder=builder), builder=builder)
+
+    def _stable_value_is_valid(
+        self,
+        *,
+        builder: 'Engine[Any]',
     ) -> bool:
         try:
             value = self.get_value(builder=builder)
@@ -128,62 +170,97 @@ class ParsedArgument(ABC, Generic[Value]):
             return False
         if value is None and self.allow_none:
             return True
-        if self.options is not None and value not in self.options:
+        if self.option_set is not None and value not in self.option_set:
             return False
-        for flag in self.flags:
-            if not flag.check(self, builder=builder):
-                return False
-        return True
+        return self.flag_plan.check_stable(self, value, builder=builder)
 
     @abstractmethod
     def raw_get_value(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> Value:
         raise NotImplementedError
 
     def get_value(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> Optional[Value]:
         if self.is_none:
             return None
-        return self.raw_get_value(builder=builder)
+        if self._value is MISSING:
+            self._value = self.raw_get_value(builder=builder)
+        return self._value
 
     @abstractmethod
     def raw_display(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> str:
         raise NotImplementedError
 
-    def display(
+    def raw_display_length(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
+    ) -> int:
+        return len(self.raw_display(builder=builder))
+
+    def raw_display_window(
+        self,
+        start: int,
+        end: int,
+        *,
+        builder: 'Engine[Any]',
     ) -> str:
+        return self.raw_display(builder=builder)[start:end]
+
+    def display_length(
+        self,
+        *,
+        builder: 'Engine[Any]',
+    ) -> int:
         if self.is_none:
-            return 'None'
-        display = self.raw_display(builder=builder)
+            return 4
+        return self.raw_display_length(builder=builder)
+
+    def display_window(
+        self,
+        start: int,
+        end: int,
+        *,
+        builder: 'Engine[Any]',
+    ) -> str:
+        """The part of `display` between `start` and `end`, without building the rest of it."""
+        if self.is_none:
+            return 'None'[start:end]
+        display = self.raw_display_window(start, end, builder=builder)
         for flag in self.flags:
-            display = flag.maybe_change_display(self, display, builder=builder)
+            display = flag.maybe_change_display(self, display, builder=builder, offset=start)
         display = display.replace('\t', ' ')  # TODO: proper tab handling? seems to be fine for now
+        display = display.replace('\n', ' ')  # pasted values can span several lines
         return display
 
+    def display(
+        self,
+        *,
+        builder: 'Engine[Any]',
+    ) -> str:
+        return self.display_window(0, self.display_length(builder=builder), builder=builder)
+
     def one_letter_highlight(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> tuple[int, int]:
         return (builder.inner_index, builder.inner_index + 1)
 
     def entire_value_highlight(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> tuple[int, int]:
         return (0, len(self.raw_display(builder=builder)))
 
@@ -191,14 +268,14 @@ class ParsedArgument(ABC, Generic[Value]):
     def raw_highlighted_range(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> tuple[int, int]:
         raise NotImplementedError
 
     def highlighted_range(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> tuple[int, int]:
         if self.is_none:
             return (0, 4)
@@ -208,56 +285,77 @@ class ParsedArgument(ABC, Generic[Value]):
         self,
         *,
         forced_colour: Optional[str] = None,
-    ) -> str:
+    ) -> 'Styled':
+        from ..utils import colour  # only needed to draw, importing it up front would slow down every import
         name = self.name.replace('_', '-')
         if self.required:
             c = forced_colour or '#feae34'
-            return colour(f'<{colour(name, hex=c)}>', hex='#f7f7f9')
+            return colour('<' + colour(name, hex=c) + '>', hex='#f7f7f9')
         c = forced_colour or '#e86a92'
-        return colour(f'[{colour(name, hex=c)}]', hex='#f7f7f9')
+        return colour('[' + colour(name, hex=c) + ']', hex='#f7f7f9')
 
     @cached_property
     def type_string(self) -> str:
         return self.__class__.__name__.removesuffix('Argument')
 
-    def get_string_value_with_char_inserted(
-        self,
-        char: str,
-        *,
-        builder: 'Builder[Any]',
-    ) -> str:
-        return self.string_value[:builder.inner_index] + char + self.string_value[builder.inner_index:]
-
-    def regular_char_handling(
+    def edit(
         self,
-        char: str,
+        position: int,
+        remove: int,
+        inserted: str,
         *,
-        builder: 'Builder[Any]',
+        after_inner_index: int,
+        builder: 'Engine[Any]',
     ) -> None:
-        builder.command_manager.do(SetCommand(
+        if self.REWRITES_ON_PARSE:
+            value = self.string_value
+            builder.command_manager.do(SetCommand(
+                argument=self,
+                after_string_value=value[:position] + inserted + value[position + remove:],
+                after_is_none=False,
+                after_index=builder.index,
+                after_inner_index=after_inner_index,
+            ), builder=builder)
+            return
+        builder.command_manager.do(EditCommand(
             argument=self,
-            after_string_value=self.get_string_value_with_char_inserted(char, builder=builder),
-            after_is_none=False,
+            position=position,
+            removed=self.buffer.slice(position, position + remove),
+            inserted=inserted,
             after_index=builder.index,
-            after_inner_index=builder.inner_index + len(char),
+            after_inner_index=after_inner_index,
         ), builder=builder)
 
+    def regular_text_handling(
+        self,
+        text: str,
+        *,
+        builder: 'Engine[Any]',
+    ) -> None:
+        if not text:
+            return
+        self.edit(
+            builder.inner_index, 0, text,
+            after_inner_index=builder.inner_index + len(text),
+            builder=builder,
+        )
+
     @abstractmethod
-    def handle_char(
+    def handle_text(
         self,
-        char: str,
+        text: str,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> None:
-        """Return True if a new command was added, False otherwise."""
+        """Handle typed or pasted text, this can be more than one character when input arrives in a burst."""
         raise NotImplementedError
 
     def _regular_backspace(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> None:
-        if len(self.string_value) == 0:
+        if len(self.buffer) == 0:
             if self.allow_none:
                 builder.command_manager.do(SetCommand(
                     argument=self,
@@ -269,69 +367,57 @@ class ParsedArgument(ABC, Generic[Value]):
             return
         if builder.inner_index == 0:
             return
-        builder.command_manager.do(SetCommand(
-            argument=self,
-            after_string_value=self.string_value[:builder.inner_index - 1] + self.string_value[builder.inner_index:],
-            after_is_none=False,
-            after_index=builder.index,
+        self.edit(
+            builder.inner_index - 1, 1, '',
             after_inner_index=builder.inner_index - 1,
-        ), builder=builder)
-        return
+            builder=builder,
+        )
 
     def _regular_ctrl_backspace(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> None:
         if builder.inner_index == 0:
             return
-        builder.command_manager.do(SetCommand(
-            argument=self,
-            after_string_value=self.string_value[builder.inner_index:],
-            after_is_none=False,
-            after_index=builder.index,
+        self.edit(
+            0, builder.inner_index, '',
             after_inner_index=0,
-        ), builder=builder)
-        return
+            builder=builder,
+        )
 
     def _regular_delete(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> None:
-        if builder.inner_index == len(self.string_value):
+        if builder.inner_index == len(self.buffer):
             return
-        builder.command_manager.do(SetCommand(
-            argument=self,
-            after_string_value=self.string_value[:builder.inner_index] + self.string_value[builder.inner_index + 1:],
-            after_is_none=False,
-            after_index=builder.index,
+        self.edit(
+            builder.inner_index, 1, '',
             after_inner_index=builder.inner_index,
-        ), builder=builder)
-        return
+            builder=builder,
+        )
 
     def _regular_ctrl_delete(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> None:
-        if builder.inner_index == len(self.string_value):
+        if builder.inner_index == len(self.buffer):
             return
-        builder.command_manager.do(SetCommand(
-            argument=self,
-            after_string_value=self.string_value[:builder.inner_index],
-            after_is_none=False,
-            after_index=builder.index,
+        self.edit(
+            builder.inner_index, len(self.buffer) - builder.inner_index, '',
             after_inner_index=builder.inner_index,
-        ), builder=builder)
-        return
+            builder=builder,
+        )
 
     def _regular_left(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> None:
-        if len(self.string_value) == 0 and self.allow_none:
+        if len(self.buffer) == 0 and self.allow_none:
             builder.command_manager.do(SetCommand(
                 argument=self,
                 after_string_value='',
@@ -346,31 +432,31 @@ class ParsedArgument(ABC, Generic[Value]):
     def _regular_ctrl_left(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> None:
         builder.inner_index = 0
 
     def _regular_right(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> None:
-        if builder.inner_index == len(self.string_value):
+        if builder.inner_index == len(self.buffer):
             return
-        builder.inner_index = min(len(self.string_value), builder.inner_index + 1)
+        builder.inner_index = min(len(self.buffer), builder.inner_index + 1)
 
     def _regular_ctrl_right(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> None:
-        builder.inner_index = len(self.string_value)
+        builder.inner_index = len(self.buffer)
 
     def _regular_special_key(
         self,
         special_key: SpecialKey,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> bool:
         if special_key is SpecialKey.BACKSPACE:
             self._regular_backspace(builder=builder)
@@ -402,7 +488,7 @@ class ParsedArgument(ABC, Generic[Value]):
         self,
         special_key: SpecialKey,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> None:
         something_changed = self._regular_special_key(special_key, builder=builder)
         if something_changed and special_key in (
@@ -418,7 +504,34 @@ class ParsedArgument(ABC, Generic[Value]):
         self,
         special_key: SpecialKey,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> None:
         """Return True if a new command was added, False otherwise."""
         raise NotImplementedError
+
+
+class TextArgument(ParsedArgument[Value]):
+    """An argument that is displayed exactly as it is typed, so the display is read straight from the buffer."""
+
+    def raw_display(
+        self,
+        *,
+        builder: 'Engine[Any]',
+    ) -> str:
+        return self.string_value
+
+    def raw_display_length(
+        self,
+        *,
+        builder: 'Engine[Any]',
+    ) -> int:
+        return len(self.buffer)
+
+    def raw_display_window(
+        self,
+        start: int,
+        end: int,
+        *,
+        builder: 'Engine[Any]',
+    ) -> str:
+        return self.buffer.slice(start, end)
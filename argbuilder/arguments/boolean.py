@@ -4,7 +4,7 @@ from ..command import SetCommand
 
 from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
-    from ..builder import Builder
+    from ..engine import Engine
 
 
 __all__ = (
@@ -23,8 +23,9 @@ class BooleanArgument(ParsedArgument[bool]):
         string_value: str,
         is_none: bool,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> None:
+        self.invalidate()
         if is_none:
             self.string_value = ''
             self.is_none = True
@@ -45,7 +46,7 @@ class BooleanArgument(ParsedArgument[bool]):
     def raw_get_value(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> bool:
         if not self.string_value:
             raise ValueError('No value given')
@@ -54,7 +55,7 @@ class BooleanArgument(ParsedArgument[bool]):
     def raw_display(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> str:
         try:
             value = self.raw_get_value(builder=builder)
@@ -65,19 +66,22 @@ class BooleanArgument(ParsedArgument[bool]):
     def raw_highlighted_range(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> tuple[int, int]:
         return self.entire_value_highlight(builder=builder)
 
     TRUE_CHARS: set[str] = set('1tTyY')
     FALSE_CHARS: set[str] = set('0fFnN')
 
-    def handle_char(
+    def handle_text(
         self,
-        char: str,
+        text: str,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> None:
+        char = next((char for char in reversed(text) if char in self.TRUE_CHARS or char in self.FALSE_CHARS), None)
+        if char is None:
+            return
         if char in self.TRUE_CHARS:
             builder.command_manager.do(SetCommand(
                 argument=self,
@@ -99,7 +103,7 @@ class BooleanArgument(ParsedArgument[bool]):
         self,
         special_key: SpecialKey,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> None:
         if special_key is SpecialKey.BACKSPACE:
             if self.is_none or self.string_value != '':
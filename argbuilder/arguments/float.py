@@ -1,9 +1,9 @@
 from ..utils import SpecialKey
-from .base import ParsedArgument
+from .base import TextArgument
 
 from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
-    from ..builder import Builder
+    from ..engine import Engine
 
 
 __all__ = (
@@ -11,7 +11,7 @@ __all__ = (
 )
 
 
-class FloatArgument(ParsedArgument[float]):
+class FloatArgument(TextArgument[float]):
     string_value: str
     def after_init(self) -> None:
         self.check_everything_is_valid_type(float)
@@ -20,40 +20,32 @@ class FloatArgument(ParsedArgument[float]):
     def raw_get_value(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> float:
         return float(self.string_value)
 
-    def raw_display(
-        self,
-        *,
-        builder: 'Builder[Any]',
-    ) -> str:
-        return self.string_value
-
     def raw_highlighted_range(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> tuple[int, int]:
         return self.one_letter_highlight(builder=builder)
 
     ALLOWED_CHARS: set[str] = set('0123456789-._eE')
 
-    def handle_char(
+    def handle_text(
         self,
-        char: str,
+        text: str,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> None:
-        if char not in self.ALLOWED_CHARS:
-            return
-        return self.regular_char_handling(char, builder=builder)
+        text = ''.join(char for char in text if char in self.ALLOWED_CHARS)
+        return self.regular_text_handling(text, builder=builder)
 
     def handle_special_key(
         self,
         special_key: SpecialKey,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> None:
         return self.regular_special_key_handling(special_key, builder=builder)
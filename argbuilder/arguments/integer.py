@@ -1,9 +1,9 @@
 from ..utils import SpecialKey
-from .base import ParsedArgument
+from .base import TextArgument
 
 from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
-    from ..builder import Builder
+    from ..engine import Engine
 
 
 __all__ = (
@@ -11,7 +11,7 @@ __all__ = (
 )
 
 
-class IntegerArgument(ParsedArgument[int]):
+class IntegerArgument(TextArgument[int]):
     def after_init(self) -> None:
         self.check_everything_is_valid_type(int)
         return super().after_init()
@@ -19,43 +19,35 @@ class IntegerArgument(ParsedArgument[int]):
     def raw_get_value(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> int:
         value = float(self.string_value)
         if value.is_integer():
             return int(value)
         raise ValueError(f'Value {value} is not an integer')
 
-    def raw_display(
-        self,
-        *,
-        builder: 'Builder[Any]',
-    ) -> str:
-        return self.string_value
-
     def raw_highlighted_range(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> tuple[int, int]:
         return self.one_letter_highlight(builder=builder)
 
     ALLOWED_CHARS: set[str] = set('0123456789-_eE')
 
-    def handle_char(
+    def handle_text(
         self,
-        char: str,
+        text: str,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> None:
-        if char not in self.ALLOWED_CHARS:
-            return
-        return self.regular_char_handling(char, builder=builder)
+        text = ''.join(char for char in text if char in self.ALLOWED_CHARS)
+        return self.regular_text_handling(text, builder=builder)
 
     def handle_special_key(
         self,
         special_key: SpecialKey,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> None:
         return self.regular_special_key_handling(special_key, builder=builder)
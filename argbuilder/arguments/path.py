@@ -5,7 +5,7 @@ from pathlib import Path
 
 from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
-    from ..builder import Builder
+    from ..engine import Engine
 
 
 __all__ = (
@@ -21,7 +21,7 @@ class PathArgument(ParsedArgument[Path]):
     def raw_get_value(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> Path:
         if not self.string_value:
             raise ValueError('Empty path is not allowed')
@@ -30,7 +30,7 @@ class PathArgument(ParsedArgument[Path]):
     def raw_display(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> str:
         try:
             return str(self.raw_get_value(builder=builder))
@@ -40,22 +40,22 @@ class PathArgument(ParsedArgument[Path]):
     def raw_highlighted_range(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> tuple[int, int]:
         return self.one_letter_highlight(builder=builder)
 
-    def handle_char(
+    def handle_text(
         self,
-        char: str,
+        text: str,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> None:
-        return self.regular_char_handling(char, builder=builder)
+        return self.regular_text_handling(text, builder=builder)
 
     def handle_special_key(
         self,
         special_key: SpecialKey,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> None:
         return self.regular_special_key_handling(special_key, builder=builder)
@@ -1,9 +1,9 @@
 from ..utils import SpecialKey
-from .base import ParsedArgument
+from .base import TextArgument
 
 from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
-    from ..builder import Builder
+    from ..engine import Engine
 
 
 __all__ = (
@@ -11,7 +11,7 @@ __all__ = (
 )
 
 
-class StringArgument(ParsedArgument[str]):
+class StringArgument(TextArgument[str]):
     def after_init(self) -> None:
         self.check_everything_is_valid_type(str)
         return super().after_init()
@@ -19,38 +19,31 @@ class StringArgument(ParsedArgument[str]):
     def raw_get_value(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> str:
         if not self.string_value:
             raise ValueError('Empty string is not allowed')
         return self.string_value
 
-    def raw_display(
-        self,
-        *,
-        builder: 'Builder[Any]',
-    ) -> str:
-        return self.string_value
-
     def raw_highlighted_range(
         self,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> tuple[int, int]:
         return self.one_letter_highlight(builder=builder)
 
-    def handle_char(
+    def handle_text(
         self,
-        char: str,
+        text: str,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> None:
-        return self.regular_char_handling(char, builder=builder)
+        return self.regular_text_handling(text, builder=builder)
 
     def handle_special_key(
         self,
         special_key: SpecialKey,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> None:
         return self.regular_special_key_handling(special_key, builder=builder)
@@ -0,0 +1,156 @@
+from .arguments import BooleanArgument, ParsedArgument
+
+from typing import Any, Iterable, Optional
+
+
+__all__ = (
+    'ArgvTable',
+    'option_name',
+)
+
+
+FLAG_VALUE: str = '1'  # the value of an option that is given without one
+
+
+def option_name(argument: ParsedArgument[Any]) -> str:
+    """The long option of `argument` as it is typed on the command line."""
+    return f'--{argument.name.replace('_', '-')}'
+
+
+class PrefixNode:
+    children: dict[str, 'PrefixNode']
+    argument: Optional[ParsedArgument[Any]]  # the argument with exactly this name
+    only: Optional[ParsedArgument[Any]]  # the argument below this node, None if there are several
+    count: int  # number of arguments below this node
+    def __init__(self) -> None:
+        self.children = {}
+        self.argument = None
+        self.only = None
+        self.count = 0
+
+    def arguments(self) -> Iterable[ParsedArgument[Any]]:
+        if self.argument is not None:
+            yield self.argument
+        for child in self.children.values():
+            yield from child.arguments()
+
+
+class ArgvTable:
+    """Resolves the argv tokens of one schema in constant time, accepting long, prefixed, short and clustered options."""
+    arguments: list[ParsedArgument[Any]]
+    by_name: dict[str, ParsedArgument[Any]]
+    by_short: dict[str, ParsedArgument[Any]]
+    prefixes: PrefixNode
+    def __init__(self, arguments: list[ParsedArgument[Any]]) -> None:
+        self.arguments = arguments
+        self.by_name = {}
+        self.prefixes = PrefixNode()
+        for argument in arguments:
+            self.by_name.setdefault(argument.name, argument)
+            self.add_prefixes(argument)
+        first_letters: dict[str, list[ParsedArgument[Any]]] = {}
+        for argument in arguments:
+            first_letters.setdefault(argument.name[:1], []).append(argument)
+        self.by_short = {
+            letter: owners[0]
+            for letter, owners in first_letters.items()
+            if len(owners) == 1 and letter.isalpha()
+        }
+
+    def add_prefixes(self, argument: ParsedArgument[Any]) -> None:
+        node = self.prefixes
+        for char in argument.name:
+            node.count += 1
+            node.only = argument if node.count == 1 else None
+            node = node.children.setdefault(char, PrefixNode())
+        node.count += 1
+        node.only = argument if node.count == 1 else None
+        node.argument = argument
+
+    def resolve_long(self, key: str) -> ParsedArgument[Any]:
+        argument = self.by_name.get(key, None)
+        if argument is not None:
+            return argument
+        node: Optional[PrefixNode] = self.prefixes
+        for char in key:
+            node = node.children.get(char, None)
+            if node is None:
+                raise ValueError(f'Invalid argument "{key}"')
+        if node.only is not None:
+            return node.only
+        candidates = ', '.join(f'"{option_name(a)}"' for a in node.arguments())
+        raise ValueError(f'Ambiguous argument "{key}", it could be {candidates}')
+
+    def is_option(self, token: str) -> bool:
+        """Whether `token` is an option, a dash that is not followed by a known short option is a value, like "-5" or "-foo"."""
+        if token.startswith('--'):
+            return True
+        return len(token) > 1 and token[0] == '-' and token[1] in self.by_short
+
+    @staticmethod
+    def takes_value(argument: ParsedArgument[Any]) -> bool:
+        return not isinstance(argument, BooleanArgument)
+
+    def assign(
+        self,
+        mapping: dict[ParsedArgument[Any], str],
+        argument: ParsedArgument[Any],
+        value: str,
+        *,
+        key: str,
+    ) -> None:
+        if argument in mapping:
+            raise ValueError(f'Key "{key}" used more than once')
+        mapping[argument] = value
+
+    def parse(self, argv: list[str]) -> dict[ParsedArgument[Any], str]:
+        """Map the arguments that are given in `argv` to their string value, in a single pass."""
+        mapping: dict[ParsedArgument[Any], str] = {}
+        positional_values: list[str] = []
+        i = 0
+        while i < len(argv):
+            token = argv[i]
+            i += 1
+            if token == '--':
+                positional_values.extend(argv[i:])
+                break
+            if token.startswith('--'):
+                key, has_value, value = token[2:].partition('=')
+                key = key.replace('-', '_')
+                argument = self.resolve_long(key)
+                if not has_value:
+                    if i < len(argv) and not self.is_option(argv[i]):
+                        value = argv[i]
+                        i += 1
+                    else:
+                        value = FLAG_VALUE
+                self.assign(mapping, argument, value, key=key)
+                continue
+            if not self.is_option(token):
+                positional_values.append(token)
+                continue
+            cluster = token[1:]
+            for j, letter in enumerate(cluster):
+                argument = self.by_short.get(letter, None)
+                if argument is None:
+                    raise ValueError(f'Invalid argument "-{letter}"')
+                if not self.takes_value(argument):
+                    self.assign(mapping, argument, FLAG_VALUE, key=f'-{letter}')
+                    continue
+                value = cluster[j + 1:].removeprefix('=')
+                if not value:
+                    if i >= len(argv):
+                        raise ValueError(f'Argument "-{letter}" needs a value')
+                    value = argv[i]
+                    i += 1
+                self.assign(mapping, argument, value, key=f'-{letter}')
+                break
+
+        cursor = 0
+        for value in positional_values:
+            while cursor < len(self.arguments) and self.arguments[cursor] in mapping:
+                cursor += 1
+            if cursor == len(self.arguments):
+                raise ValueError('Too many positional arguments')
+            mapping[self.arguments[cursor]] = value
+        return mapping
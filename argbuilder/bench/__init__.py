@@ -0,0 +1,5 @@
+from .schema import *  # noqa: F403
+from .keys import *  # noqa: F403
+from .runner import *  # noqa: F403
+from .importtime import *  # noqa: F403
+from .scaling import *  # noqa: F403
@@ -0,0 +1,81 @@
+"""Replay key streams against generated schemas and report how long every key takes."""
+from .. import __name__ as package_name
+from .importtime import check_import, measure_import
+from .keys import load_keys, synthetic_keys
+from .runner import run_benchmark
+from .scaling import check_scaling, measure_scaling
+
+import argparse
+import json
+from pathlib import Path
+import platform
+import sys
+import time
+
+from typing import Any, Optional
+
+
+DEFAULT_SIZES: tuple[int, ...] = (10, 100, 1_000, 10_000)
+
+
+def format_row(result: dict[str, Any]) -> str:
+    return (
+        f'{result['fields']:>6} fields'
+        f'  compile {result['compile_ms']:>9.1f} ms'
+        f'  first frame {result['first_frame_ms']:>7.2f} ms'
+        f'  model {result['model_us']['mean']:>8.1f} us (p95 {result['model_us']['p95']:>8.1f})'
+        f'  render {result['render_us']['mean']:>8.1f} us (p95 {result['render_us']['p95']:>8.1f})'
+        f'  {result['bytes_per_key']['mean']:>7.1f} B/key'
+        + (f'  peak {result['peak_alloc_bytes_per_key']['mean'] / 1024:>7.1f} KiB/key' if 'peak_alloc_bytes_per_key' in result else '')
+    )
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog=f'python -m {package_name}.bench', description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)), help='comma separated schema sizes')
+    parser.add_argument('--keys', type=int, default=500, help='number of synthetic keys')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the synthetic keys')
+    parser.add_argument('--replay', type=Path, help='replay a recorded key stream instead')
+    parser.add_argument('--no-alloc', action='store_true', help='skip the allocation replay')
+    parser.add_argument('--json', type=Path, help='write the results to this file')
+    parser.add_argument('--import-budget', type=float, metavar='MS', help='also time the import, and fail if it takes longer')
+    parser.add_argument('--scaling', action='store_true', help='also check that compiling a schema scales linearly')
+    options = parser.parse_args(argv)
+
+    problems: list[str] = []
+    import_result: Optional[dict[str, Any]] = None
+    if options.import_budget is not None:
+        import_result = measure_import()
+        print(f'import {import_result['import_ms']:>7.1f} ms (min {import_result['import_ms_min']:.1f}, budget {options.import_budget:.1f})', flush=True)
+        problems.extend(check_import(import_result, budget_ms=options.import_budget))
+
+    scaling_result: Optional[dict[str, Any]] = None
+    if options.scaling:
+        scaling_result = measure_scaling()
+        compiled = ', '.join(f'{size} fields {ms:.1f} ms' for size, ms in scaling_result['compile_ms'].items())
+        print(f'compile {compiled}  exponent {scaling_result['exponent']:.2f}', flush=True)
+        problems.extend(check_scaling(scaling_result))
+
+    events = load_keys(options.replay) if options.replay is not None else synthetic_keys(options.keys, seed=options.seed)
+    results: list[dict[str, Any]] = []
+    for size in (int(s) for s in options.sizes.split(',') if s):
+        result = run_benchmark(size, events, allocations=not options.no_alloc)
+        results.append(result)
+        print(format_row(result), flush=True)
+
+    if options.json is not None:
+        options.json.write_text(json.dumps({
+            'created_at': time.time(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'results': results,
+            'import': import_result,
+            'scaling': scaling_result,
+        }, indent=2), encoding='utf-8')
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,83 @@
+import os
+from pathlib import Path
+import re
+import statistics
+import subprocess
+import sys
+
+from typing import Any
+
+
+__all__ = (
+    'import_times',
+    'loaded_modules',
+    'measure_import',
+    'check_import',
+)
+
+
+IMPORT_TIME = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)')
+PACKAGE_ROOT: Path = Path(__file__).resolve().parents[2]
+DEFAULT_STATEMENT: str = 'from argbuilder import ArgParser, arg'
+IMPORT_BUDGET_MS: float = 50.0  # the median measured around 30 ms, the rest is room for slower machines
+DEFERRED_MODULES: tuple[str, ...] = (  # only needed once a builder draws, remembers, caches or traces something
+    'argbuilder.builder',
+    'argbuilder.renderer',
+    'argbuilder.terminal',
+    'argbuilder.utils._colour',
+    'colorsys',
+    'json',
+    'msvcrt',
+    'pickle',
+    'random',
+    'threading',
+)
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess[str]:
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, (str(PACKAGE_ROOT), env.get('PYTHONPATH'))))
+    env.pop('PYTHONDONTWRITEBYTECODE', None)  # an installed package has its bytecode cached, compiling is not part of the cost
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, env=env, check=True)
+
+
+def import_times(statement: str) -> dict[str, int]:
+    """Run `statement` in a fresh interpreter and return the cumulative microseconds of every top level import."""
+    times: dict[str, int] = {}
+    for line in run_python('-X', 'importtime', '-c', statement).stderr.splitlines():
+        match = IMPORT_TIME.match(line)
+        if match is not None and not match[3]:
+            times[match[4]] = int(match[2])
+    return times
+
+
+def loaded_modules(statement: str) -> set[str]:
+    code = f'{statement}\nimport sys\nprint("\\n".join(sys.modules))'
+    return set(run_python('-c', code).stdout.split())
+
+
+def measure_import(statement: str = DEFAULT_STATEMENT, *, repeat: int = 7) -> dict[str, Any]:
+    """The median time `statement` takes in a fresh interpreter, without the imports every interpreter does at startup."""
+    startup = set(import_times('pass'))
+    import_times(statement)
+    totals: list[float] = []
+    for _ in range(repeat):
+        times = import_times(statement)
+        totals.append(sum(us for name, us in times.items() if name not in startup) / 1e3)
+    loaded = loaded_modules(statement)
+    return {
+        'statement': statement,
+        'import_ms': statistics.median(totals),
+        'import_ms_min': min(totals),
+        'deferred_loaded': sorted(loaded.intersection(DEFERRED_MODULES)),
+    }
+
+
+def check_import(result: dict[str, Any], *, budget_ms: float = IMPORT_BUDGET_MS) -> list[str]:
+    """Everything about `result` that is a regression, an empty list if there is nothing."""
+    problems: list[str] = []
+    if result['import_ms'] > budget_ms:
+        problems.append(f'{result['statement']!r} took {result['import_ms']:.1f} ms, the budget is {budget_ms:.1f} ms')
+    for name in result['deferred_loaded']:
+        problems.append(f'{result['statement']!r} imported {name}, which should only be imported when it is used')
+    return problems
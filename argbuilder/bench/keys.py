@@ -0,0 +1,67 @@
+from ..utils import SpecialKey
+
+import json
+from pathlib import Path
+import random
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from ..terminal import InputEvent
+
+
+__all__ = (
+    'synthetic_keys',
+    'load_keys',
+    'dump_keys',
+)
+
+
+NAVIGATION: tuple[SpecialKey, ...] = (
+    SpecialKey.UP,
+    SpecialKey.DOWN,
+    SpecialKey.LEFT,
+    SpecialKey.RIGHT,
+    SpecialKey.CTRL_LEFT,
+    SpecialKey.CTRL_RIGHT,
+)
+EDITING: tuple[SpecialKey, ...] = (
+    SpecialKey.BACKSPACE,
+    SpecialKey.DELETE,
+    SpecialKey.CTRL_BACKSPACE,
+    SpecialKey.CTRL_Z,
+    SpecialKey.CTRL_Y,
+)
+TEXT: str = 'abcdefghijklmnopqrstuvwxyz0123456789 ._-'
+
+
+def synthetic_keys(count: int, *, seed: int = 0) -> list['InputEvent']:
+    """A reproducible stream of keys that types, navigates and edits, but never presses Enter."""
+    rng = random.Random(seed)
+    events: list['InputEvent'] = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.6:
+            events.append(rng.choice(TEXT))
+        elif roll < 0.85:
+            events.append(rng.choice(NAVIGATION))
+        else:
+            events.append(rng.choice(EDITING))
+    return events
+
+
+def load_keys(path: Path) -> list['InputEvent']:
+    """Read a recorded stream, a JSON list of `{"text": ...}` and `{"key": <SpecialKey name>}` objects."""
+    events: list['InputEvent'] = []
+    for item in json.loads(path.read_text(encoding='utf-8')):
+        if 'text' in item:
+            events.append(item['text'])
+        else:
+            events.append(SpecialKey[item['key']])
+    return events
+
+
+def dump_keys(events: list['InputEvent'], path: Path) -> None:
+    path.write_text(
+        json.dumps([{'text': e} if isinstance(e, str) else {'key': e.name} for e in events]),
+        encoding='utf-8',
+    )
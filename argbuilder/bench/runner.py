@@ -0,0 +1,147 @@
+from ..builder import Builder
+from ..remember import RememberMode
+from .schema import make_schema
+
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+from typing import TYPE_CHECKING, Any, NamedTuple
+if TYPE_CHECKING:
+    from ..terminal import InputEvent
+
+
+__all__ = (
+    'NullStream',
+    'create_builder',
+    'run_benchmark',
+)
+
+
+class NullBuffer:
+    written: int
+    def __init__(self) -> None:
+        self.written = 0
+
+    def write(self, data: bytes) -> int:
+        self.written += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+class NullStream:
+    """Stands in for stdout, it only counts the bytes that would have been written."""
+    encoding: str = 'utf-8'
+    errors: str = 'strict'
+    buffer: NullBuffer
+    def __init__(self) -> None:
+        self.buffer = NullBuffer()
+
+    def write(self, text: str) -> int:
+        self.buffer.write(text.encode(self.encoding, self.errors))
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+def create_builder(
+    schema: type[NamedTuple],
+    *,
+    terminal_size: tuple[int, int],
+) -> tuple[Builder[Any], NullStream]:
+    argv = sys.argv
+    sys.argv = argv[:1]  # the benchmark's own arguments are not meant for the schema
+    try:
+        builder = Builder.from_named_tuple_cls(
+            schema,
+            name='bench',
+            description='benchmark',
+            author='bench',
+            remember_mode=(RememberMode.NONE, -1),
+        )
+    finally:
+        sys.argv = argv
+    stream = NullStream()
+    builder.renderer.stream = stream  # type: ignore
+    builder.terminal_size = os.terminal_size(terminal_size)
+    return builder, stream
+
+
+def summarise(values: list[float], *, scale: float = 1.0) -> dict[str, float]:
+    if not values:
+        return {'mean': 0.0, 'p50': 0.0, 'p95': 0.0, 'max': 0.0}
+    ordered = sorted(values)
+    return {
+        'mean': statistics.fmean(ordered) * scale,
+        'p50': ordered[len(ordered) // 2] * scale,
+        'p95': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * scale,
+        'max': ordered[-1] * scale,
+    }
+
+
+def run_benchmark(
+    size: int,
+    events: list['InputEvent'],
+    *,
+    terminal_size: tuple[int, int] = (100, 40),
+    allocations: bool = True,
+) -> dict[str, Any]:
+    """Replay `events` one key at a time against a schema of `size` fields, drawing a frame after every key."""
+    schema = make_schema(size)
+    start = time.perf_counter()
+    builder, stream = create_builder(schema, terminal_size=terminal_size)
+    compile_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    builder.display()
+    first_frame_seconds = time.perf_counter() - start
+    first_frame_bytes = stream.buffer.written
+
+    model: list[float] = []
+    render: list[float] = []
+    written: list[float] = []
+    for event in events:
+        before = stream.buffer.written
+        start = time.perf_counter()
+        builder.handle_events([event])
+        middle = time.perf_counter()
+        builder.display()
+        end = time.perf_counter()
+        model.append(middle - start)
+        render.append(end - middle)
+        written.append(stream.buffer.written - before)
+
+    result: dict[str, Any] = {
+        'fields': size,
+        'keys': len(events),
+        'compile_ms': compile_seconds * 1e3,
+        'first_frame_ms': first_frame_seconds * 1e3,
+        'first_frame_bytes': first_frame_bytes,
+        'model_us': summarise(model, scale=1e6),
+        'render_us': summarise(render, scale=1e6),
+        'bytes_per_key': summarise(written),
+        'bytes_total': sum(written),
+    }
+
+    if allocations:
+        builder, stream = create_builder(schema, terminal_size=terminal_size)
+        builder.display()
+        allocated: list[float] = []
+        tracemalloc.start()
+        try:
+            for event in events:
+                tracemalloc.reset_peak()
+                before, _ = tracemalloc.get_traced_memory()
+                builder.handle_events([event])
+                builder.display()
+                _, peak = tracemalloc.get_traced_memory()
+                allocated.append(peak - before)
+        finally:
+            tracemalloc.stop()
+        result['peak_alloc_bytes_per_key'] = summarise(allocated)
+    return result
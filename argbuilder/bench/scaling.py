@@ -0,0 +1,61 @@
+from ..engine import Engine
+from .schema import make_schema
+
+import math
+import time
+
+from typing import Any
+
+
+__all__ = (
+    'compile_times',
+    'scaling_exponent',
+    'measure_scaling',
+    'check_scaling',
+)
+
+
+DEFAULT_SCALING_SIZES: tuple[int, ...] = (1_000, 2_000, 4_000, 8_000)
+MAX_SCALING_EXPONENT: float = 1.3  # linear is 1.0, the old quadratic compiler measured close to 2.0
+
+
+def compile_times(sizes: tuple[int, ...], *, repeat: int = 3) -> dict[int, float]:
+    """The fastest of `repeat` compiles of a generated schema of every size, in seconds."""
+    times: dict[int, float] = {}
+    for size in sizes:
+        best = math.inf
+        for _ in range(repeat):
+            schema = make_schema(size)
+            start = time.perf_counter()
+            Engine.compile_arguments(schema)
+            best = min(best, time.perf_counter() - start)
+        times[size] = best
+    return times
+
+
+def scaling_exponent(times: dict[int, float]) -> float:
+    """The least squares slope of log(time) against log(size), time grows like size ** exponent."""
+    points = [(math.log(size), math.log(seconds)) for size, seconds in times.items()]
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    return (
+        sum((x - mean_x) * (y - mean_y) for x, y in points)
+        / sum((x - mean_x) ** 2 for x, _ in points)
+    )
+
+
+def measure_scaling(sizes: tuple[int, ...] = DEFAULT_SCALING_SIZES, *, repeat: int = 3) -> dict[str, Any]:
+    if len(sizes) < 2:
+        raise ValueError('At least two sizes are needed to measure scaling')
+    times = compile_times(sizes, repeat=repeat)
+    return {
+        'compile_ms': {str(size): seconds * 1e3 for size, seconds in times.items()},
+        'exponent': scaling_exponent(times),
+    }
+
+
+def check_scaling(result: dict[str, Any], *, max_exponent: float = MAX_SCALING_EXPONENT) -> list[str]:
+    """Everything about `result` that is a regression, an empty list if there is nothing."""
+    if result['exponent'] > max_exponent:
+        return [f'compiling a schema grows like size ** {result['exponent']:.2f}, it should be linear (at most {max_exponent})']
+    return []
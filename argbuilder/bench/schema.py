@@ -0,0 +1,48 @@
+from ..public import arg, Flag
+
+from enum import Enum
+from pathlib import Path
+import types
+
+from typing import Any, NamedTuple, Optional
+
+
+__all__ = (
+    'make_schema',
+)
+
+
+class BenchColour(Enum):
+    RED = 1
+    GREEN = 2
+    BLUE = 3
+
+
+def make_field(index: int) -> tuple[Any, Any]:
+    """The annotation and default of field `index`, the fields cycle through every argument type."""
+    kind = index % 7
+    if kind == 0:
+        return int, arg(f'number {index}', default=index, flags=(Flag.GreaterThanOrEqual(0), Flag.LessThan(10 ** 9)))
+    if kind == 1:
+        return str, arg(f'text {index}', default=f'value {index}', flag=Flag.GreaterThanOrEqual(1))
+    if kind == 2:
+        return Optional[float], arg(f'ratio {index}', default=None)
+    if kind == 3:
+        return bool, arg(f'switch {index}', default=index % 2 == 0)
+    if kind == 4:
+        return BenchColour, arg(f'colour {index}', default=BenchColour.RED)
+    if kind == 5:
+        return str, arg(f'choice {index}', default='a', options=('a', 'b', 'c'))
+    return Path, arg(f'path {index}', default=Path('.'))
+
+
+def make_schema(size: int) -> type[NamedTuple]:
+    """A NamedTuple schema with `size` fields, built the same way a class statement would."""
+    fields = [make_field(i) for i in range(size)]
+
+    def body(namespace: dict[str, Any]) -> None:
+        namespace['__module__'] = __name__
+        namespace['__annotations__'] = {f'field_{i}': annotation for i, (annotation, _) in enumerate(fields)}
+        namespace.update({f'field_{i}': default for i, (_, default) in enumerate(fields)})
+
+    return types.new_class(f'Schema{size}', (NamedTuple,), {}, body)  # type: ignore
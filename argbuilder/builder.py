@@ -1,95 +1,48 @@
-from .arguments import (
-    BooleanArgument,
-    EnumArgument,
-    FloatArgument,
-    IntegerArgument,
-    ParsedArgument,
-    PathArgument,
-    StringArgument,
-)
-from .unparsed import UnparsedArgument
+from .arguments import ParsedArgument
 from .utils import (
-    AllowedTypes,
-    SPECIAL_KEYS_NOTHING_BEFORE,
-    SpecialKey,
+    Styled,
     colour,
     random_rgb_neon_colour,
 )
-from .remember import RememberMode, maybe_remember_before, maybe_remember_after, clear_memory
-from .command import CommandManager
+from .remember import RememberMode
+from .engine import Engine
+from .flags import STAT_CACHE
+from .renderer import Renderer
+from .tracing import counter, span
+from .terminal import InputBackend, InputEvent, get_input_backend
 
-from enum import Enum
 from functools import cached_property
-import msvcrt
 import os
-from pathlib import Path
-import re
-import sys
 
 from typing import (
     Any,
     NamedTuple,
     Optional,
     TypeVar,
-    Generic,
 )
 
 
 __all__ = (
     'Builder',
-    'increment_arg_parsers_defined',
 )
 
 
-# https://stackoverflow.com/a/14693789/22837110
-ANSI_ESCAPE = re.compile(r'''
-    \x1B  # ESC
-    (?:   # 7-bit C1 Fe (except CSI)
-        [@-Z\\-_]
-    |     # or [ for CSI, followed by a control sequence
-        \[
-        [0-?]*  # Parameter bytes
-        [ -/]*  # Intermediate bytes
-        [@-~]   # Final byte
-    )
-''', re.VERBOSE)
-
-
 NT = TypeVar('NT', bound=NamedTuple)
-
-
-def should_clear_memory() -> bool:
-    if len(sys.argv) > 1 and sys.argv[1] == '!clear':
-        sys.argv.pop(1)
-        return True
-    return False
-
-
-ARG_PARSERS_DEFINED: int = 0
-
-def increment_arg_parsers_defined() -> None:
-    global ARG_PARSERS_DEFINED
-    ARG_PARSERS_DEFINED += 1
-
-def should_use_argv() -> bool:
-    return ARG_PARSERS_DEFINED <= 1 and len(sys.argv) > 1
-
-
-class Builder(Generic[NT]):
-    named_tuple_cls: type[NT]
-    name: str
-    description: str
-    author: str
-    arguments: list[ParsedArgument[Any]]
-    remember_data: tuple[RememberMode, int]  # (mode, duration)  # duration in seconds, -1 for infinite
-    started: bool
-    finished: bool
-    index: int
-    inner_index: int
-    higher_inner_index: int
-    last_text_line_count: int
-    command_manager: CommandManager
-    previous_input: Optional[str | SpecialKey]
+LEFT_CAP: str = '\ue0b6'  # rounded powerline caps around the name, drawn by Nerd Fonts
+RIGHT_CAP: str = '\ue0b4'
+
+
+class Builder(Engine[NT]):
+    """The interactive view on top of an `Engine`, it draws frames and reads keys from the terminal."""
+    MIN_VALUE_WIDTH: int = 8  # narrower terminals wrap the value instead
+    FALLBACK_TERMINAL_SIZE: os.terminal_size = os.terminal_size((80, 24))  # when the size is unknown, e.g. output is piped
+    FRAME_SPACING_ROWS: int = 3  # the blank lines around the frame and the row the cursor rests on
+    scroll: int  # index of the first argument that is shown
+    visible: range  # the arguments that were shown in the last frame
+    renderer: Renderer
+    line_cache: dict[ParsedArgument[Any], tuple[tuple[Any, ...], Styled]]  # {argument: (state, line)}
+    input_backend: Optional[InputBackend]
+    terminal_size: Optional[os.terminal_size]  # None until it is needed and after a resize
     def __init__(
         self,
         *,
@@ -100,117 +53,42 @@ class Builder(Generic[NT]):
         arguments: list[ParsedArgument],
         remember_data: tuple[RememberMode, int],
     ) -> None:
-        self.named_tuple_cls = named_tuple_cls
-        self.name = name
-        self.description = description
-        self.author = author
-        self.arguments = arguments
-        self.remember_data = remember_data
-        self.started = False
-        self.finished = False
-        self.index = 0
-        self.higher_inner_index = 0
-        self.last_text_line_count = -1
-        self.command_manager = CommandManager()
-        self.previous_input = None
-        use_argv = should_use_argv()
-        if should_clear_memory():
-            clear_memory(self)
-        elif not use_argv:
-            maybe_remember_before(self)
-        try_finish = False
-        if use_argv:
-            try_finish = self.use_argv()
-        self.inner_index = self.highest_inner_index_from_current_selected()
-        self.higher_inner_index = self.inner_index
-        if try_finish and self.all_values_are_valid():
-            self.maybe_finish(is_beginning=True)
-
-    @staticmethod
-    def from_named_tuple_cls(
-        named_tuple_cls: type[NT],
-        *,
-        name: str,
-        description: str,
-        author: str,
-        remember_mode: tuple[RememberMode, int],
-    ) -> 'Builder[NT]':
-        for key, value in vars(named_tuple_cls).items():
-            if isinstance(value, UnparsedArgument):
-                raise ValueError(f'"{key}" must have a type annotation. Example:\n\t{key}: int = arg(...)')
-
-        arguments: list[ParsedArgument] = []
-
-        for index, field_name in enumerate(named_tuple_cls._fields):
-            try:
-                unparsed: Any = named_tuple_cls._field_defaults.get(field_name, None)
-                if unparsed is None:
-                    unparsed = UnparsedArgument()
-                elif not isinstance(unparsed, UnparsedArgument):
-                    unparsed = UnparsedArgument(default=unparsed)
-                unparsed.check_everything(
-                    named_tuple_cls=named_tuple_cls,
-                    index=index,
-                    parsed_arguments=arguments,
-                )
-
-                parsed_argument_cls: type[ParsedArgument]
-                if unparsed._type is bool:
-                    parsed_argument_cls = BooleanArgument
-                elif unparsed._type is str:
-                    parsed_argument_cls = StringArgument
-                elif unparsed._type is int:
-                    parsed_argument_cls = IntegerArgument
-                elif unparsed._type is float:
-                    parsed_argument_cls = FloatArgument
-                elif issubclass(unparsed._type, Enum):  # type: ignore
-                    parsed_argument_cls = EnumArgument
-                elif unparsed._type is Path:
-                    parsed_argument_cls = PathArgument
-                else:
-                    raise ValueError(f'Unsupported type {unparsed._type}')
-
-                unparsed.check_everything_with_parsed_cls(
-                    named_tuple_cls=named_tuple_cls,
-                    index=index,
-                    parsed_arguments=arguments,
-                    parsed_cls=parsed_argument_cls,  # type: ignore
-                )
-                if (
-                    unparsed.name is None
-                    or unparsed.description is None
-                    or unparsed.allow_none is None
-                ):
-                    raise ValueError('Something went wrong on our end.. Please report this.')
-
-                argument: ParsedArgument[AllowedTypes] = parsed_argument_cls(  # type: ignore
-                    name=unparsed.name,
-                    description=unparsed.description,
-                    field_name=field_name,
-                    has_default=unparsed.has_default,
-                    default=unparsed.default,  # type: ignore
-                    allow_none=unparsed.allow_none,
-                    options=unparsed.options,  # type: ignore
-                    flags=unparsed.flags,
-                    remember=unparsed.remember,
-                    prefix=unparsed.prefix,
-                    suffix=unparsed.suffix,
-                )
-                arguments.append(argument)
-            except ValueError as exc:
-                raise ValueError(f'Error while parsing "{field_name}"') from exc
-
-        return Builder(
+        self.scroll = 0
+        self.visible = range(0)
+        self.renderer = Renderer()
+        self.line_cache = {}
+        self.input_backend = None
+        self.terminal_size = None
+        super().__init__(  # may already finish and draw the last frame
             named_tuple_cls=named_tuple_cls,
             name=name,
             description=description,
             author=author,
             arguments=arguments,
-            remember_data=remember_mode,
+            remember_data=remember_data,
         )
 
+    def get_terminal_size(self) -> os.terminal_size:
+        """The size of the terminal, only asked for again after a resize."""
+        if self.terminal_size is None:
+            try:
+                size = os.get_terminal_size()
+            except OSError:
+                size = self.FALLBACK_TERMINAL_SIZE
+            if size.columns <= 0 or size.lines <= 0:
+                size = self.FALLBACK_TERMINAL_SIZE
+            self.terminal_size = size
+        return self.terminal_size
+
     def get_terminal_width(self) -> int:
-        return os.get_terminal_size()[0]
+        return self.get_terminal_size().columns
+
+    def get_terminal_height(self) -> int:
+        return self.get_terminal_size().lines
+
+    def on_resize(self) -> None:
+        self.terminal_size = None
+        self.line_cache.clear()  # every row was laid out for the old width
 
     @cached_property
     def biggest_argument_length(self) -> int:
@@ -220,12 +98,14 @@ class Builder(Generic[NT]):
     def biggest_argument_type_length(self) -> int:
         return max(len(a.type_string) for a in self.arguments)
 
-    def title(self) -> str:
-        author: str = colour(self.author, rgb=random_rgb_neon_colour())
-        name: str = colour(f'{colour(f' {self.name} ', hex='#f7f7f9', background_hex='#0095e9', bold=True)}', hex='#0095e9', bold=True)
-        description: str = colour(self.description, hex='#f7f7f9')
-        return '  '.join(
-            (author, name, description),
+    @cached_property
+    def title(self) -> Styled:
+        author: Styled = colour(self.author, rgb=random_rgb_neon_colour())
+        pill: Styled = colour(f' {self.name} ', hex='#f7f7f9', background_hex='#0095e9', bold=True)
+        name: Styled = colour(LEFT_CAP + pill + RIGHT_CAP, hex='#0095e9', bold=True)
+        description: Styled = colour(self.description, hex='#f7f7f9')
+        return Styled.concat(
+            (author, '  ', name, '  ', description),
         )
 
     def create_line(
@@ -234,211 +114,224 @@ class Builder(Generic[NT]):
         *,
         index: int,
         width: int,
-    ) -> str:
+        is_valid: bool,
+    ) -> Styled:
         selected: bool = index == self.index
-        is_valid: bool = argument.value_is_valid(builder=self)
-        displayed: str = argument.display(builder=self)
+        key: tuple[Any, ...] = (
+            argument.buffer.revision,
+            argument.is_none,
+            selected,
+            self.inner_index if selected else -1,
+            width,
+            is_valid,
+        )
+        cached = self.line_cache.get(argument, None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        line: Styled = self.build_line(argument, selected=selected, is_valid=is_valid, width=width)
+        self.line_cache[argument] = (key, line)
+        return line
+
+    def build_line(
+        self,
+        argument: ParsedArgument,
+        *,
+        selected: bool,
+        is_valid: bool,
+        width: int,
+    ) -> Styled:
+        prefix: Styled = colour(('\u276f' if selected else ' '), hex='#0095e9')
+        type_string: Styled = colour(argument.type_string, hex='#545454') + ' ' * (self.biggest_argument_type_length - len(argument.type_string))
+        name: Styled = argument.formatted_name(forced_colour='#0095e9' if selected else None) + ' ' * (self.biggest_argument_length - len(argument.name))
+        ok: Styled = colour('[' + colour('OK', hex=('#00ff00' if is_valid else '#f7f7f9'), background_hex=(None if is_valid else '#ff0000')) + ']', hex='#f7f7f9')
+        head: Styled = Styled.concat((' ', prefix, ' ', type_string, ' ', name, ' ', ok, ' '))
+
+        affix_length: int = 0
+        if not argument.is_none:
+            affix_length = len(argument.prefix or '') + len(argument.suffix or '')
+        available: int = max(
+            self.MIN_VALUE_WIDTH,
+            width - head.width - affix_length - 1,
+        )
+        total: int = argument.display_length(builder=self)
+        left, right = argument.highlighted_range(builder=self) if selected else (0, 0)
+        right = max(right, left + 1) if selected else right
+        start, end = self.viewport(total, left, right, available=available)
+
+        window: str = argument.display_window(start, end, builder=self)
+        displayed: Styled = Styled.of(window)
         if selected:
-            left, right = argument.highlighted_range(builder=self)
-            right = max(right, left + 1)
-            displayed += ' ' * (right - len(displayed))
-            displayed = displayed[:left] + colour(displayed[left:right], hex='#000000', background_hex='#ffffff') + displayed[right:]
-
-        prefix: str = colour(('\u276f' if selected else ' '), hex='#0095e9')
-        type_string: str = colour(argument.type_string, hex='#545454') + ' ' * (self.biggest_argument_type_length - len(argument.type_string))
-        name: str = argument.formatted_name(forced_colour='#0095e9' if selected else None) + ' ' * (self.biggest_argument_length - len(argument.name))
-        ok: str = colour(f'[{colour('OK', hex=('#00ff00' if is_valid else '#f7f7f9'), background_hex=(None if is_valid else '#ff0000'))}]', hex='#f7f7f9')
+            left -= start
+            right -= start
+            window += ' ' * (right - len(window))
+            displayed = Styled.concat((window[:left], colour(window[left:right], hex='#000000', background_hex='#ffffff'), window[right:]))
         displayed = colour(displayed, hex='#f7f7f9')
+        if start > 0:
+            displayed = colour('\u2026', hex='#6a6a6a') + displayed
+        if end < total:
+            displayed += colour('\u2026', hex='#6a6a6a')
         if not argument.is_none:
             if argument.prefix is not None:
                 displayed = colour(argument.prefix, hex='#6a6a6a') + displayed
             if argument.suffix is not None:
                 displayed += colour(argument.suffix, hex='#6a6a6a')
 
-        line: str = f' {prefix} {type_string} {name} {ok} {displayed}'
-        escaped: str = self.ansi_escape(line)
-        description_diff: int = width - ((len(escaped) - 1) % width) - 1
+        line: Styled = head + displayed
+        description_diff: int = width - ((line.width - 1) % width) - 1
         if description_diff > 0:
-            description_suffix: str = colour(
+            description_suffix: Styled = colour(
                 ' ' * max(0, description_diff - len(argument.description)) + argument.description[-max(0, description_diff):],
                 hex='#545454',
             )
             line += description_suffix
         return line
 
-    def selected_argument(self) -> ParsedArgument:
-        return self.arguments[self.index]
-
-    def ansi_escape(
+    def viewport(
         self,
-        text: str,
-    ) -> str:
-        return ANSI_ESCAPE.sub('', text)
+        total: int,
+        left: int,
+        right: int,
+        *,
+        available: int,
+    ) -> tuple[int, int]:
+        """The part of a value that is shown when only `available` columns are free."""
+        end: int = max(total, right)
+        if end <= available:
+            return (0, total)
+        length: int = max(1, available - 2)  # room for an elision marker on both sides
+        step: int = max(1, length // 2)
+        start: int = (left // step) * step
+        if right > start + length:
+            start = min(left, right - length)
+        start = max(0, min(start, end - length))
+        return (start, min(total, start + length))
+
+    @staticmethod
+    def rows_of(line: Styled, width: int) -> int:
+        """How many terminal rows a line takes up once it wraps."""
+        return max(1, (line.width + width - 1) // width)
+
+    def row_budget(self, width: int, height: int) -> int:
+        """How many rows are left for the arguments once the title and the position line are drawn."""
+        count: int = len(self.arguments)
+        widest_position: Styled = self.position_line(range(1, count - 1), index=count - 1)
+        return max(1, height - self.FRAME_SPACING_ROWS - self.rows_of(self.title, width) - self.rows_of(widest_position, width))
+
+    def validate(self, budget: int) -> dict[int, bool]:
+        """Whether every argument within `budget` rows of the selected one is valid."""
+        anchor: int = max(self.index, 0)
+        candidates: range = range(max(0, anchor - budget + 1), min(len(self.arguments), anchor + budget))
+        return {i: self.arguments[i].value_is_valid(builder=self) for i in candidates}
+
+    def layout(self, width: int, budget: int, validity: dict[int, bool]) -> tuple[range, list[Styled]]:
+        """The arguments that fit in `budget` rendered rows and their lines, scrolled to show the selected one."""
+        count: int = len(self.arguments)
+        lines: dict[int, Styled] = {}
+
+        def rows(index: int) -> int:
+            if index not in lines:
+                lines[index] = self.create_line(self.arguments[index], index=index, width=width, is_valid=validity[index])
+            return self.rows_of(lines[index], width)
+
+        used: int = 0
+        stop: int = 0
+        if self.index < 0:  # finished, nothing is selected and the list starts at the top
+            self.scroll = 0
+        else:
+            self.scroll = max(min(self.scroll, self.index), self.index - budget + 1)  # every argument takes at least one row
+            used = sum(rows(i) for i in range(self.scroll, self.index + 1))
+            while used > budget and self.scroll < self.index:
+                used -= rows(self.scroll)
+                self.scroll += 1
+            stop = self.index + 1
+        while stop < count and used < budget and used + rows(stop) <= budget:
+            used += rows(stop)
+            stop += 1
+        while self.scroll > 0 and used < budget and used + rows(self.scroll - 1) <= budget:
+            self.scroll -= 1
+            used += rows(self.scroll)
+        visible: range = range(self.scroll, stop)
+        return visible, [lines[i] for i in visible]
+
+    def position_line(self, visible: range, *, index: Optional[int] = None) -> Styled:
+        index = self.index if index is None else index
+        if len(visible) == len(self.arguments) or index < 0:
+            return Styled()
+        parts: list[str] = [f'{index + 1}/{len(self.arguments)}']
+        if visible.start > 0:
+            parts.append(f'\u2191 {visible.start} more')
+        if visible.stop < len(self.arguments):
+            parts.append(f'\u2193 {len(self.arguments) - visible.stop} more')
+        return colour('   ' + '   '.join(parts), hex='#545454')
 
     def display(self) -> None:
-        width: int = self.get_terminal_width()
-        text: str = '\n' + '\n'.join((
-            self.title(),
-            *(
-                self.create_line(argument, index=i, width=width)
-                for i, argument in enumerate(self.arguments)
+        width, height = self.get_terminal_size()
+        budget: int = self.row_budget(width, height)
+        with span('validation', category='frame'):
+            validity: dict[int, bool] = self.validate(budget)
+        with span('layout', category='frame'):
+            visible, rows = self.layout(width, budget, validity)
+        self.visible = visible
+        with span('render', category='frame'):
+            lines: list[Styled] = [
+                Styled(),
+                self.title,
+                *rows,
+                self.position_line(visible),
+                Styled(),
+            ]
+            self.renderer.render(
+                [(str(line), line.width) for line in lines],
+                width=width,
             )
-        )) + '\n\n'
-
-        text_line_count: int = 0
-        new_text: str = ''
-        for i, line in enumerate(text.split('\n')):
-            escaped: str = self.ansi_escape(line)
-            text_line_count += (max(0, (len(escaped) - 1) // width)) + 1
-            if line:
-                line += ' ' * (width - ((len(escaped) - 1) % width) - 1)
-            else:
-                line = ' ' * width
-            new_text += ('\n' * (i != 0)) + line
-        text_line_count -= 1
-
-        line_count_diff: int = self.last_text_line_count - text_line_count
-        printing: str = ('\033[F' * self.last_text_line_count) + new_text
-        self.last_text_line_count = text_line_count
-        if line_count_diff > 0:
-            printing += ' ' * (width * line_count_diff) + ('\033[F' * line_count_diff)
-        print(
-            printing,
-            end='',
-            flush=True,
+        counter('frame', rows=len(visible), bytes=self.renderer.last_written)
+
+    def fetch_events(self, timeout: Optional[float] = None) -> list[InputEvent]:
+        if self.input_backend is None:
+            self.input_backend = get_input_backend()
+        events: list[InputEvent] = self.input_backend.read_events(timeout)
+        if self.input_backend.take_resized():
+            self.on_resize()
+        return events
+
+    def frame_state(self) -> tuple[Any, ...]:
+        """Everything that can change what the next frame shows, a frame is only drawn when this changes."""
+        selected: Optional[ParsedArgument] = self.selected_argument() if self.index >= 0 else None
+        return (
+            self.index,
+            self.inner_index,
+            self.terminal_size,
+            selected.buffer.revision if selected is not None else -1,
+            selected.is_none if selected is not None else False,
+            len(self.command_manager.undo_stack),
+            len(self.command_manager.redo_stack),
+            tuple(a.value_is_valid(builder=self) for a in self.volatile_visible_arguments()),
         )
 
-    def handle_byte(
-        self,
-        byte: bytes,
-    ) -> None:
-        try:
-            self.previous_input = byte.decode('cp437')
-        except UnicodeDecodeError:
-            return
-        self.selected_argument().handle_char(self.previous_input, builder=self)
-
-    def highest_inner_index_from_current_selected(self) -> int:
-        return len(self.arguments[self.index].display(builder=self))
-
-    def handle_special_key(self, special_key: SpecialKey) -> None:
-        self.previous_input = special_key
-        if special_key is SpecialKey.UP:
-            self.index = (self.index - 1) % len(self.arguments)
-            self.inner_index = self.higher_inner_index
-        elif special_key is SpecialKey.DOWN:
-            self.index = (self.index + 1) % len(self.arguments)
-            self.inner_index = self.higher_inner_index
-        elif special_key is SpecialKey.CTRL_UP:
-            self.index = 0
-            self.inner_index = self.higher_inner_index
-        elif special_key is SpecialKey.CTRL_DOWN:
-            self.index = len(self.arguments) - 1
-            self.inner_index = self.higher_inner_index
-        elif special_key is SpecialKey.ENTER:
-            self.maybe_finish()
-        elif special_key is SpecialKey.CTRL_Z:
-            self.command_manager.undo(builder=self)
-        elif special_key is SpecialKey.CTRL_Y:
-            self.command_manager.redo(builder=self)
-        else:
-            self.selected_argument().handle_special_key(special_key, builder=self)
-        self.inner_index = min(self.inner_index, self.highest_inner_index_from_current_selected())
+    def volatile_visible_arguments(self) -> list[ParsedArgument]:
+        """The arguments on screen whose validity can change without a key press, e.g. when a file is created."""
+        return [a for a in self.arguments[self.visible.start:self.visible.stop] if a.flag_plan.is_volatile]
 
-    def fetch_input_bytes(self) -> bytes:
-        return msvcrt.getch()
+    def recheck_timeout(self) -> Optional[float]:
+        """How long to wait for a key before the volatile checks on screen are run again, None to wait for a key."""
+        if not self.volatile_visible_arguments():
+            return None
+        return STAT_CACHE.ttl  # a stat result is reused for this long, checking sooner can not change anything
 
     def iterate(self) -> None:
         self.display()
-        byte = self.fetch_input_bytes()
-        if byte == b'\x03':
-            raise KeyboardInterrupt
-
-        if byte == b'\xe0':
-            byte = msvcrt.getch()
-            self.handle_special_key(SpecialKey(byte))
-        elif byte in SPECIAL_KEYS_NOTHING_BEFORE:
-            self.handle_special_key(SpecialKey(byte))
-        else:
-            self.handle_byte(byte)
-
-    def set_or_throw_if_exists(self, mapping: dict[Any, Any], key: Any, value: Any) -> None:
-        if key in mapping:
-            raise ValueError(f'Key "{key}" used more than once')
-        mapping[key] = value
-
-    def fetch_argv_values(self) -> dict[ParsedArgument[Any], str]:
-        keyword_values: dict[str, Optional[str]] = {}
-        positional_values: list[str] = []
-        latest_keyword: Optional[str] = None
-        for arg in sys.argv[1:]:
-            if arg.startswith('--'):
-                if latest_keyword is not None:
-                    self.set_or_throw_if_exists(keyword_values, latest_keyword, None)
-                latest_keyword = arg[2:].replace('-', '_')
-                continue
-            if latest_keyword is not None:
-                self.set_or_throw_if_exists(keyword_values, latest_keyword, arg)
-                latest_keyword = None
-                continue
-            latest_keyword = None
-            positional_values.append(arg)
-        if latest_keyword is not None:
-            self.set_or_throw_if_exists(keyword_values, latest_keyword, None)
-
-        mapping: dict[ParsedArgument[Any], str] = {}
-        for key, value in keyword_values.items():
-            value = value if value is not None else '1'
-            argument = next((a for a in self.arguments if a.name == key), None)
-            if argument is None:
-                raise ValueError(f'Invalid argument "{key}"')
-            mapping[argument] = value
-
-        for value in positional_values:
-            argument = next((a for a in self.arguments if a not in mapping), None)
-            if argument is None:
-                raise ValueError('Too many positional arguments')
-            mapping[argument] = value
-
-        return mapping
-
-    def use_argv(self) -> bool:
-        failed: bool = False
-        argv_values: dict[ParsedArgument[Any], str] = self.fetch_argv_values()
-        for argument, value in argv_values.items():
-            try:
-                if argument.allow_none and value.lower() == 'none':
-                    argument.raw_set_string_value_and_is_none(
-                        '', True, builder=self,
-                    )
-                else:
-                    argument.raw_set_string_value_and_is_none(
-                        value, False, builder=self,
-                    )
-            except ValueError as exc:
-                print(colour(f'Error while using argv for "{argument.name}": {exc}', hex='#ff0000'))
-                failed = True
-                continue
-        return not failed and bool(argv_values)
-
-    def all_values_are_valid(self) -> bool:
-        return all(a.value_is_valid(builder=self) for a in self.arguments)
-
-    def create_named_tuple(self) -> NT:
-        if not self.all_values_are_valid():
-            raise ValueError('Not all values are valid')
-        return self.named_tuple_cls(
-            **{a.field_name: a.get_value(builder=self) for a in self.arguments},  # type: ignore
-        )
+        self.handle_events(self.fetch_events())
+
+    def close(self) -> None:
+        """Give the terminal back, call this once the builder is done."""
+        if self.input_backend is not None:
+            self.input_backend.stop()
 
-    def maybe_finish(self, *, is_beginning: bool = False) -> None:
-        if self.all_values_are_valid():
-            self.on_finish(is_beginning=is_beginning)
+    def report_error(self, message: str) -> None:
+        print(colour(message, hex='#ff0000'))
 
     def on_finish(self, *, is_beginning: bool) -> None:
-        self.finished = True
-        self.index = -1
-        maybe_remember_after(self)
+        super().on_finish(is_beginning=is_beginning)
         if is_beginning:
-            print(f'\n{colour(f'[{colour('!', hex='#00ff00')}] Met requirements to parse arguments automatically', hex='#f7f7f9')}')
+            print('\n' + str(colour('[' + colour('!', hex='#00ff00') + '] Met requirements to parse arguments automatically', hex='#f7f7f9')))
         self.display()
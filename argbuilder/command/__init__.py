@@ -1,3 +1,4 @@
 from .set_command import SetCommand as SetCommand
+from .edit_command import EditCommand as EditCommand
 from .compound_command import CompoundCommand as CompoundCommand
 from .manager import CommandManager as CommandManager
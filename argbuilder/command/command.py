@@ -1,17 +1,22 @@
 from abc import ABC, abstractmethod
 
+import sys
 import time
 
 from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
-    from ..builder import Builder
+    from ..engine import Engine
+
+
+MERGE_WINDOW: float = 0.3  # seconds between two commands for them to become one undo step
+COMMAND_OVERHEAD: int = sys.getsizeof(object()) * 8  # rough size of a command without its text
 
 
 class Command(ABC):
     created_at: float
     executed_at: float
     def __init__(self) -> None:
-        self.created_at = 0.0
+        self.created_at = time.monotonic()  # only compared with other commands, so a wall clock jump can not break merging
         self.executed_at = 0.0
 
     @property
@@ -19,9 +24,17 @@ class Command(ABC):
         return self.executed_at > 0.0
 
     @abstractmethod
-    def execute(self, *, builder: 'Builder[Any]') -> None:
+    def execute(self, *, builder: 'Engine[Any]') -> None:
         self.executed_at = time.time()
 
     @abstractmethod
-    def undo(self, *, builder: 'Builder[Any]') -> None:
+    def undo(self, *, builder: 'Engine[Any]') -> None:
         self.executed_at = 0.0
+
+    def size(self) -> int:
+        """Rough number of bytes this command keeps alive in the undo history."""
+        return COMMAND_OVERHEAD
+
+    def merge(self, other: 'Command') -> bool:
+        """Try to absorb the already executed `other`, which came right after this command. Return True on success."""
+        return False
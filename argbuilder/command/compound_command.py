@@ -4,7 +4,7 @@ from .set_command import SetCommand
 
 from typing import Optional, final, TYPE_CHECKING, Any
 if TYPE_CHECKING:
-    from ..builder import Builder
+    from ..engine import Engine
 
 
 @final
@@ -17,20 +17,23 @@ class CompoundCommand(Command):
         super().__init__()
         self.commands = commands if commands is not None else []
 
-    def execute(self, *, builder: 'Builder[Any]') -> None:
+    def execute(self, *, builder: 'Engine[Any]') -> None:
         assert not self.executed
         for command in self.commands:
             if not command.executed:
                 command.execute(builder=builder)
         return super().execute(builder=builder)
 
-    def undo(self, *, builder: 'Builder[Any]') -> None:
+    def undo(self, *, builder: 'Engine[Any]') -> None:
         assert self.executed
         for command in reversed(self.commands):
             if command.executed:
                 command.undo(builder=builder)
         return super().undo(builder=builder)
 
+    def size(self) -> int:
+        return super().size() + sum(command.size() for command in self.commands)
+
     @staticmethod
     def maybe_create_merged(this: Command, other: Command) -> Optional['CompoundCommand']:
         if isinstance(this, CompoundCommand):
@@ -45,4 +48,6 @@ class CompoundCommand(Command):
         if isinstance(this, CompoundCommand):
             this.commands.append(other)
             return this
-        return CompoundCommand([this, other])
+        merged = CompoundCommand([this, other])
+        merged.executed_at = other.executed_at  # both parts already ran
+        return merged
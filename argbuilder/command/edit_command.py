@@ -0,0 +1,90 @@
+from .command import Command, MERGE_WINDOW
+
+import sys
+
+from typing import Any, final, TYPE_CHECKING
+if TYPE_CHECKING:
+    from ..arguments import ParsedArgument
+    from ..engine import Engine
+
+
+@final
+class EditCommand(Command):
+    """Replaces `removed` at `position` with `inserted`, only the changed text is stored."""
+    argument: 'ParsedArgument[Any]'
+    position: int
+    removed: str
+    inserted: str
+    after_index: int
+    after_inner_index: int
+    before_is_none: bool
+    before_index: int
+    before_inner_index: int
+    MAX_MERGED_LENGTH: int = 256
+    def __init__(
+        self,
+        argument: 'ParsedArgument[Any]',
+        position: int,
+        removed: str,
+        inserted: str,
+        after_index: int,
+        after_inner_index: int,
+    ) -> None:
+        super().__init__()
+        self.argument = argument
+        self.position = position
+        self.removed = removed
+        self.inserted = inserted
+        self.after_index = after_index
+        self.after_inner_index = after_inner_index
+
+    def execute(self, *, builder: 'Engine[Any]') -> None:
+        self.before_is_none = self.argument.is_none
+        self.before_index = builder.index
+        self.before_inner_index = builder.inner_index
+        self.argument.buffer.delete(self.position, len(self.removed))
+        self.argument.buffer.insert(self.position, self.inserted)
+        self.argument.is_none = False
+        self.argument.invalidate()
+        builder.index = self.after_index
+        builder.inner_index = self.after_inner_index
+        builder.higher_inner_index = self.after_inner_index
+        super().execute(builder=builder)
+
+    def undo(self, *, builder: 'Engine[Any]') -> None:
+        self.argument.buffer.delete(self.position, len(self.inserted))
+        self.argument.buffer.insert(self.position, self.removed)
+        self.argument.is_none = self.before_is_none
+        self.argument.invalidate()
+        builder.index = self.before_index
+        builder.inner_index = self.before_inner_index
+        builder.higher_inner_index = self.before_inner_index
+        super().undo(builder=builder)
+
+    def size(self) -> int:
+        return super().size() + sys.getsizeof(self.removed) + sys.getsizeof(self.inserted)
+
+    def merge(self, other: Command) -> bool:
+        if (
+            not isinstance(other, EditCommand)
+            or other.argument is not self.argument
+            or other.before_index != self.after_index
+            or other.before_is_none
+            or not 0.0 <= other.created_at - self.created_at <= MERGE_WINDOW
+            or len(self.removed) + len(self.inserted) + len(other.removed) + len(other.inserted) > self.MAX_MERGED_LENGTH
+        ):
+            return False
+        if self.removed == '' and other.removed == '' and other.position == self.position + len(self.inserted):
+            if self.inserted[-1:].isspace() and not other.inserted[:1].isspace():
+                return False  # a new word starts
+            self.inserted += other.inserted
+        elif self.inserted == '' and other.inserted == '' and other.position + len(other.removed) == self.position:
+            self.position = other.position  # backspace
+            self.removed = other.removed + self.removed
+        elif self.inserted == '' and other.inserted == '' and other.position == self.position:
+            self.removed += other.removed  # delete
+        else:
+            return False
+        self.created_at = other.created_at
+        self.after_inner_index = other.after_inner_index
+        return True
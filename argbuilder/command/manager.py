@@ -1,48 +1,74 @@
 from .command import Command
 from .compound_command import CompoundCommand
 
+from collections import deque
+
 from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
-    from ..builder import Builder
+    from ..engine import Engine
 
 
 class CommandManager:
-    undo_stack: list[Command]
+    """Keeps the undo and redo history, at most `max_bytes` of it."""
+    undo_stack: deque[Command]
     redo_stack: list[Command]
-    def __init__(self) -> None:
-        self.undo_stack = []
+    max_bytes: int
+    used_bytes: int
+    DEFAULT_MAX_BYTES: int = 16 * 1024 * 1024
+    def __init__(
+        self,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.undo_stack = deque()
         self.redo_stack = []
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
 
-    def do(self, command: Command, *, builder: 'Builder[Any]') -> None:
+    def do(self, command: Command, *, builder: 'Engine[Any]') -> None:
         command.execute(builder=builder)
         self.undo_stack.append(command)
+        self.used_bytes += command.size()
+        for redone in self.redo_stack:
+            self.used_bytes -= redone.size()
         self.redo_stack.clear()
+        self.check_merge(builder=builder)
+        self.evict()
 
     def peek(self) -> Command:
         return self.undo_stack[-1]
 
-    def undo(self, *, builder: 'Builder[Any]') -> None:
+    def undo(self, *, builder: 'Engine[Any]') -> None:
         if len(self.undo_stack) == 0:
             return
         command = self.undo_stack.pop()
         command.undo(builder=builder)
         self.redo_stack.append(command)
 
-    def redo(self, *, builder: 'Builder[Any]') -> None:
+    def redo(self, *, builder: 'Engine[Any]') -> None:
         if len(self.redo_stack) == 0:
             return
         command = self.redo_stack.pop()
         command.execute(builder=builder)
         self.undo_stack.append(command)
 
-    def check_merge(self, *, builder: 'Builder[Any]') -> None:
+    def check_merge(self, *, builder: 'Engine[Any]') -> None:
         if len(self.undo_stack) < 2:
             return
-        this = self.undo_stack[-1]
-        other = self.undo_stack[-2]
+        this = self.undo_stack[-2]
+        other = self.undo_stack[-1]
+        before = this.size() + other.size()
+        if this.merge(other):
+            self.undo_stack.pop()
+            self.used_bytes += this.size() - before
+            return
         merged = CompoundCommand.maybe_create_merged(this, other)
         if merged is not None:
-            merged.execute(builder=builder)
             self.undo_stack.pop()
             self.undo_stack.pop()
-            self.do(merged, builder=builder)
+            self.undo_stack.append(merged)
+            self.used_bytes += merged.size() - before
+
+    def evict(self) -> None:
+        while self.used_bytes > self.max_bytes and len(self.undo_stack) > 1:
+            self.used_bytes -= self.undo_stack.popleft().size()
@@ -1,9 +1,11 @@
-from .command import Command
+from .command import Command, MERGE_WINDOW
+
+import sys
 
 from typing import Any, final, TYPE_CHECKING
 if TYPE_CHECKING:
     from ..arguments import ParsedArgument
-    from ..builder import Builder
+    from ..engine import Engine
 
 
 @final
@@ -31,31 +33,37 @@ class SetCommand(Command):
         self.after_is_none = after_is_none
         self.after_index = after_index
         self.after_inner_index = after_inner_index
+        self.before_string_value = ''
 
-    def execute(self, *, builder: 'Builder[Any]') -> None:
+    def execute(self, *, builder: 'Engine[Any]') -> None:
         self.before_string_value = self.argument.string_value
         self.before_is_none = self.argument.is_none
         self.before_index = builder.index
         self.before_inner_index = builder.inner_index
         self.argument.string_value = self.after_string_value
         self.argument.is_none = self.after_is_none
+        self.argument.invalidate()
         builder.index = self.after_index
         builder.inner_index = self.after_inner_index
         builder.higher_inner_index = self.after_inner_index
         super().execute(builder=builder)
 
-    def undo(self, *, builder: 'Builder[Any]') -> None:
+    def undo(self, *, builder: 'Engine[Any]') -> None:
         self.argument.string_value = self.before_string_value
         self.argument.is_none = self.before_is_none
+        self.argument.invalidate()
         builder.index = self.before_index
         builder.inner_index = self.before_inner_index
         builder.higher_inner_index = self.before_inner_index
         super().undo(builder=builder)
 
+    def size(self) -> int:
+        return super().size() + sys.getsizeof(self.after_string_value) + sys.getsizeof(self.before_string_value)
+
     @staticmethod
     def should_merge(this: 'Command', other: 'Command') -> bool:
         return (
             isinstance(this, SetCommand)
             and isinstance(other, SetCommand)
-            and -0.3 <= this.created_at - other.created_at <= 0.0
+            and -MERGE_WINDOW <= this.created_at - other.created_at <= 0.0
         )
@@ -0,0 +1,398 @@
+from .arguments import (
+    BooleanArgument,
+    EnumArgument,
+    FloatArgument,
+    IntegerArgument,
+    ParsedArgument,
+    PathArgument,
+    StringArgument,
+)
+from .unparsed import ParsedArgumentList, UnparsedArgument
+from .utils import (
+    AllowedTypes,
+    SpecialKey,
+)
+from .remember import RememberMode, maybe_remember_before, maybe_remember_after, clear_memory
+from .argv import ArgvTable, option_name
+from .schema_cache import load_compiled_schema, save_compiled_schema
+from .command import CommandManager
+from .flags import STAT_CACHE
+from .tracing import span
+
+from enum import Enum
+from functools import cached_property
+from pathlib import Path
+import sys
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    NamedTuple,
+    Optional,
+    Self,
+    TypeVar,
+    Generic,
+)
+if TYPE_CHECKING:
+    from .terminal import InputEvent
+
+
+__all__ = (
+    'ArgumentSnapshot',
+    'EngineSnapshot',
+    'Engine',
+    'increment_arg_parsers_defined',
+    'parse_non_interactive',
+)
+
+
+NT = TypeVar('NT', bound=NamedTuple)
+
+
+def should_clear_memory() -> bool:
+    if len(sys.argv) > 1 and sys.argv[1] == '!clear':
+        sys.argv.pop(1)
+        return True
+    return False
+
+
+ARG_PARSERS_DEFINED: int = 0
+
+def increment_arg_parsers_defined() -> None:
+    global ARG_PARSERS_DEFINED
+    ARG_PARSERS_DEFINED += 1
+
+def should_use_argv() -> bool:
+    return ARG_PARSERS_DEFINED <= 1 and len(sys.argv) > 1
+
+
+class ArgumentSnapshot(NamedTuple):
+    field_name: str
+    string_value: str
+    is_none: bool
+    is_valid: bool
+
+
+class EngineSnapshot(NamedTuple):
+    index: int
+    inner_index: int
+    finished: bool
+    arguments: tuple[ArgumentSnapshot, ...]
+
+
+class Engine(Generic[NT]):
+    """The editing state behind the builder, without any rendering or terminal input."""
+    named_tuple_cls: type[NT]
+    name: str
+    description: str
+    author: str
+    arguments: list[ParsedArgument[Any]]
+    remember_data: tuple[RememberMode, int]  # (mode, duration)  # duration in seconds, -1 for infinite
+    started: bool
+    finished: bool
+    index: int
+    inner_index: int
+    higher_inner_index: int
+    command_manager: CommandManager
+    previous_input: Optional[str | SpecialKey]
+    argv_errors: dict[ParsedArgument[Any], str]  # {argument: value} for the argv values that were rejected
+    argv_failed: bool  # argv could not be read, or some of its values were rejected
+    def __init__(
+        self,
+        *,
+        named_tuple_cls: type[NT],
+        name: str,
+        description: str,
+        author: str,
+        arguments: list[ParsedArgument],
+        remember_data: tuple[RememberMode, int],
+    ) -> None:
+        self.named_tuple_cls = named_tuple_cls
+        self.name = name
+        self.description = description
+        self.author = author
+        self.arguments = arguments
+        self.remember_data = remember_data
+        self.started = False
+        self.finished = False
+        self.index = 0
+        self.higher_inner_index = 0
+        self.command_manager = CommandManager()
+        self.previous_input = None
+        self.argv_errors = {}
+        self.argv_failed = False
+        use_argv = should_use_argv()
+        if should_clear_memory():
+            clear_memory(self)
+        elif not use_argv:
+            with span('maybe_remember_before', category='memory'):
+                maybe_remember_before(self)
+        try_finish = False
+        if use_argv:
+            try_finish = self.use_argv()
+        self.inner_index = self.highest_inner_index_from_current_selected()
+        self.higher_inner_index = self.inner_index
+        if try_finish and self.all_values_are_valid():
+            self.maybe_finish(is_beginning=True)
+
+    @classmethod
+    def from_named_tuple_cls(
+        cls,
+        named_tuple_cls: type[NT],
+        *,
+        name: str,
+        description: str,
+        author: str,
+        remember_mode: tuple[RememberMode, int],
+        cache: bool = False,
+    ) -> Self:
+        """Compile the schema of `named_tuple_cls`, with `cache` reusing it until argbuilder, its sources or its `arg()` values change."""
+        with span('from_named_tuple_cls', category='schema'):
+            arguments = load_compiled_schema(named_tuple_cls) if cache else None
+            if arguments is None:
+                arguments = cls.compile_arguments(named_tuple_cls)
+                if cache:
+                    save_compiled_schema(named_tuple_cls, arguments)
+
+        return cls(
+            named_tuple_cls=named_tuple_cls,
+            name=name,
+            description=description,
+            author=author,
+            arguments=arguments,
+            remember_data=remember_mode,
+        )
+
+    @staticmethod
+    def compile_arguments(named_tuple_cls: type[NamedTuple]) -> list[ParsedArgument]:
+        with span('compile_arguments', category='schema'):
+            for key, value in vars(named_tuple_cls).items():
+                if isinstance(value, UnparsedArgument):
+                    raise ValueError(f'"{key}" must have a type annotation. Example:\n\t{key}: int = arg(...)')
+
+            arguments = ParsedArgumentList()
+
+            for index, field_name in enumerate(named_tuple_cls._fields):
+                try:
+                    unparsed: Any = named_tuple_cls._field_defaults.get(field_name, None)
+                    if unparsed is None:
+                        unparsed = UnparsedArgument()
+                    elif not isinstance(unparsed, UnparsedArgument):
+                        unparsed = UnparsedArgument(default=unparsed)
+                    unparsed.check_everything(
+                        named_tuple_cls=named_tuple_cls,
+                        index=index,
+                        parsed_arguments=arguments,
+                    )
+
+                    parsed_argument_cls: type[ParsedArgument]
+                    if unparsed._type is bool:
+                        parsed_argument_cls = BooleanArgument
+                    elif unparsed._type is str:
+                        parsed_argument_cls = StringArgument
+                    elif unparsed._type is int:
+                        parsed_argument_cls = IntegerArgument
+                    elif unparsed._type is float:
+                        parsed_argument_cls = FloatArgument
+                    elif issubclass(unparsed._type, Enum):  # type: ignore
+                        parsed_argument_cls = EnumArgument
+                    elif unparsed._type is Path:
+                        parsed_argument_cls = PathArgument
+                    else:
+                        raise ValueError(f'Unsupported type {unparsed._type}')
+
+                    unparsed.check_everything_with_parsed_cls(
+                        named_tuple_cls=named_tuple_cls,
+                        index=index,
+                        parsed_arguments=arguments,
+                        parsed_cls=parsed_argument_cls,  # type: ignore
+                    )
+                    if (
+                        unparsed.name is None
+                        or unparsed.description is None
+                        or unparsed.allow_none is None
+                    ):
+                        raise ValueError('Something went wrong on our end.. Please report this.')
+
+                    argument: ParsedArgument[AllowedTypes] = parsed_argument_cls(  # type: ignore
+                        name=unparsed.name,
+                        description=unparsed.description,
+                        field_name=field_name,
+                        has_default=unparsed.has_default,
+                        default=unparsed.default,  # type: ignore
+                        allow_none=unparsed.allow_none,
+                        options=unparsed.options,  # type: ignore
+                        flags=unparsed.flags,
+                        flag_plan=unparsed.flag_plan,
+                        remember=unparsed.remember,
+                        prefix=unparsed.prefix,
+                        suffix=unparsed.suffix,
+                    )
+                    arguments.append(argument)
+                except ValueError as exc:
+                    raise ValueError(f'Error while parsing "{field_name}"') from exc
+        return list(arguments)
+
+    def selected_argument(self) -> ParsedArgument:
+        return self.arguments[self.index]
+
+    def handle_text(
+        self,
+        text: str,
+    ) -> None:
+        self.previous_input = text
+        self.selected_argument().handle_text(text, builder=self)
+
+    def highest_inner_index_from_current_selected(self) -> int:
+        return self.arguments[self.index].display_length(builder=self)
+
+    def handle_special_key(self, special_key: SpecialKey) -> None:
+        self.previous_input = special_key
+        if special_key is SpecialKey.UP:
+            self.index = (self.index - 1) % len(self.arguments)
+            self.inner_index = self.higher_inner_index
+        elif special_key is SpecialKey.DOWN:
+            self.index = (self.index + 1) % len(self.arguments)
+            self.inner_index = self.higher_inner_index
+        elif special_key is SpecialKey.CTRL_UP:
+            self.index = 0
+            self.inner_index = self.higher_inner_index
+        elif special_key is SpecialKey.CTRL_DOWN:
+            self.index = len(self.arguments) - 1
+            self.inner_index = self.higher_inner_index
+        elif special_key is SpecialKey.ENTER:
+            STAT_CACHE.clear()  # the final validation should see the filesystem as it is right now
+            self.maybe_finish()
+        elif special_key is SpecialKey.CTRL_Z:
+            self.command_manager.undo(builder=self)
+        elif special_key is SpecialKey.CTRL_Y:
+            self.command_manager.redo(builder=self)
+        else:
+            self.selected_argument().handle_special_key(special_key, builder=self)
+        self.inner_index = min(self.inner_index, self.highest_inner_index_from_current_selected())
+
+    def handle_events(self, events: list['InputEvent']) -> None:
+        """Handle a burst of input, adjacent text is applied as one edit."""
+        text: list[str] = []
+        for event in events:
+            if isinstance(event, str):
+                text.append(event)
+                continue
+            if text:
+                self.handle_text(''.join(text))
+                text.clear()
+            if self.finished:
+                return
+            self.handle_special_key(event)
+            if self.finished:
+                return
+        if text:
+            self.handle_text(''.join(text))
+
+    def feed(self, events: Iterable['InputEvent']) -> None:
+        """Apply events as if they were typed, text can be given as whole strings."""
+        self.handle_events(list(events))
+
+    def snapshot(self) -> EngineSnapshot:
+        return EngineSnapshot(
+            index=self.index,
+            inner_index=self.inner_index,
+            finished=self.finished,
+            arguments=tuple(
+                ArgumentSnapshot(
+                    field_name=a.field_name,
+                    string_value=a.string_value,
+                    is_none=a.is_none,
+                    is_valid=a.value_is_valid(builder=self),
+                )
+                for a in self.arguments
+            ),
+        )
+
+    @cached_property
+    def argv_table(self) -> ArgvTable:
+        return ArgvTable(self.arguments)
+
+    def fetch_argv_values(self) -> dict[ParsedArgument[Any], str]:
+        return self.argv_table.parse(sys.argv[1:])
+
+    def use_argv(self) -> bool:
+        with span('fetch_argv_values', category='argv'):
+            try:
+                argv_values: dict[ParsedArgument[Any], str] = self.fetch_argv_values()
+            except ValueError as exc:
+                self.report_error(f'Error while reading argv: {exc}')
+                self.argv_failed = True
+                return False
+        for argument, value in argv_values.items():
+            try:
+                if argument.allow_none and value.lower() == 'none':
+                    argument.raw_set_string_value_and_is_none(
+                        '', True, builder=self,
+                    )
+                else:
+                    argument.raw_set_string_value_and_is_none(
+                        value, False, builder=self,
+                    )
+            except ValueError:
+                self.argv_errors[argument] = value
+                self.report_error(f'{self.name}: invalid value {value!r} for "{option_name(argument)}"')
+                self.argv_failed = True
+                continue
+        return not self.argv_failed and bool(argv_values)
+
+    def report_error(self, message: str) -> None:
+        print(message, file=sys.stderr)
+
+    def all_values_are_valid(self) -> bool:
+        return all(a.value_is_valid(builder=self) for a in self.arguments)
+
+    def create_named_tuple(self) -> NT:
+        if not self.all_values_are_valid():
+            raise ValueError('Not all values are valid')
+        return self.named_tuple_cls(
+            **{a.field_name: a.get_value(builder=self) for a in self.arguments},  # type: ignore
+        )
+
+    def maybe_finish(self, *, is_beginning: bool = False) -> None:
+        if self.all_values_are_valid():
+            self.on_finish(is_beginning=is_beginning)
+
+    def on_finish(self, *, is_beginning: bool) -> None:
+        self.finished = True
+        self.index = -1
+        with span('maybe_remember_after', category='memory'):
+            maybe_remember_after(self)
+
+
+def parse_non_interactive(
+    named_tuple_cls: type[NT],
+    *,
+    name: str,
+    description: str,
+    author: str,
+    remember_mode: tuple[RememberMode, int],
+    cache: bool = False,
+) -> NT:
+    """Build the NamedTuple from argv and the defaults alone, without a terminal."""
+    engine: Engine[NT] = Engine.from_named_tuple_cls(
+        named_tuple_cls,
+        name=name,
+        description=description,
+        author=author,
+        remember_mode=remember_mode,
+        cache=cache,
+    )
+    if not engine.finished and not engine.argv_failed:  # defaults must not stand in for rejected argv
+        engine.maybe_finish()
+    if engine.finished:
+        return engine.create_named_tuple()
+    for argument in engine.arguments:
+        if argument in engine.argv_errors or argument.value_is_valid(builder=engine):
+            continue  # a rejected argv value has been reported already
+        if not argument.is_none and argument.string_value == '':
+            engine.report_error(f'{name}: missing value for "{option_name(argument)}"')
+        else:
+            engine.report_error(f'{name}: invalid value {argument.string_value!r} for "{option_name(argument)}"')
+    raise SystemExit(2)
@@ -2,3 +2,4 @@ from .base import *  # noqa: F403
 from .value import *  # noqa: F403
 from .path import *  # noqa: F403
 from .secret import *  # noqa: F403
+from .plan import *  # noqa: F403
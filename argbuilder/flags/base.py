@@ -5,7 +5,8 @@ from abc import (
 from typing import TYPE_CHECKING, Any, Optional
 if TYPE_CHECKING:
     from ..arguments import ParsedArgument
-    from ..builder import Builder
+    from ..engine import Engine
+    from .plan import FlagPlan
 
 
 __all__ = (
@@ -14,6 +15,9 @@ __all__ = (
 
 
 class Flag(ABC):
+    VOLATILE: bool = False
+    """Whether the check depends on more than the argument's value, such as the filesystem. Volatile flags are checked every time instead of being cached."""
+
     @abstractmethod
     def allowed_parsed_argument_types(self) -> Optional[set[type['ParsedArgument']]]:
         """Return the set of parsed argument types that this flag can be applied to. If None, the flag can be applied to any parsed argument type."""
@@ -23,32 +27,43 @@ class Flag(ABC):
     def check_maybe_raise(
         self,
         argument: 'ParsedArgument',
+        value: Any,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> bool:
-        """Check if the flag is satisfied by the parsed argument. This can raise a ValueError, on raise, it assumes the check failed."""
+        """Check if the flag is satisfied by the already parsed value of the argument. This can raise a ValueError, on raise, it assumes the check failed."""
         raise NotImplementedError
 
     def check(
         self,
         argument: 'ParsedArgument',
+        value: Any,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> bool:
-        """Check if the flag is satisfied by the parsed argument."""
+        """Check if the flag is satisfied by the already parsed value of the argument."""
         try:
-            return self.check_maybe_raise(argument, builder=builder)
+            return self.check_maybe_raise(argument, value, builder=builder)
         except ValueError:
             return False
 
+    def add_to_plan(
+        self,
+        plan: 'FlagPlan',
+    ) -> None:
+        """Add this flag to the compiled checks of an argument. By default the flag is checked on its own."""
+        plan.add_flag(self)
+
     @abstractmethod
     def maybe_change_display(
         self,
         argument: 'ParsedArgument',
         display: str,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
+        offset: int = 0,
     ) -> str:
+        """`display` may be a window of the full display that starts at `offset`, the length has to stay the same."""
         raise NotImplementedError
 
     @abstractmethod
@@ -4,12 +4,20 @@ from ..arguments import (
 )
 from .base import Flag
 
+import os
+from pathlib import Path
+import stat
+import time
+
 from typing import final, TYPE_CHECKING, Any, Optional
 if TYPE_CHECKING:
-    from ..builder import Builder
+    from ..engine import Engine
+    from .plan import FlagPlan
 
 
 __all__ = (
+    'StatCache',
+    'STAT_CACHE',
     'ExistsFlag',
     'DoesNotExistFlag',
     'IsDirFlag',
@@ -18,6 +26,54 @@ __all__ = (
 )
 
 
+class StatCache:
+    """Shares `os.stat` results between every path flag, a result is reused for `ttl` seconds."""
+    ttl: float
+    entries: dict[str, tuple[Optional[os.stat_result], float]]  # {path: (result, fetched_at)}
+    MAX_ENTRIES: int = 256
+    def __init__(
+        self,
+        *,
+        ttl: float = 1.0,
+    ) -> None:
+        self.ttl = ttl
+        self.entries = {}
+
+    def prune(self, now: float) -> None:
+        self.entries = {
+            path: entry
+            for path, entry in self.entries.items()
+            if now - entry[1] < self.ttl
+        }
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def stat(self, path: Path | str) -> Optional[os.stat_result]:
+        """Return the stat result of the path, or None if it could not be stat'ed (usually because it does not exist)."""
+        key = os.fspath(path)
+        now = time.monotonic()
+        entry = self.entries.get(key, None)
+        if entry is not None and now - entry[1] < self.ttl:
+            return entry[0]
+        result: Optional[os.stat_result]
+        try:
+            result = os.stat(key)
+        except (OSError, ValueError):
+            result = None
+        self.entries[key] = (result, now)
+        if len(self.entries) > self.MAX_ENTRIES:
+            self.prune(now)
+        return result
+
+    def mode(self, path: Path | str) -> Optional[int]:
+        result = self.stat(path)
+        return result.st_mode if result is not None else None
+
+
+STAT_CACHE: StatCache = StatCache()
+
+
 class PathFlag(Flag):
     def allowed_parsed_argument_types(self) -> Optional[set[type[ParsedArgument]]]:
         return {PathArgument,}
@@ -27,20 +83,30 @@ class PathFlag(Flag):
         argument: PathArgument,
         display: str,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
+        offset: int = 0,
     ) -> str:
         return display
 
 
 @final
 class ExistsFlag(PathFlag):
+    VOLATILE = True
+
     def check_maybe_raise(
         self,
         argument: PathArgument,
+        value: Path,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> bool:
-        return argument.raw_get_value(builder=builder).exists()
+        return STAT_CACHE.stat(value) is not None
+
+    def add_to_plan(
+        self,
+        plan: 'FlagPlan',
+    ) -> None:
+        plan.require_stat(must_exist=True)
 
     def __str__(self) -> str:
         return 'Exists'
@@ -48,13 +114,22 @@ class ExistsFlag(PathFlag):
 
 @final
 class DoesNotExistFlag(PathFlag):
+    VOLATILE = True
+
     def check_maybe_raise(
         self,
         argument: PathArgument,
+        value: Path,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> bool:
-        return not ExistsFlag.check_maybe_raise(self, argument, builder=builder)  # type: ignore
+        return not ExistsFlag.check_maybe_raise(self, argument, value, builder=builder)  # type: ignore
+
+    def add_to_plan(
+        self,
+        plan: 'FlagPlan',
+    ) -> None:
+        plan.require_stat(must_exist=False)
 
     def __str__(self) -> str:
         return 'Doesn\'t Exist'
@@ -62,13 +137,23 @@ class DoesNotExistFlag(PathFlag):
 
 @final
 class IsDirFlag(PathFlag):
+    VOLATILE = True
+
     def check_maybe_raise(
         self,
         argument: PathArgument,
+        value: Path,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> bool:
-        return argument.raw_get_value(builder=builder).is_dir()
+        mode = STAT_CACHE.mode(value)
+        return mode is not None and stat.S_ISDIR(mode)
+
+    def add_to_plan(
+        self,
+        plan: 'FlagPlan',
+    ) -> None:
+        plan.require_stat(must_be_dir=True)
 
     def __str__(self) -> str:
         return 'Is Dir'
@@ -76,13 +161,23 @@ class IsDirFlag(PathFlag):
 
 @final
 class IsFileFlag(PathFlag):
+    VOLATILE = True
+
     def check_maybe_raise(
         self,
         argument: PathArgument,
+        value: Path,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> bool:
-        return argument.raw_get_value(builder=builder).is_file()
+        mode = STAT_CACHE.mode(value)
+        return mode is not None and stat.S_ISREG(mode)
+
+    def add_to_plan(
+        self,
+        plan: 'FlagPlan',
+    ) -> None:
+        plan.require_stat(must_be_file=True)
 
     def __str__(self) -> str:
         return 'Is File'
@@ -97,10 +192,11 @@ class HasSuffixFlag(PathFlag):
     def check_maybe_raise(
         self,
         argument: PathArgument,
+        value: Path,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> bool:
-        return argument.raw_get_value(builder=builder).suffix == self.suffix
+        return value.suffix == self.suffix
 
     def __str__(self) -> str:
         return f'Has Extension "{self.suffix}"'
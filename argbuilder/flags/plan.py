@@ -0,0 +1,151 @@
+from .base import Flag
+from .path import STAT_CACHE
+from ..tracing import span
+
+import stat
+
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+if TYPE_CHECKING:
+    from ..arguments import ParsedArgument
+    from ..engine import Engine
+
+
+__all__ = (
+    'FlagPlan',
+)
+
+
+class FlagPlan:
+    """The flags of a single argument compiled into one predicate."""
+    lower: Optional[int | float]
+    lower_inclusive: bool
+    upper: Optional[int | float]
+    upper_inclusive: bool
+    must_exist: Optional[bool]  # None if the path may or may not exist
+    must_be_dir: bool
+    must_be_file: bool
+    stable_flags: list[Flag]
+    volatile_flags: list[Flag]
+    def __init__(
+        self,
+        flags: Iterable[Flag] = (),
+    ) -> None:
+        self.lower = None
+        self.lower_inclusive = True
+        self.upper = None
+        self.upper_inclusive = True
+        self.must_exist = None
+        self.must_be_dir = False
+        self.must_be_file = False
+        self.stable_flags = []
+        self.volatile_flags = []
+        for flag in flags:
+            flag.add_to_plan(self)
+
+    def add_flag(self, flag: Flag) -> None:
+        if flag.VOLATILE:
+            self.volatile_flags.append(flag)
+        else:
+            self.stable_flags.append(flag)
+
+    def restrict_lower(
+        self,
+        value: int | float,
+        *,
+        inclusive: bool,
+    ) -> None:
+        if self.lower is None or value > self.lower or (value == self.lower and not inclusive):
+            self.lower = value
+            self.lower_inclusive = inclusive
+
+    def restrict_upper(
+        self,
+        value: int | float,
+        *,
+        inclusive: bool,
+    ) -> None:
+        if self.upper is None or value < self.upper or (value == self.upper and not inclusive):
+            self.upper = value
+            self.upper_inclusive = inclusive
+
+    def require_stat(
+        self,
+        *,
+        must_exist: Optional[bool] = None,
+        must_be_dir: bool = False,
+        must_be_file: bool = False,
+    ) -> None:
+        if must_exist is not None:
+            if self.must_exist is not None and self.must_exist is not must_exist:
+                raise ValueError('A path cannot both exist and not exist')
+            self.must_exist = must_exist
+        self.must_be_dir = self.must_be_dir or must_be_dir
+        self.must_be_file = self.must_be_file or must_be_file
+
+    @property
+    def has_interval(self) -> bool:
+        return self.lower is not None or self.upper is not None
+
+    @property
+    def needs_stat(self) -> bool:
+        return self.must_exist is not None or self.must_be_dir or self.must_be_file
+
+    @property
+    def is_volatile(self) -> bool:
+        return self.needs_stat or len(self.volatile_flags) > 0
+
+    def check_interval(self, value: Any) -> bool:
+        measured: int | float = len(value) if isinstance(value, str) else value
+        if self.lower is not None and (measured < self.lower or (measured == self.lower and not self.lower_inclusive)):
+            return False
+        if self.upper is not None and (measured > self.upper or (measured == self.upper and not self.upper_inclusive)):
+            return False
+        return True
+
+    def check_stat(self, value: Any) -> bool:
+        mode: Optional[int] = STAT_CACHE.mode(value)
+        if mode is None:
+            return self.must_exist is not True and not self.must_be_dir and not self.must_be_file
+        if self.must_exist is False:
+            return False
+        if self.must_be_dir and not stat.S_ISDIR(mode):
+            return False
+        if self.must_be_file and not stat.S_ISREG(mode):
+            return False
+        return True
+
+    def check_stable(
+        self,
+        argument: 'ParsedArgument[Any]',
+        value: Any,
+        *,
+        builder: 'Engine[Any]',
+    ) -> bool:
+        """Check everything that only depends on the value itself, the result may be cached."""
+        if self.has_interval:
+            with span('interval', category='flag'):
+                if not self.check_interval(value):
+                    return False
+        for flag in self.stable_flags:
+            with span(flag.__class__.__name__, category='flag'):
+                if not flag.check(argument, value, builder=builder):
+                    return False
+        return True
+
+    def check_volatile(
+        self,
+        argument: 'ParsedArgument[Any]',
+        value: Any,
+        *,
+        builder: 'Engine[Any]',
+    ) -> bool:
+        """Check everything that depends on more than the value, this has to be done every time."""
+        if self.needs_stat:
+            with span('stat', category='flag'):
+                if not self.check_stat(value):
+                    return False
+        for flag in self.volatile_flags:
+            with span(flag.__class__.__name__, category='flag'):
+                if not flag.check(argument, value, builder=builder):
+                    return False
+        return True
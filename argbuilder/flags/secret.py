@@ -6,7 +6,8 @@ from .base import Flag
 
 from typing import final, TYPE_CHECKING, Any, Optional
 if TYPE_CHECKING:
-    from ..builder import Builder
+    from ..engine import Engine
+    from .plan import FlagPlan
 
 
 __all__ = (
@@ -25,26 +26,32 @@ class SecretFlag(Flag):
         argument: PathArgument,
         display: str,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
+        offset: int = 0,
     ) -> str:
         new_display = '*' * len(display)
         if builder.selected_argument() is not argument or builder.inner_index == 0:
             return new_display
-        try:
-            index = builder.inner_index - 1
+        index = builder.inner_index - 1 - offset
+        if 0 <= index < len(display):
             new_display = new_display[:index] + display[index] + new_display[index + 1:]
-        except IndexError:
-            pass
         return new_display
 
     def check_maybe_raise(
         self,
         argument: ParsedArgument,
+        value: Any,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> bool:
         return True
 
+    def add_to_plan(
+        self,
+        plan: 'FlagPlan',
+    ) -> None:
+        pass  # only changes the display
+
     def __str__(self) -> str:
         return 'Password'
 
@@ -59,17 +66,25 @@ class VerySecretFlag(Flag):
         argument: PathArgument,
         display: str,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
+        offset: int = 0,
     ) -> str:
         return '*' * len(display)
 
     def check_maybe_raise(
         self,
         argument: ParsedArgument,
+        value: Any,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> bool:
         return True
 
+    def add_to_plan(
+        self,
+        plan: 'FlagPlan',
+    ) -> None:
+        pass  # only changes the display
+
     def __str__(self) -> str:
         return 'Password'
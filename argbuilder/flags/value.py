@@ -12,7 +12,8 @@ from abc import (
 
 from typing import final, TYPE_CHECKING, Any, Optional
 if TYPE_CHECKING:
-    from ..builder import Builder
+    from ..engine import Engine
+    from .plan import FlagPlan
 
 
 __all__ = (
@@ -46,16 +47,17 @@ class ValueFlag(Flag):
     def check_maybe_raise(
         self,
         argument: ParsedArgument,
+        value: Any,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
     ) -> bool:
         if isinstance(argument, StringArgument):
-            return self.apply(len(argument.raw_get_value(builder=builder)))
+            return self.apply(len(value))
         if isinstance(argument, (
             IntegerArgument,
             FloatArgument,
         )):
-            return self.apply(argument.raw_get_value(builder=builder))
+            return self.apply(value)
         raise TypeError(f'Invalid type {argument.__class__.__name__}')
 
     def maybe_change_display(
@@ -63,7 +65,8 @@ class ValueFlag(Flag):
         argument: ParsedArgument,
         display: str,
         *,
-        builder: 'Builder[Any]',
+        builder: 'Engine[Any]',
+        offset: int = 0,
     ) -> str:
         return display
 
@@ -77,6 +80,12 @@ class LessThanFlag(ValueFlag):
     ) -> bool:
         return value < self.value
 
+    def add_to_plan(
+        self,
+        plan: 'FlagPlan',
+    ) -> None:
+        plan.restrict_upper(self.value, inclusive=False)
+
     def __str__(self) -> str:
         return f'<{self.value}'
 
@@ -90,6 +99,12 @@ class LessThanOrEqualFlag(ValueFlag):
     ) -> bool:
         return value <= self.value
 
+    def add_to_plan(
+        self,
+        plan: 'FlagPlan',
+    ) -> None:
+        plan.restrict_upper(self.value, inclusive=True)
+
     def __str__(self) -> str:
         return f'<={self.value}'
 
@@ -103,6 +118,12 @@ class GreaterThanFlag(ValueFlag):
     ) -> bool:
         return value > self.value
 
+    def add_to_plan(
+        self,
+        plan: 'FlagPlan',
+    ) -> None:
+        plan.restrict_lower(self.value, inclusive=False)
+
     def __str__(self) -> str:
         return f'>{self.value}'
 
@@ -116,5 +137,11 @@ class GreaterThanOrEqualFlag(ValueFlag):
     ) -> bool:
         return value >= self.value
 
+    def add_to_plan(
+        self,
+        plan: 'FlagPlan',
+    ) -> None:
+        plan.restrict_lower(self.value, inclusive=True)
+
     def __str__(self) -> str:
         return f'>={self.value}'
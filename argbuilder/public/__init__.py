@@ -1,4 +1,33 @@
-from .arg import *  # noqa: F403
-from .flag import *  # noqa: F403
-from .argparser import *  # noqa: F403
-from ..remember import RememberMode as RememberMode  # noqa: F403
+import importlib
+
+from typing import TYPE_CHECKING, Any
+if TYPE_CHECKING:
+    from ._arg import *  # noqa: F403
+    from .flag import *  # noqa: F403
+    from .argparser import *  # noqa: F403
+    from ..remember import RememberMode as RememberMode  # noqa: F403
+
+
+__all__ = (
+    'arg',
+    'Flag',
+    'ArgParser',
+    'RememberMode',
+)
+
+
+SUBMODULES: dict[str, str] = {
+    'arg': '._arg',
+    'Flag': '.flag',
+    'ArgParser': '.argparser',
+    'RememberMode': '..remember',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule that defines `name` the first time it is asked for."""
+    if name not in SUBMODULES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(SUBMODULES[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -1,5 +1,7 @@
 # I am terribly sorry
-from ..builder import Builder, increment_arg_parsers_defined
+from ..engine import increment_arg_parsers_defined, parse_non_interactive
+from ..scheduler import FrameScheduler
+from ..tracing import TraceTarget, start_tracing, stop_tracing
 from ..utils import MISSING
 from ..remember import RememberMode
 
@@ -9,6 +11,7 @@ import sys
 from typing import (
     NamedTuple,
     Any,
+    Optional,
     TYPE_CHECKING,
     TypeVar,
     NamedTupleMeta,  # pyright: ignore[reportAttributeAccessIssue]
@@ -65,6 +68,10 @@ class ArgParser(NamedTuple):
         name: str = MISSING,
         author: str = '69Jesse',
         remember: bool | int | RememberMode | tuple[bool, int] | tuple[RememberMode, int] = False,
+        max_fps: int = FrameScheduler.DEFAULT_MAX_FPS,
+        trace: Optional[TraceTarget] = None,
+        interactive: Optional[bool] = None,
+        cache: bool = False,
     ) -> NT:
         name = name if name is not MISSING else os.path.basename(sys.argv[0]).rsplit('.', 1)[0]
         if isinstance(remember, bool):
@@ -76,15 +83,35 @@ class ArgParser(NamedTuple):
         if not isinstance(remember, tuple):
             remember = (remember, -1)
 
-        builder = Builder.from_named_tuple_cls(
-            named_tuple_cls=named_tuple_cls,
-            name=name,
-            description=description,
-            author=author,
-            remember_mode=remember,  # pyright: ignore[reportArgumentType]
-        )
-        while not builder.finished:
-            builder.iterate()
+        if interactive is None:
+            interactive = sys.stdin.isatty() and sys.stdout.isatty()
+
+        start_tracing(trace)
+        try:
+            if not interactive:
+                return parse_non_interactive(
+                    named_tuple_cls,
+                    name=name,
+                    description=description,
+                    author=author,
+                    remember_mode=remember,  # pyright: ignore[reportArgumentType]
+                    cache=cache,
+                )
+            from ..builder import Builder  # the terminal modules are only imported when they are used
+            builder = Builder.from_named_tuple_cls(
+                named_tuple_cls=named_tuple_cls,
+                name=name,
+                description=description,
+                author=author,
+                remember_mode=remember,  # pyright: ignore[reportArgumentType]
+                cache=cache,
+            )
+            try:
+                FrameScheduler(builder, max_fps=max_fps).run()
+            finally:
+                builder.close()
+        finally:
+            stop_tracing()
         return builder.create_named_tuple()
 
     if TYPE_CHECKING:
@@ -96,6 +123,10 @@ class ArgParser(NamedTuple):
             name: str = MISSING,
             author: str = '69Jesse',
             remember: bool | int | RememberMode | tuple[bool, int] | tuple[RememberMode, int] = False,
+            max_fps: int = FrameScheduler.DEFAULT_MAX_FPS,
+            trace: Optional[TraceTarget] = None,
+            interactive: Optional[bool] = None,
+            cache: bool = False,
         ) -> Self:
             ...
     else:
@@ -1,19 +1,15 @@
 from enum import Enum
 from pathlib import Path
-import json
 import time
 
 from typing import TYPE_CHECKING, Any, TypedDict, Optional
 if TYPE_CHECKING:
-    from .builder import Builder
+    from .engine import Engine
     from .arguments import ParsedArgument
 
 
 HERE: Path = Path(__file__).resolve().parent
-MEMORY_FOLDER: Path = HERE / 'memory'
-if not MEMORY_FOLDER.exists():
-    MEMORY_FOLDER.mkdir(parents=True)
-assert MEMORY_FOLDER.is_dir()
+MEMORY_FOLDER: Path = HERE / 'memory'  # created by the first save, not at import
 
 
 __all__ = (
@@ -62,6 +58,7 @@ def get_cwd() -> str:
 def fetch_json(name: str) -> MemoryFileJson:
     name = normalize_name(name)
     path = MEMORY_FOLDER / f'{name}.json'
+    import json
     with path.open(encoding='utf-8') as file:
         return json.load(file)
 
@@ -69,6 +66,8 @@ def fetch_json(name: str) -> MemoryFileJson:
 def save_json(name: str, data: MemoryFileJson) -> None:
     name = normalize_name(name)
     path = MEMORY_FOLDER / f'{name}.json'
+    import json
+    MEMORY_FOLDER.mkdir(parents=True, exist_ok=True)
     with path.open('w', encoding='utf-8') as file:
         json.dump(data, file, ensure_ascii=False, separators=(',', ':'))
 
@@ -77,7 +76,7 @@ def bit_is_set(n: int, i: int) -> bool:
     return bool(n >> i & 1)
 
 
-def maybe_fetch_memory(builder: 'Builder[Any]') -> Optional[Memory]:
+def maybe_fetch_memory(builder: 'Engine[Any]') -> Optional[Memory]:
     try:
         data = fetch_json(builder.name)
     except FileNotFoundError:
@@ -99,7 +98,7 @@ def maybe_fetch_memory(builder: 'Builder[Any]') -> Optional[Memory]:
 def create_memories_mapping(
     memory: Memory,
     arguments: set['ParsedArgument[Any]'],
-    builder: 'Builder[Any]',
+    builder: 'Engine[Any]',
 ) -> dict['ParsedArgument[Any]', tuple[str, bool]]:
     memorized: int = memory.get('memorized', 0)
     are_none: int = memory.get('are_none', 0)
@@ -129,7 +128,7 @@ def create_memories_mapping(
     return mapping
 
 
-def create_memory(builder: 'Builder[Any]') -> Memory:
+def create_memory(builder: 'Engine[Any]') -> Memory:
     memory: Memory = {
         'memorized': 0,
         'are_none': 0,
@@ -150,7 +149,7 @@ def create_memory(builder: 'Builder[Any]') -> Memory:
     return memory
 
 
-def update_data(builder: 'Builder[Any]', memory: Memory) -> None:
+def update_data(builder: 'Engine[Any]', memory: Memory) -> None:
     data: MemoryFileJson
     try:
         data = fetch_json(builder.name)
@@ -168,7 +167,7 @@ def update_data(builder: 'Builder[Any]', memory: Memory) -> None:
     save_json(builder.name, data)
 
 
-def maybe_remember_before(builder: 'Builder[Any]') -> None:
+def maybe_remember_before(builder: 'Engine[Any]') -> None:
     arguments: set['ParsedArgument[Any]']
     if builder.remember_data[0] is RememberMode.NONE:
         arguments = set(argument for argument in builder.arguments if argument.remember)
@@ -189,14 +188,14 @@ def maybe_remember_before(builder: 'Builder[Any]') -> None:
             continue
 
 
-def maybe_remember_after(builder: 'Builder[Any]') -> None:
+def maybe_remember_after(builder: 'Engine[Any]') -> None:
     memory = create_memory(builder)
     if len(memory.get('names', [])) == 0:
         return
     update_data(builder, memory)
 
 
-def clear_memory(builder: 'Builder[Any]') -> None:
+def clear_memory(builder: 'Engine[Any]') -> None:
     name = normalize_name(builder.name)
     path = MEMORY_FOLDER / f'{name}.json'
     if path.exists():
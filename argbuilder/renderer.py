@@ -0,0 +1,113 @@
+import sys
+
+from typing import (
+    BinaryIO,
+    Optional,
+    TextIO,
+)
+
+
+__all__ = (
+    'Renderer',
+)
+
+
+class Renderer:
+    """Keeps the last emitted frame and only rewrites the lines that changed since then."""
+    stream: TextIO
+    width: int
+    lines: list[str]
+    line_rows: list[int]
+    frame_rows: int
+    total_rows: int
+    cursor_row: int
+    last_written: int  # bytes in the last frame that was written, once encoded
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+    ) -> None:
+        self.stream = stream if stream is not None else sys.stdout
+        self.width = -1
+        self.lines = []
+        self.line_rows = []
+        self.frame_rows = 0
+        self.total_rows = 1  # the row the cursor is on when the first frame is drawn
+        self.cursor_row = 0
+        self.last_written = 0
+
+    def move_to(self, row: int) -> str:
+        parts: list[str] = ['\r']
+        if row < self.cursor_row:
+            parts.append(f'\033[{self.cursor_row - row}A')
+        elif row > self.cursor_row:
+            existing: int = min(row, self.total_rows - 1)
+            if existing > self.cursor_row:
+                parts.append(f'\033[{existing - self.cursor_row}B')
+            parts.append('\n' * (row - existing))  # rows that were never drawn have to be scrolled into existence
+        self.total_rows = max(self.total_rows, row + 1)
+        self.cursor_row = row
+        return ''.join(parts)
+
+    def forget(self) -> None:
+        """Forget the last frame, the next frame will be drawn in full."""
+        self.lines = []
+        self.line_rows = []
+
+    def render(
+        self,
+        lines: list[tuple[str, int]],
+        *,
+        width: int,
+    ) -> None:
+        """Draw a frame, `lines` holds every line together with its visible length."""
+        parts: list[str] = []
+        if width != self.width:
+            if self.width != -1:
+                parts.append(self.move_to(0))
+                parts.append('\033[J')
+            self.forget()
+            self.width = width
+
+        row: int = 0
+        rewrite_rest: bool = False
+        new_lines: list[str] = []
+        new_line_rows: list[int] = []
+        for i, (line, visible_length) in enumerate(lines):
+            rows: int = max(1, (visible_length + width - 1) // width)
+            line += ' ' * (rows * width - visible_length)
+            new_lines.append(line)
+            new_line_rows.append(rows)
+            if not rewrite_rest and i < len(self.lines) and self.lines[i] == line:
+                row += rows
+                continue
+            if i >= len(self.lines) or self.line_rows[i] != rows:
+                rewrite_rest = True  # everything below this line has moved
+            parts.append(self.move_to(row))
+            parts.append(line)
+            self.cursor_row = row + rows - 1
+            self.total_rows = max(self.total_rows, row + rows)
+            row += rows
+
+        if row < self.frame_rows:
+            parts.append(self.move_to(row))
+            parts.append('\033[J')
+        parts.append(self.move_to(row - 1))
+        self.lines = new_lines
+        self.line_rows = new_line_rows
+        self.frame_rows = row
+        self.write(''.join(parts))
+
+    def write(self, text: str) -> None:
+        """Write a frame in one go, as encoded bytes when the stream has a binary buffer."""
+        encoding: str = getattr(self.stream, 'encoding', None) or 'utf-8'
+        buffer: Optional[BinaryIO] = getattr(self.stream, 'buffer', None)
+        if buffer is None:
+            self.last_written = len(text.encode(encoding, 'replace'))
+            self.stream.write(text)
+            self.stream.flush()
+            return
+        data: bytes = text.encode(encoding, self.stream.errors or 'strict')
+        self.last_written = len(data)
+        self.stream.flush()  # anything printed before has to come first
+        buffer.write(data)
+        buffer.flush()
@@ -0,0 +1,53 @@
+import time
+
+from typing import TYPE_CHECKING, Any, Optional
+if TYPE_CHECKING:
+    from .builder import Builder
+
+
+__all__ = (
+    'FrameScheduler',
+)
+
+
+class FrameScheduler:
+    """Runs a builder until it is finished, drawing at most `max_fps` frames per second."""
+    builder: 'Builder[Any]'
+    frame_interval: float
+    next_frame_at: float
+    drawn_state: Optional[tuple[Any, ...]]  # the state of the last frame, None if nothing was drawn yet
+    DEFAULT_MAX_FPS: int = 60
+    def __init__(
+        self,
+        builder: 'Builder[Any]',
+        *,
+        max_fps: int = DEFAULT_MAX_FPS,
+    ) -> None:
+        if max_fps <= 0:
+            raise ValueError('max_fps must be positive')
+        self.builder = builder
+        self.frame_interval = 1 / max_fps
+        self.next_frame_at = 0.0
+        self.drawn_state = None
+
+    @property
+    def dirty(self) -> bool:
+        return self.builder.frame_state() != self.drawn_state
+
+    def draw(self) -> None:
+        self.builder.display()
+        self.drawn_state = self.builder.frame_state()
+        self.next_frame_at = time.monotonic() + self.frame_interval
+
+    def run(self) -> None:
+        builder = self.builder
+        while not builder.finished:
+            timeout: Optional[float] = None
+            if self.dirty:
+                timeout = self.next_frame_at - time.monotonic()
+                if timeout <= 0:
+                    self.draw()
+                    timeout = None
+            if timeout is None:
+                timeout = builder.recheck_timeout()  # volatile checks can change without a key press
+            builder.handle_events(builder.fetch_events(timeout))
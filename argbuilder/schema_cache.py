@@ -0,0 +1,163 @@
+from .tracing import span
+
+import os
+from pathlib import Path
+import sys
+
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, TypeAlias
+if TYPE_CHECKING:
+    from .arguments import ParsedArgument
+
+
+__all__ = (
+    'load_compiled_schema',
+    'save_compiled_schema',
+)
+
+
+PACKAGE_FOLDER: Path = Path(__file__).resolve().parent
+CACHE_ENV: str = 'XDG_CACHE_HOME'
+CACHE_VERSION: int = 3  # bump this whenever the layout of a cache file changes
+ARG_ATTRIBUTES: tuple[str, ...] = ('description', 'name', 'default', 'allow_none', 'options', 'remember', 'prefix', 'suffix')
+
+
+def cache_folder() -> Optional[Path]:
+    """Where compiled schemas are stored, in the user's cache directory. None if there is no home directory."""
+    base = os.environ.get('LOCALAPPDATA' if os.name == 'nt' else CACHE_ENV) or None
+    try:
+        root = Path(base) if base is not None else Path.home() / ('AppData/Local' if os.name == 'nt' else '.cache')
+    except RuntimeError:
+        return None
+    return root / 'argbuilder' / 'schemas'
+
+
+Source: TypeAlias = tuple[str, int, int]  # (path, mtime_ns, size)
+
+
+class CacheKey(NamedTuple):
+    """Everything a compiled schema depends on, like the header of a `.pyc` file."""
+    version: int
+    cache_tag: Optional[str]
+    package: int  # checksum of the stamps of argbuilder's own sources, so an upgrade invalidates the cache
+    sources: tuple[Source, ...]  # the module of the class first, then the modules of the types it uses
+    qualname: str
+    fields: tuple[str, ...]
+    values: str  # repr of what every arg() was given, they are evaluated when the class is defined
+
+
+def module_source(module_name: str) -> Optional[Source]:
+    source = getattr(sys.modules.get(module_name, None), '__file__', None)
+    if source is None:
+        return None
+    try:
+        stat = os.stat(source)
+    except OSError:
+        return None
+    return (source, stat.st_mtime_ns, stat.st_size)
+
+
+def package_sources(folder: Path, found: list[Source]) -> None:
+    for entry in os.scandir(folder):
+        if entry.is_dir():
+            if entry.name != '__pycache__':
+                package_sources(Path(entry.path), found)
+        elif entry.name.endswith('.py'):
+            stat = entry.stat()
+            found.append((entry.path, stat.st_mtime_ns, stat.st_size))
+
+
+def package_checksum() -> int:
+    import zlib
+    found: list[Source] = []
+    package_sources(PACKAGE_FOLDER, found)
+    return zlib.crc32(repr(sorted(found)).encode())
+
+
+def field_values(named_tuple_cls: type[NamedTuple]) -> str:
+    """What the fields were given, a default like `Path.cwd()` differs from run to run. Flags are not included."""
+    values: list[Any] = []
+    for field_name in named_tuple_cls._fields:
+        unparsed = named_tuple_cls._field_defaults.get(field_name, None)
+        if hasattr(unparsed, 'flag_plan'):  # an UnparsedArgument, not imported here to keep this module light
+            values.append(tuple(getattr(unparsed, attribute) for attribute in ARG_ATTRIBUTES))
+        else:
+            values.append(unparsed)
+    return repr(values)
+
+
+def annotation_modules(annotation: Any, found: dict[str, None]) -> None:
+    """Add the modules of every type in `annotation`, including the enums of Literal values."""
+    found[annotation.__module__ if isinstance(annotation, type) else type(annotation).__module__] = None
+    for item in getattr(annotation, '__args__', ()):
+        annotation_modules(item, found)
+
+
+def cache_key(named_tuple_cls: type[NamedTuple]) -> Optional[CacheKey]:
+    """None if the class can not be cached, because it is not defined in a source file."""
+    if '<locals>' in named_tuple_cls.__qualname__:
+        return None
+    own = module_source(named_tuple_cls.__module__)
+    if own is None:
+        return None
+    modules: dict[str, None] = {}
+    for annotation in named_tuple_cls.__annotations__.values():
+        annotation_modules(annotation, modules)
+    modules.pop(named_tuple_cls.__module__, None)
+    sources = [source for source in map(module_source, modules) if source is not None]
+    return CacheKey(
+        version=CACHE_VERSION,
+        cache_tag=sys.implementation.cache_tag,
+        package=package_checksum(),
+        sources=(own, *sources),
+        qualname=named_tuple_cls.__qualname__,
+        fields=named_tuple_cls._fields,
+        values=field_values(named_tuple_cls),
+    )
+
+
+def cache_path(folder: Path, key: CacheKey) -> Path:
+    import zlib  # only names the file, the key inside it is what decides if the cache is valid
+    digest = zlib.crc32(f'{key.sources[0][0]}:{key.qualname}'.encode())
+    return folder / f'{key.qualname.replace('.', '_')}-{digest:08x}.pickle'
+
+
+def load_compiled_schema(named_tuple_cls: type[NamedTuple]) -> Optional[list['ParsedArgument[Any]']]:
+    """The arguments that were compiled for this class before, None if there are none or they are out of date."""
+    folder = cache_folder()
+    key = cache_key(named_tuple_cls)
+    if folder is None or key is None:
+        return None
+    with span('load_compiled_schema', category='schema'):
+        import pickle
+        try:
+            with cache_path(folder, key).open('rb') as file:
+                if pickle.load(file) != key:  # only plain tuples, the arguments are not unpickled unless it matches
+                    return None
+                return pickle.load(file)
+        except Exception:  # a cache that can not be read is the same as no cache
+            return None
+
+
+def save_compiled_schema(named_tuple_cls: type[NamedTuple], arguments: list['ParsedArgument[Any]']) -> None:
+    """Store freshly compiled arguments, this has to happen before anything changes their values."""
+    folder = cache_folder()
+    key = cache_key(named_tuple_cls)
+    if folder is None or key is None:
+        return
+    with span('save_compiled_schema', category='schema'):
+        import pickle
+        try:
+            data = (
+                pickle.dumps(tuple(key), protocol=pickle.HIGHEST_PROTOCOL)
+                + pickle.dumps(arguments, protocol=pickle.HIGHEST_PROTOCOL)
+            )
+        except (pickle.PicklingError, AttributeError, TypeError):  # e.g. options that are not importable
+            return
+        path = cache_path(folder, key)
+        try:
+            folder.mkdir(parents=True, exist_ok=True)
+            temporary = path.with_suffix('.tmp')
+            temporary.write_bytes(data)
+            temporary.replace(path)
+        except OSError:  # e.g. a read-only home directory, the schema is compiled again next time
+            pass
@@ -0,0 +1,51 @@
+from ..utils import SpecialKey
+
+from abc import (
+    ABC,
+    abstractmethod,
+)
+import sys
+
+from typing import Optional, TypeAlias
+
+
+__all__ = (
+    'InputEvent',
+    'InputBackend',
+    'get_input_backend',
+)
+
+
+InputEvent: TypeAlias = str | SpecialKey
+
+
+class InputBackend(ABC):
+    resized: bool  # True if the terminal was resized since the last `take_resized`
+    def __init__(self) -> None:
+        self.resized = False
+
+    def take_resized(self) -> bool:
+        """Return whether the terminal was resized since the last call."""
+        resized = self.resized
+        self.resized = False
+        return resized
+
+    def start(self) -> None:
+        """Prepare the terminal for reading single keys, this is called before the first read."""
+
+    def stop(self) -> None:
+        """Restore the terminal to how it was before `start`."""
+
+    @abstractmethod
+    def read_events(self, timeout: Optional[float] = None) -> list[InputEvent]:
+        """Block until there is input, a resize or a `timeout`, then return every event available. Raises KeyboardInterrupt on Ctrl+C."""
+        raise NotImplementedError
+
+
+def get_input_backend() -> InputBackend:
+    """Return the input backend for the current platform, its module is only imported when needed."""
+    if sys.platform == 'win32':
+        from .windows import WindowsInputBackend
+        return WindowsInputBackend()
+    from .posix import PosixInputBackend
+    return PosixInputBackend()
@@ -0,0 +1,286 @@
+from ..utils import SpecialKey
+from .base import (
+    InputBackend,
+    InputEvent,
+)
+
+import codecs
+import os
+import select
+import signal
+import sys
+import termios
+import time
+
+from typing import Any, Optional
+
+
+__all__ = (
+    'KeyDecoder',
+    'PosixInputBackend',
+)
+
+
+ESC: int = 0x1b
+SEQUENCES: dict[bytes, SpecialKey] = {
+    b'\x1b[A': SpecialKey.UP,
+    b'\x1b[B': SpecialKey.DOWN,
+    b'\x1b[C': SpecialKey.RIGHT,
+    b'\x1b[D': SpecialKey.LEFT,
+    b'\x1bOA': SpecialKey.UP,
+    b'\x1bOB': SpecialKey.DOWN,
+    b'\x1bOC': SpecialKey.RIGHT,
+    b'\x1bOD': SpecialKey.LEFT,
+    b'\x1b[1;5A': SpecialKey.CTRL_UP,
+    b'\x1b[1;5B': SpecialKey.CTRL_DOWN,
+    b'\x1b[1;5C': SpecialKey.CTRL_RIGHT,
+    b'\x1b[1;5D': SpecialKey.CTRL_LEFT,
+    b'\x1bOa': SpecialKey.CTRL_UP,  # rxvt
+    b'\x1bOb': SpecialKey.CTRL_DOWN,
+    b'\x1bOc': SpecialKey.CTRL_RIGHT,
+    b'\x1bOd': SpecialKey.CTRL_LEFT,
+    b'\x1b[3~': SpecialKey.DELETE,
+    b'\x1b[3;5~': SpecialKey.CTRL_DELETE,
+    b'\x1b[3^': SpecialKey.CTRL_DELETE,  # rxvt
+    b'\x1b\x7f': SpecialKey.CTRL_BACKSPACE,  # alt + backspace
+    b'\x1b': SpecialKey.ESCAPE,
+    b'\r': SpecialKey.ENTER,
+    b'\n': SpecialKey.ENTER,
+    b'\x7f': SpecialKey.BACKSPACE,
+    b'\x08': SpecialKey.CTRL_BACKSPACE,
+    b'\x17': SpecialKey.CTRL_BACKSPACE,  # ctrl + w
+    b'\x1a': SpecialKey.CTRL_Z,
+    b'\x19': SpecialKey.CTRL_Y,
+}
+PASTE_START: bytes = b'\x1b[200~'
+PASTE_END: bytes = b'\x1b[201~'
+ENABLE_BRACKETED_PASTE: str = '\033[?2004h'
+DISABLE_BRACKETED_PASTE: str = '\033[?2004l'
+NON_TEXT_CHARS: dict[int, None] = dict.fromkeys(
+    [*(c for c in range(0x20) if chr(c) not in '\t\n'), 0x7f],
+)  # removed from text with str.translate
+PREFIXES: frozenset[bytes] = frozenset(
+    sequence[:i]
+    for sequence in (*SEQUENCES, PASTE_START)
+    for i in range(1, len(sequence))
+)
+SINGLE_BYTES: frozenset[int] = frozenset(
+    sequence[0]
+    for sequence in SEQUENCES
+    if len(sequence) == 1
+)
+
+
+class KeyDecoder:
+    """Turns raw terminal bytes into text and SpecialKey events."""
+    pending: bytes
+    text_decoder: codecs.IncrementalDecoder
+    paste: Optional[list[bytes]]  # None when not inside a bracketed paste
+    def __init__(self) -> None:
+        self.pending = b''
+        self.text_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self.paste = None
+
+    def feed(
+        self,
+        data: bytes,
+        *,
+        final: bool = False,
+    ) -> list[InputEvent]:
+        data = self.pending + data
+        self.pending = b''
+        events: list[InputEvent] = []
+        text: list[str] = []
+        i: int = 0
+        while i < len(data):
+            if self.paste is not None:
+                end = data.find(PASTE_END, i)
+                if end == -1:
+                    keep = self.partial_paste_end_length(data) if not final else 0
+                    self.paste.append(data[i:len(data) - keep])
+                    self.pending = data[len(data) - keep:]
+                    break
+                self.paste.append(data[i:end])
+                text.append(self.finish_paste())
+                i = end + len(PASTE_END)
+                continue
+
+            byte = data[i]
+            if byte == 0x03:
+                raise KeyboardInterrupt
+            if byte != ESC and byte not in SINGLE_BYTES:
+                start = i
+                while i < len(data) and data[i] != ESC and data[i] != 0x03 and data[i] not in SINGLE_BYTES:
+                    i += 1
+                # A control byte can not be part of a character, so a character it cuts off is replaced right away.
+                text.append(self.text_decoder.decode(data[start:i], final=i < len(data)).translate(NON_TEXT_CHARS))
+                continue
+
+            end: int = i + 1
+            match: Optional[tuple[int, Optional[SpecialKey]]] = None  # a None key starts a paste
+            while True:
+                chunk = data[i:end]
+                if chunk in SEQUENCES:
+                    match = (end, SEQUENCES[chunk])
+                elif chunk == PASTE_START:
+                    match = (end, None)
+                if chunk not in PREFIXES or end >= len(data):
+                    break
+                end += 1
+            if data[i:end] in PREFIXES and end >= len(data) and not final:
+                self.pending = data[i:]
+                break
+            if match is None or (match[0] == i + 1 and byte == ESC and self.is_unknown_sequence(data, i)):
+                skipped = self.skip_unknown_sequence(data, i)
+                if skipped is None and not final:
+                    self.pending = data[i:]
+                    break
+                i = skipped if skipped is not None else len(data)
+                continue
+
+            i = match[0]
+            if match[1] is None:
+                self.paste = []
+                continue
+            if text:
+                events.append(''.join(text))
+                text.clear()
+            events.append(match[1])
+
+        if final:
+            text.append(self.text_decoder.decode(b'', final=True))  # a character that never finished becomes U+FFFD
+        if text:
+            events.append(''.join(text))
+        return [event for event in events if event != '']
+
+    def partial_paste_end_length(self, data: bytes) -> int:
+        """Return the length of the start of PASTE_END that `data` ends with."""
+        for length in range(min(len(PASTE_END) - 1, len(data)), 0, -1):
+            if data.endswith(PASTE_END[:length]):
+                return length
+        return 0
+
+    def finish_paste(self) -> str:
+        assert self.paste is not None
+        text = b''.join(self.paste).decode('utf-8', errors='replace')
+        self.paste = None
+        # Values are a single line, so a line break that was copied along at the end is dropped.
+        return text.replace('\r\n', '\n').replace('\r', '\n').translate(NON_TEXT_CHARS).rstrip('\n')
+
+    def is_unknown_sequence(self, data: bytes, i: int) -> bool:
+        return i + 1 < len(data) and data[i + 1] in b'[O'
+
+    def skip_unknown_sequence(self, data: bytes, i: int) -> Optional[int]:
+        """Return the index right after the CSI or SS3 sequence starting at i, None if it is incomplete."""
+        if i + 1 >= len(data):
+            return None
+        if data[i + 1] == ord('O'):
+            return i + 3 if i + 2 < len(data) else None
+        for j in range(i + 2, len(data)):
+            if 0x40 <= data[j] <= 0x7e:  # final byte
+                return j + 1
+        return None
+
+
+class PosixInputBackend(InputBackend):
+    fd: int
+    saved_mode: Optional[list[Any]]
+    decoder: KeyDecoder
+    wake_fds: Optional[tuple[int, int]]  # (read end, write end) of the pipe that wakes `select` on a resize
+    saved_handler: Any
+    ESCAPE_TIMEOUT: float = 0.05
+    """How long to wait for the rest of an escape sequence before treating ESC as the escape key."""
+    def __init__(self) -> None:
+        super().__init__()
+        self.fd = sys.stdin.fileno()
+        self.saved_mode = None
+        self.decoder = KeyDecoder()
+        self.wake_fds = None
+        self.saved_handler = None
+
+    def on_resize(self, signum: int, frame: Any) -> None:
+        self.resized = True
+        if self.wake_fds is not None:
+            try:
+                os.write(self.wake_fds[1], b'\0')
+            except BlockingIOError:
+                pass  # the pipe is full, `select` wakes up anyway
+
+    def watch_resize(self) -> None:
+        try:
+            self.saved_handler = signal.signal(signal.SIGWINCH, self.on_resize)
+        except ValueError:
+            return  # signal handlers can only be set from the main thread
+        self.wake_fds = os.pipe()
+        for fd in self.wake_fds:
+            os.set_blocking(fd, False)
+
+    def unwatch_resize(self) -> None:
+        if self.wake_fds is None:
+            return
+        signal.signal(signal.SIGWINCH, self.saved_handler)
+        for fd in self.wake_fds:
+            os.close(fd)
+        self.wake_fds = None
+        self.saved_handler = None
+
+    def start(self) -> None:
+        if self.saved_mode is not None or not os.isatty(self.fd):
+            return
+        self.saved_mode = termios.tcgetattr(self.fd)
+        mode = termios.tcgetattr(self.fd)
+        mode[0] &= ~(termios.IXON | termios.ICRNL)
+        mode[3] &= ~(termios.ECHO | termios.ICANON | termios.ISIG | termios.IEXTEN)
+        mode[6][termios.VMIN] = 1
+        mode[6][termios.VTIME] = 0
+        termios.tcsetattr(self.fd, termios.TCSADRAIN, mode)
+        self.watch_resize()
+        sys.stdout.write(ENABLE_BRACKETED_PASTE)
+        sys.stdout.flush()
+
+    def stop(self) -> None:
+        if self.saved_mode is None:
+            return
+        sys.stdout.write(DISABLE_BRACKETED_PASTE)
+        sys.stdout.flush()
+        termios.tcsetattr(self.fd, termios.TCSADRAIN, self.saved_mode)
+        self.saved_mode = None
+        self.unwatch_resize()
+
+    def read_available(self, timeout: Optional[float]) -> bytes:
+        """Wait up to `timeout` seconds for input, then read everything that is pending."""
+        watched: list[int] = [self.fd] if self.wake_fds is None else [self.fd, self.wake_fds[0]]
+        ready, _, _ = select.select(watched, [], [], timeout)
+        if self.wake_fds is not None and self.wake_fds[0] in ready:
+            while True:
+                try:
+                    if not os.read(self.wake_fds[0], 512):
+                        break
+                except BlockingIOError:
+                    break
+        if self.fd not in ready:
+            return b''
+        chunks: list[bytes] = []
+        while ready:
+            chunk = os.read(self.fd, 4096)
+            if not chunk:
+                if not chunks:
+                    raise EOFError
+                break
+            chunks.append(chunk)
+            ready, _, _ = select.select([self.fd], [], [], 0)
+        return b''.join(chunks)
+
+    def read_events(self, timeout: Optional[float] = None) -> list[InputEvent]:
+        self.start()
+        deadline: Optional[float] = None if timeout is None else time.monotonic() + timeout
+        events: list[InputEvent] = []
+        while len(events) == 0 and not self.resized:
+            remaining: Optional[float] = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                break
+            events.extend(self.decoder.feed(self.read_available(remaining)))
+            while self.decoder.pending:
+                more = self.read_available(self.ESCAPE_TIMEOUT)
+                events.extend(self.decoder.feed(more, final=not more))
+        return events
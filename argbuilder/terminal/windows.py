@@ -0,0 +1,66 @@
+from ..utils import (
+    SPECIAL_KEYS_NOTHING_BEFORE,
+    SpecialKey,
+)
+from .base import (
+    InputBackend,
+    InputEvent,
+)
+
+import msvcrt
+import os
+import time
+
+from typing import Optional
+
+
+__all__ = (
+    'WindowsInputBackend',
+)
+
+
+class WindowsInputBackend(InputBackend):
+    size: Optional[os.terminal_size]
+    POLL_INTERVAL: float = 0.05
+    """Windows has no resize signal, so the size is compared this often while waiting for a key."""
+    def __init__(self) -> None:
+        super().__init__()
+        self.size = None
+
+    def check_resized(self) -> bool:
+        try:
+            size = os.get_terminal_size()
+        except OSError:
+            return False
+        if self.size is not None and size != self.size:
+            self.resized = True
+        self.size = size
+        return self.resized
+
+    def read_event(self) -> Optional[InputEvent]:
+        byte = msvcrt.getch()
+        if byte == b'\x03':
+            raise KeyboardInterrupt
+        if byte == b'\xe0':
+            try:
+                return SpecialKey(msvcrt.getch())
+            except ValueError:
+                return None  # a key we do not handle, such as Home or End
+        if byte in SPECIAL_KEYS_NOTHING_BEFORE:
+            return SpecialKey(byte)
+        return byte.decode('cp437')
+
+    def read_events(self, timeout: Optional[float] = None) -> list[InputEvent]:
+        deadline: Optional[float] = None if timeout is None else time.monotonic() + timeout
+        while not msvcrt.kbhit():
+            if self.check_resized():
+                return []
+            if deadline is not None and time.monotonic() >= deadline:
+                return []
+            time.sleep(self.POLL_INTERVAL if deadline is None else max(0.0, min(self.POLL_INTERVAL, deadline - time.monotonic())))
+        events: list[InputEvent] = []
+        while len(events) == 0 or msvcrt.kbhit():
+            event = self.read_event()
+            if event is not None:
+                events.append(event)
+        return events
@@ -0,0 +1,110 @@
+from contextlib import contextmanager, nullcontext
+import os
+from pathlib import Path
+import time
+
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Iterator,
+    Optional,
+    TypeAlias,
+)
+
+
+__all__ = (
+    'TraceTarget',
+    'Tracer',
+    'span',
+    'counter',
+    'start_tracing',
+    'stop_tracing',
+)
+
+
+TraceTarget: TypeAlias = str | Path | Callable[[dict[str, Any]], None]
+TRACE_ENV: str = 'ARGBUILDER_TRACE'
+NULL_SPAN: ContextManager[None] = nullcontext()
+
+
+class Tracer:
+    """Records spans and counters as Chrome trace events."""
+    target: TraceTarget
+    events: list[dict[str, Any]]
+    pid: int
+    tid: int
+    started_at: float
+    def __init__(self, target: TraceTarget) -> None:
+        import threading
+        self.target = target
+        self.events = []
+        self.pid = os.getpid()
+        self.tid = threading.get_ident()
+        self.started_at = time.perf_counter()
+
+    def timestamp(self) -> float:
+        return (time.perf_counter() - self.started_at) * 1e6
+
+    def record(self, event: dict[str, Any]) -> None:
+        event['pid'] = self.pid
+        event['tid'] = self.tid
+        if callable(self.target):
+            self.target(event)
+        else:
+            self.events.append(event)
+
+    @contextmanager
+    def span(self, name: str, *, category: str) -> Iterator[None]:
+        start = self.timestamp()
+        try:
+            yield
+        finally:
+            self.record({'name': name, 'cat': category, 'ph': 'X', 'ts': start, 'dur': self.timestamp() - start})
+
+    def counter(self, name: str, **values: float) -> None:
+        self.record({'name': name, 'ph': 'C', 'ts': self.timestamp(), 'args': values})
+
+    def close(self) -> None:
+        if callable(self.target):
+            return
+        import json
+        Path(self.target).write_text(
+            json.dumps({'traceEvents': self.events, 'displayTimeUnit': 'ms'}),
+            encoding='utf-8',
+        )
+
+
+tracer: Optional[Tracer] = None
+
+
+def span(name: str, *, category: str) -> ContextManager[None]:
+    """Time the block as a span, this costs next to nothing while tracing is off."""
+    if tracer is None:
+        return NULL_SPAN
+    return tracer.span(name, category=category)
+
+
+def counter(name: str, **values: float) -> None:
+    if tracer is not None:
+        tracer.counter(name, **values)
+
+
+def start_tracing(target: Optional[TraceTarget] = None) -> Optional[Tracer]:
+    """Start tracing to `target`, or to the file named by $ARGBUILDER_TRACE. Does nothing if neither is given."""
+    global tracer
+    if target is None:
+        target = os.environ.get(TRACE_ENV) or None
+    if target is None:
+        return None
+    tracer = Tracer(target)
+    return tracer
+
+
+def stop_tracing() -> None:
+    """Stop tracing and write the trace file, if there is one."""
+    global tracer
+    if tracer is None:
+        return
+    tracer.close()
+    tracer = None
@@ -1,5 +1,5 @@
 from .arguments import ParsedArgument
-from .flags import Flag
+from .flags import Flag, FlagPlan
 from .utils import (
     AllowedTypes,
     MISSING,
@@ -20,10 +20,26 @@ from types import UnionType
 
 
 __all__ = (
+    'ParsedArgumentList',
     'UnparsedArgument',
 )
 
 
+class ParsedArgumentList(list[ParsedArgument[AllowedTypes]]):
+    """The arguments compiled so far, indexed for the checks of the next one so a schema compiles in linear time."""
+    names: set[str]
+    has_optional: bool  # whether any of the arguments has a default
+    def __init__(self) -> None:
+        super().__init__()
+        self.names = set()
+        self.has_optional = False
+
+    def append(self, argument: ParsedArgument[AllowedTypes]) -> None:
+        super().append(argument)
+        self.names.add(argument.name)
+        self.has_optional = self.has_optional or not argument.required
+
+
 class UnparsedArgument:
     description: Optional[str]
     _type: Optional[type[AllowedTypes]]
@@ -33,6 +49,7 @@ class UnparsedArgument:
     allow_none: Optional[bool]
     options: Optional[list[AllowedTypes]]
     flags: list[Flag]
+    flag_plan: FlagPlan
     remember: Optional[bool | int]
     field_name: str
     prefix: Optional[str]
@@ -124,7 +141,8 @@ class UnparsedArgument:
             options: list[AllowedTypes] = list(self._type.__args__)  # type: ignore
             if self.options is not None:
                 smallest, largest = min((self.options, options), key=len), max((self.options, options), key=len)
-                if not all(o in largest for o in smallest):
+                largest_set: set[AllowedTypes] = set(largest)
+                if not all(o in largest_set for o in smallest):
                     raise ValueError(f'Options mismatch {self.options!r} {options!r}')
             else:
                 self.options = options
@@ -140,12 +158,12 @@ class UnparsedArgument:
         *,
         named_tuple_cls: type[NamedTuple],
         index: int,
-        parsed_arguments: list[ParsedArgument[AllowedTypes]],
+        parsed_arguments: ParsedArgumentList,
     ) -> None:
         self.field_name = named_tuple_cls._fields[index]
         if self.name is None:
             self.name = self.field_name
-        if any(argument.name == self.name for argument in parsed_arguments):
+        if self.name in parsed_arguments.names:
             raise ValueError('Duplicate argument name')
 
     def _check_default(
@@ -153,12 +171,11 @@ class UnparsedArgument:
         *,
         named_tuple_cls: type[NamedTuple],
         index: int,
-        parsed_arguments: list[ParsedArgument[AllowedTypes]],
+        parsed_arguments: ParsedArgumentList,
     ) -> None:
         if not self.has_default:
-            for parsed in parsed_arguments:
-                if not parsed.required:
-                    raise ValueError('Cannot have non-required argument after required argument')
+            if parsed_arguments.has_optional:
+                raise ValueError('Cannot have non-required argument after required argument')
             return
         assert self._type is not None
         if self.allow_none and self.default is None:
@@ -228,13 +245,14 @@ class UnparsedArgument:
             allowed_argument_types = flag.allowed_parsed_argument_types()
             if allowed_argument_types is not None and parsed_cls not in allowed_argument_types:
                 raise ValueError(f'Flag {flag!r} does not support {parsed_cls.__name__} arguments')
+        self.flag_plan = FlagPlan(self.flags)
 
     def check_everything(
         self,
         *,
         named_tuple_cls: type[NamedTuple],
         index: int,
-        parsed_arguments: list[ParsedArgument[AllowedTypes]],
+        parsed_arguments: ParsedArgumentList,
     ) -> None:
         for check in (
             self._check_name,
@@ -256,7 +274,7 @@ class UnparsedArgument:
         *,
         named_tuple_cls: type[NamedTuple],
         index: int,
-        parsed_arguments: list[ParsedArgument[AllowedTypes]],
+        parsed_arguments: ParsedArgumentList,
         parsed_cls: type[ParsedArgument[AllowedTypes]],
     ) -> None:
         for check in (
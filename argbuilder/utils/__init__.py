@@ -1,4 +1,19 @@
-from .colour import *  # noqa: F403
 from .missing import *  # noqa: F403
 from .allowed_types import *  # noqa: F403
 from .special_key import *  # noqa: F403
+from .text_buffer import *  # noqa: F403
+
+import importlib
+
+from typing import TYPE_CHECKING, Any
+if TYPE_CHECKING:
+    from ._colour import *  # noqa: F403
+
+
+def __getattr__(name: str) -> Any:
+    """The colour helpers are only needed to draw, so `._colour` is imported the first time one is used."""
+    module = importlib.import_module('._colour', __name__)
+    if name not in module.__all__:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals().update((n, getattr(module, n)) for n in module.__all__)
+    return globals()[name]
@@ -0,0 +1,230 @@
+from enum import Enum
+import os
+from typing import Iterable, NamedTuple, Optional, TypeAlias
+
+
+__all__ = (
+    'ColourDepth',
+    'Style',
+    'Styled',
+    'random_rgb_neon_colour',
+    'hex_to_rgb',
+    'get_colour_depth',
+    'set_colour_depth',
+    'colour',
+)
+
+
+RGB: TypeAlias = tuple[int, int, int]
+RESET: str = '\033[0m'
+
+
+class ColourDepth(Enum):
+    TRUE_COLOUR = 24
+    COLOURS_256 = 8
+    COLOURS_16 = 4
+
+
+COLOUR_DEPTH_ENV: str = 'ARGBUILDER_COLOUR_DEPTH'
+COLOUR_DEPTH_NAMES: dict[str, ColourDepth] = {
+    'truecolor': ColourDepth.TRUE_COLOUR,
+    '24bit': ColourDepth.TRUE_COLOUR,
+    '256': ColourDepth.COLOURS_256,
+    '16': ColourDepth.COLOURS_16,
+}
+CUBE_LEVELS: tuple[int, ...] = (0, 95, 135, 175, 215, 255)  # the 6x6x6 cube of the 256 colour palette
+BASIC_COLOURS: tuple[RGB, ...] = (  # xterm's defaults for the 16 colour palette
+    (0, 0, 0), (205, 0, 0), (0, 205, 0), (205, 205, 0), (0, 0, 238), (205, 0, 205), (0, 205, 205), (229, 229, 229),
+    (127, 127, 127), (255, 0, 0), (0, 255, 0), (255, 255, 0), (92, 92, 255), (255, 0, 255), (0, 255, 255), (255, 255, 255),
+)
+
+PALETTE: dict[str, RGB] = {}  # {hex: rgb}
+PARAMETERS: dict[tuple[RGB, bool], str] = {}  # {(rgb, background): SGR parameters at the current depth}
+colour_depth: Optional[ColourDepth] = None  # None until it is first needed
+
+
+def detect_colour_depth() -> ColourDepth:
+    """True colour, unless $ARGBUILDER_COLOUR_DEPTH asks for 256 or 16 colours. $TERM often claims less than the terminal can do."""
+    return COLOUR_DEPTH_NAMES.get(os.environ.get(COLOUR_DEPTH_ENV, '').strip().lower(), ColourDepth.TRUE_COLOUR)
+
+
+def get_colour_depth() -> ColourDepth:
+    global colour_depth
+    if colour_depth is None:
+        colour_depth = detect_colour_depth()
+    return colour_depth
+
+
+def set_colour_depth(depth: ColourDepth) -> None:
+    """Override the detected colour depth, text that was already rendered keeps its colours."""
+    global colour_depth
+    colour_depth = depth
+    PARAMETERS.clear()
+
+
+def distance(a: RGB, b: RGB) -> int:
+    return sum((x - y) ** 2 for x, y in zip(a, b))
+
+
+def nearest_256(rgb: RGB) -> int:
+    cube = tuple(min(range(6), key=lambda i: abs(CUBE_LEVELS[i] - c)) for c in rgb)
+    cube_rgb: RGB = tuple(CUBE_LEVELS[i] for i in cube)  # type: ignore
+    grey_index = min(23, max(0, round((sum(rgb) / 3 - 8) / 10)))
+    grey = 8 + 10 * grey_index
+    if distance((grey, grey, grey), rgb) < distance(cube_rgb, rgb):
+        return 232 + grey_index
+    return 16 + 36 * cube[0] + 6 * cube[1] + cube[2]
+
+
+def nearest_16(rgb: RGB) -> int:
+    return min(range(16), key=lambda i: distance(BASIC_COLOURS[i], rgb))
+
+
+def colour_parameters(
+    rgb: Optional[RGB],
+    *,
+    background: bool,
+) -> str:
+    """The SGR parameters that select `rgb` at the current colour depth, or the default colour for None."""
+    if rgb is None:
+        return '49' if background else '39'
+    parameters = PARAMETERS.get((rgb, background), None)
+    if parameters is not None:
+        return parameters
+    depth = get_colour_depth()
+    if depth is ColourDepth.TRUE_COLOUR:
+        parameters = f'{48 if background else 38};2;{rgb[0]};{rgb[1]};{rgb[2]}'
+    elif depth is ColourDepth.COLOURS_256:
+        parameters = f'{48 if background else 38};5;{nearest_256(rgb)}'
+    else:
+        index = nearest_16(rgb)
+        parameters = str((40 if background else 30) + index % 8 + (60 if index >= 8 else 0))
+    PARAMETERS[(rgb, background)] = parameters
+    return parameters
+
+
+class Style(NamedTuple):
+    foreground: Optional[RGB] = None
+    background: Optional[RGB] = None
+    bold: bool = False
+
+    def inherit(self, outer: 'Style') -> 'Style':
+        """This style inside `outer`, whatever this style does not set comes from `outer`."""
+        return Style(
+            foreground=self.foreground if self.foreground is not None else outer.foreground,
+            background=self.background if self.background is not None else outer.background,
+            bold=self.bold or outer.bold,
+        )
+
+    def transition(self, new: 'Style') -> str:
+        """The escape sequence that changes the terminal from this style to `new`, with only what differs."""
+        if new == PLAIN:
+            return RESET
+        parameters: list[str] = []
+        if self.bold != new.bold:
+            parameters.append('1' if new.bold else '22')
+        foreground = colour_parameters(new.foreground, background=False)
+        if foreground != colour_parameters(self.foreground, background=False):
+            parameters.append(foreground)
+        background = colour_parameters(new.background, background=True)
+        if background != colour_parameters(self.background, background=True):
+            parameters.append(background)
+        if not parameters:
+            return ''
+        return f'\033[{';'.join(parameters)}m'
+
+
+PLAIN: Style = Style()
+
+
+class Styled:
+    """Text made of runs that each remember their style."""
+    runs: tuple[tuple[str, Style], ...]
+    width: int
+    _rendered: Optional[str]
+    def __init__(self, runs: Iterable[tuple[str, Style]] = ()) -> None:
+        self.runs = tuple(run for run in runs if run[0])
+        self.width = sum(len(text) for text, _ in self.runs)
+        self._rendered = None
+
+    @staticmethod
+    def of(text: 'str | Styled') -> 'Styled':
+        if isinstance(text, Styled):
+            return text
+        return Styled(((text, PLAIN),))
+
+    @staticmethod
+    def concat(parts: Iterable['str | Styled']) -> 'Styled':
+        return Styled(run for part in parts for run in Styled.of(part).runs)
+
+    def restyle(self, style: Style) -> 'Styled':
+        """Style every run with `style`, the styles the runs already have take precedence."""
+        return Styled((text, inner.inherit(style)) for text, inner in self.runs)
+
+    def __add__(self, other: 'str | Styled') -> 'Styled':
+        return Styled(self.runs + Styled.of(other).runs)
+
+    def __radd__(self, other: str) -> 'Styled':
+        return Styled(Styled.of(other).runs + self.runs)
+
+    def __len__(self) -> int:
+        return self.width
+
+    def __str__(self) -> str:
+        if self._rendered is None:
+            parts: list[str] = []
+            current: Style = PLAIN
+            for text, style in self.runs:
+                if style != current:
+                    parts.append(current.transition(style))
+                    current = style
+                parts.append(text)
+            if current != PLAIN:
+                parts.append(RESET)
+            self._rendered = ''.join(parts)
+        return self._rendered
+
+    def __repr__(self) -> str:
+        return f'Styled({self.runs!r})'
+
+
+def random_rgb_neon_colour() -> tuple[int, int, int]:
+    import colorsys
+    import random
+    rgb = colorsys.hsv_to_rgb(random.random(), 0.7, 1.0)
+    return tuple(int(c * 255) for c in rgb)  # type: ignore
+
+
+def hex_to_rgb(hex: str) -> RGB:
+    """Parse `#rrggbb`, every colour is only parsed once."""
+    rgb = PALETTE.get(hex, None)
+    if rgb is None:
+        digits = hex.lstrip('#')
+        if len(digits) != 6:
+            raise ValueError('Hex must be 6 characters long')
+        rgb = tuple(int(digits[i:i+2], 16) for i in (0, 2, 4))  # type: ignore
+        PALETTE[hex] = rgb
+    return rgb
+
+
+def colour(
+    text: str | Styled,
+    *,
+    rgb: Optional[tuple[int, int, int]] = None,
+    hex: Optional[str] = None,
+    background_rgb: Optional[tuple[int, int, int]] = None,
+    background_hex: Optional[str] = None,
+    bold: bool = False,
+) -> Styled:
+    if rgb is None and hex is None:
+        raise ValueError('Either rgb or hex must be provided')
+    if rgb is not None and hex is not None:
+        raise ValueError('Both rgb and hex cannot be provided')
+    if hex is not None:
+        rgb = hex_to_rgb(hex)
+    if background_rgb is None and background_hex is not None:
+        try:
+            background_rgb = hex_to_rgb(background_hex)
+        except ValueError:
+            raise ValueError('Background hex must be 6 characters long') from None
+    return Styled.of(text).restyle(Style(foreground=rgb, background=background_rgb, bold=bold))
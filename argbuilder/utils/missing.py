@@ -21,5 +21,8 @@ class MissingSentinel:
     def __repr__(self) -> str:
         return '...'
 
+    def __reduce__(self) -> str:
+        return 'MISSING'  # unpickles to the module's own instance, so `is MISSING` keeps working
+
 
 MISSING: Any = MissingSentinel()  # type: ignore
@@ -0,0 +1,107 @@
+__all__ = (
+    'TextBuffer',
+)
+
+
+class TextBuffer:
+    """An editable string that makes inserting and deleting at the cursor cheap."""
+    _string: str  # the text as of `_string_revision`
+    _string_revision: int
+    _pending: list[tuple[int, int, str]]  # (index, removed, inserted) edits made after `_string`, only without a gap
+    _before: list[str]  # characters before the gap
+    _after: list[str]  # characters after the gap, last character first
+    _has_gap: bool  # True if `_before` and `_after` hold the text instead of `_string` and `_pending`
+    _length: int
+    revision: int  # changes with every edit, cheaper to compare than the text itself
+    MAX_PENDING_EDITS: int = 8  # a join costs about as much as replaying this many edits on a long text
+    def __init__(self, text: str = '') -> None:
+        self.revision = 0
+        self.set(text)
+
+    def set(self, text: str) -> None:
+        self.revision += 1
+        self._string = text
+        self._string_revision = self.revision
+        self._pending = []
+        self._before = []
+        self._after = []
+        self._has_gap = False
+        self._length = len(text)
+
+    def __str__(self) -> str:
+        if self._string_revision != self.revision:
+            if self._has_gap:
+                self._string = ''.join(self._before) + ''.join(reversed(self._after))
+                self._before = []
+                self._after = []
+                self._has_gap = False
+            else:
+                string = self._string
+                for index, removed, inserted in self._pending:
+                    string = string[:index] + inserted + string[index + removed:]
+                self._string = string
+            self._pending = []
+            self._string_revision = self.revision
+        return self._string
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _edit(self, index: int, removed: int, inserted: str) -> None:
+        if not self._has_gap and len(self._pending) >= self.MAX_PENDING_EDITS:
+            string = str(self)  # replaying more edits would cost more than one join
+            self._before = list(string[:index])
+            self._after = list(reversed(string[index:]))
+            self._has_gap = True
+        if self._has_gap:
+            self._move_gap(index)
+            if removed:
+                del self._after[-removed:]
+            self._before.extend(inserted)
+        else:
+            self._pending.append((index, removed, inserted))
+        self.revision += 1
+        self._length += len(inserted) - removed
+
+    def _move_gap(self, index: int) -> None:
+        if index < len(self._before):
+            moved = self._before[index:]
+            del self._before[index:]
+            moved.reverse()
+            self._after.extend(moved)
+        elif index > len(self._before):
+            count = index - len(self._before)
+            moved = self._after[-count:]
+            del self._after[-count:]
+            moved.reverse()
+            self._before.extend(moved)
+
+    def insert(self, index: int, text: str) -> None:
+        if text:
+            self._edit(index, 0, text)
+
+    def delete(self, index: int, length: int) -> str:
+        """Delete `length` characters starting at `index` and return them."""
+        if length <= 0:
+            return ''
+        removed = self.slice(index, index + length)
+        self._edit(index, len(removed), '')
+        return removed
+
+    def slice(self, start: int, end: int) -> str:
+        """Return the text between `start` and `end`, without joining the whole text if there is a gap."""
+        if not self._has_gap:
+            return str(self)[start:end]
+        start = max(0, start)
+        end = min(len(self), end)
+        if start >= end:
+            return ''
+        split = len(self._before)
+        parts: list[str] = []
+        if start < split:
+            parts.append(''.join(self._before[start:min(end, split)]))
+        if end > split:
+            after_start = len(self._after) - (end - split)
+            after_end = len(self._after) - max(0, start - split)
+            parts.append(''.join(reversed(self._after[after_start:after_end])))
+        return ''.join(parts)
@@ -0,0 +1,41 @@
+from argbuilder.engine import Engine
+from argbuilder import remember
+from argbuilder.remember import RememberMode
+
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from typing import Any, NamedTuple
+
+
+class IsolatedTestCase(unittest.TestCase):
+    """Keeps the memory files of every engine in a temporary folder, away from the package and the user's memory."""
+    def setUp(self) -> None:
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        patcher = mock.patch.object(remember, 'MEMORY_FOLDER', Path(folder.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+def make_engine(named_tuple_cls: type[NamedTuple], *, argv: tuple[str, ...] = ()) -> Engine[Any]:
+    """A headless engine for `named_tuple_cls`, reading `argv`, for use in an `IsolatedTestCase`."""
+    before = sys.argv
+    sys.argv = ['test', *argv]
+    try:
+        return Engine.from_named_tuple_cls(
+            named_tuple_cls,
+            name='test',
+            description='test',
+            author='test',
+            remember_mode=(RememberMode.NONE, -1),
+        )
+    finally:
+        sys.argv = before
+
+
+def string_values(engine: Engine[Any]) -> list[str]:
+    return [argument.string_value for argument in engine.arguments]
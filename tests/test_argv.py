@@ -0,0 +1,53 @@
+from argbuilder import arg
+from .support import IsolatedTestCase, make_engine
+
+import unittest
+
+from typing import NamedTuple, Optional
+
+
+class Schema(NamedTuple):
+    number: int = arg(default=0)
+    text: str = arg(default='')
+    verbose: bool = arg(default=False)
+    label_of_thing: Optional[str] = arg(default=None)
+    level: int = arg(default=1)
+
+
+def parse(*argv: str) -> dict[str, str]:
+    engine = make_engine(Schema)
+    return {argument.name: value for argument, value in engine.argv_table.parse(list(argv)).items()}
+
+
+class ArgvTest(IsolatedTestCase):
+    def test_long_options(self) -> None:
+        self.assertEqual(parse('--number', '3', '--text=hi', '--label-of-thing', 'x'), {'number': '3', 'text': 'hi', 'label_of_thing': 'x'})
+
+    def test_prefixes(self) -> None:
+        self.assertEqual(parse('--num', '3', '--te', 'hi', '--lev', '2'), {'number': '3', 'text': 'hi', 'level': '2'})
+        with self.assertRaisesRegex(ValueError, 'Ambiguous'):
+            parse('--l', '3')
+
+    def test_short_options(self) -> None:
+        self.assertEqual(parse('-n3', '-v', '-t', 'hi'), {'number': '3', 'verbose': '1', 'text': 'hi'})
+        self.assertEqual(parse('-vn', '3'), {'verbose': '1', 'number': '3'})
+
+    def test_dash_values_are_positional(self) -> None:
+        self.assertEqual(parse('-5', '-foo'), {'number': '-5', 'text': '-foo'})
+        self.assertEqual(parse('--text', '-foo'), {'text': '-foo'})
+        self.assertEqual(parse('-n', '-.5'), {'number': '-.5'})
+
+    def test_everything_after_double_dash_is_positional(self) -> None:
+        self.assertEqual(parse('--', '-n', '--text'), {'number': '-n', 'text': '--text'})
+
+    def test_errors(self) -> None:
+        with self.assertRaisesRegex(ValueError, 'more than once'):
+            parse('--number', '1', '-n', '2')
+        with self.assertRaisesRegex(ValueError, 'Invalid argument'):
+            parse('--unknown', '1')
+        with self.assertRaisesRegex(ValueError, 'Too many positional'):
+            parse('1', '2', '3', '4', '5', '6')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+from argbuilder.bench import dump_keys, load_keys, run_benchmark, synthetic_keys
+from argbuilder.bench.__main__ import main
+from argbuilder.utils import SpecialKey
+from .support import IsolatedTestCase
+
+import contextlib
+import io
+import json
+from pathlib import Path
+import tempfile
+import unittest
+
+
+class BenchTest(IsolatedTestCase):
+    def test_synthetic_keys_are_reproducible(self) -> None:
+        keys = synthetic_keys(300, seed=7)
+        self.assertEqual(keys, synthetic_keys(300, seed=7))
+        self.assertNotEqual(keys, synthetic_keys(300, seed=8))
+        self.assertNotIn(SpecialKey.ENTER, keys)
+
+    def test_recorded_keys_round_trip(self) -> None:
+        keys = ['a', SpecialKey.CTRL_Z, 'pasted text', SpecialKey.DOWN]
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'keys.json'
+            dump_keys(keys, path)
+            self.assertEqual(load_keys(path), keys)
+
+    def test_replay(self) -> None:
+        result = run_benchmark(5, synthetic_keys(50), terminal_size=(80, 24))
+        self.assertEqual((result['fields'], result['keys']), (5, 50))
+        self.assertGreater(result['first_frame_bytes'], 0)
+        self.assertGreater(result['model_us']['max'], 0)
+        self.assertIn('peak_alloc_bytes_per_key', result)
+
+    def test_command_line(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'results.json'
+            with contextlib.redirect_stdout(io.StringIO()) as stdout:
+                status = main(['--sizes', '3,7', '--keys', '20', '--no-alloc', '--json', str(path)])
+            self.assertEqual(status, 0)
+            self.assertEqual(len(stdout.getvalue().splitlines()), 2)
+            results = json.loads(path.read_text(encoding='utf-8'))['results']
+        self.assertEqual([result['fields'] for result in results], [3, 7])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+from argbuilder.utils import _colour
+from argbuilder.utils import ColourDepth, Styled, colour, get_colour_depth, set_colour_depth
+
+import os
+import re
+import unittest
+from unittest import mock
+
+
+class ColourDepthTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.addCleanup(set_colour_depth, get_colour_depth())
+        self.addCleanup(_colour.PARAMETERS.clear)
+
+    def detect(self, **environ: str) -> ColourDepth:
+        with mock.patch.dict(os.environ, environ, clear=True):
+            return _colour.detect_colour_depth()
+
+    def test_true_colour_unless_asked_otherwise(self) -> None:
+        self.assertIs(self.detect(), ColourDepth.TRUE_COLOUR)
+        self.assertIs(self.detect(TERM='xterm-256color'), ColourDepth.TRUE_COLOUR)
+        self.assertIs(self.detect(TERM='linux'), ColourDepth.TRUE_COLOUR)
+        self.assertIs(self.detect(ARGBUILDER_COLOUR_DEPTH='256', TERM='xterm-256color', COLORTERM='truecolor'), ColourDepth.COLOURS_256)
+        self.assertIs(self.detect(ARGBUILDER_COLOUR_DEPTH='16'), ColourDepth.COLOURS_16)
+        self.assertIs(self.detect(ARGBUILDER_COLOUR_DEPTH='bogus'), ColourDepth.TRUE_COLOUR)
+
+    def test_quantised_parameters(self) -> None:
+        set_colour_depth(ColourDepth.COLOURS_256)
+        self.assertIn('\033[38;5;', str(colour('x', hex='#ff0000')))
+        set_colour_depth(ColourDepth.COLOURS_16)
+        self.assertIn('\033[91m', str(colour('x', hex='#ff0000')))
+        set_colour_depth(ColourDepth.TRUE_COLOUR)
+        self.assertIn('\033[38;2;255;0;0m', str(colour('x', hex='#ff0000')))
+
+    def test_only_changed_attributes_are_emitted(self) -> None:
+        set_colour_depth(ColourDepth.TRUE_COLOUR)
+        red = colour('a', hex='#ff0000')
+        self.assertEqual(str(red + red), '\033[38;2;255;0;0maa\033[0m')
+        self.assertEqual(str(red + colour('b', hex='#ff0000', bold=True)), '\033[38;2;255;0;0ma\033[1mb\033[0m')
+        self.assertEqual(str(colour('a', hex='#ff0000', bold=True) + red), '\033[1;38;2;255;0;0ma\033[22ma\033[0m')
+        self.assertEqual(str(red + 'plain'), '\033[38;2;255;0;0ma\033[0mplain')
+
+
+class StyledWidthTest(unittest.TestCase):
+    def visible_length(self, styled: Styled) -> int:
+        return len(re.sub(r'\033\[[0-9;]*m', '', str(styled)))
+
+    def test_width_ignores_escapes(self) -> None:
+        inner = colour('\u276f name', hex='#0095e9', bold=True)
+        line = Styled.concat((' ', inner, '  ', colour(inner + ' \u2026', hex='#545454', background_hex='#ff0000')))
+        for styled in (inner, line, line + 'tail', 'head' + line):
+            self.assertEqual(styled.width, self.visible_length(styled))
+            self.assertEqual(len(styled), styled.width)
+
+    def test_outer_style_only_fills_in(self) -> None:
+        inner = colour('x', hex='#ff0000')
+        outer = colour(inner + 'y', hex='#00ff00', bold=True)
+        self.assertEqual([style.foreground for _, style in outer.runs], [(255, 0, 0), (0, 255, 0)])
+        self.assertTrue(all(style.bold for _, style in outer.runs))
+
+
+if __name__ == '__main__':
+    unittest.main()
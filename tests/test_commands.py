@@ -0,0 +1,83 @@
+from argbuilder import arg
+from argbuilder.command import CommandManager, EditCommand
+from argbuilder.command.command import MERGE_WINDOW
+from argbuilder.utils import SpecialKey
+from .support import IsolatedTestCase, make_engine, string_values
+
+import unittest
+from unittest import mock
+
+from typing import Any, Iterable, NamedTuple
+
+
+class Schema(NamedTuple):
+    text: str = arg()
+
+
+class CommandTest(IsolatedTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.now = 1000.0
+        patcher = mock.patch('argbuilder.command.command.time.monotonic', side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.engine = make_engine(Schema)
+
+    def type(self, events: Iterable[Any], *, gap: float = 0.05) -> None:
+        """Feed every event on its own, `gap` seconds apart."""
+        for event in events:
+            self.now += gap
+            self.engine.feed([event])
+
+    def steps(self) -> int:
+        return len(self.engine.command_manager.undo_stack)
+
+    def test_typing_merges_within_the_window(self) -> None:
+        self.type('abc')
+        self.assertEqual(self.steps(), 1)
+        self.type('d', gap=MERGE_WINDOW * 2)
+        self.assertEqual(self.steps(), 2)
+
+    def test_new_word_starts_a_new_step(self) -> None:
+        self.type('ab cd')
+        self.assertEqual(self.steps(), 2)
+        self.engine.feed([SpecialKey.CTRL_Z])
+        self.assertEqual(string_values(self.engine), ['ab '])
+
+    def test_backspace_and_delete_merge(self) -> None:
+        self.type(['abcdef'])
+        self.now += MERGE_WINDOW * 2
+        self.type([SpecialKey.BACKSPACE] * 2)
+        self.assertEqual(self.steps(), 2)
+        self.type([SpecialKey.LEFT, SpecialKey.LEFT])
+        self.now += MERGE_WINDOW * 2
+        self.type([SpecialKey.DELETE] * 2)
+        self.assertEqual(string_values(self.engine), ['ab'])
+        self.assertEqual(self.steps(), 3)
+        self.engine.feed([SpecialKey.CTRL_Z])
+        self.assertEqual(string_values(self.engine), ['abcd'])
+
+    def test_merged_length_is_capped(self) -> None:
+        self.type('x' * (EditCommand.MAX_MERGED_LENGTH + 10))
+        self.assertEqual(self.steps(), 2)
+
+    def test_history_is_capped_in_bytes(self) -> None:
+        manager = CommandManager(max_bytes=4096)
+        self.engine.command_manager = manager
+        self.type(['a' * 100] * 200, gap=MERGE_WINDOW * 2)
+        self.assertLessEqual(manager.used_bytes, manager.max_bytes)
+        self.assertGreater(self.steps(), 1)
+        self.assertLess(self.steps(), 200)
+        self.assertEqual(manager.used_bytes, sum(command.size() for command in manager.undo_stack))
+        for _ in range(200):
+            self.engine.feed([SpecialKey.CTRL_Z])
+        self.assertEqual(len(string_values(self.engine)[0]), 100 * (200 - len(manager.redo_stack)))
+
+    def test_wall_clock_jump_does_not_break_merging(self) -> None:
+        with mock.patch('time.time', side_effect=[0.0, -3600.0, 3600.0] * 10):
+            self.type('abc')
+        self.assertEqual(self.steps(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+from argbuilder import arg
+from argbuilder.engine import ArgumentSnapshot, EngineSnapshot
+from argbuilder.utils import SpecialKey
+from .support import IsolatedTestCase, make_engine
+
+import subprocess
+import sys
+import unittest
+
+from typing import NamedTuple
+
+
+class Schema(NamedTuple):
+    name: str = arg()
+    count: int = arg(default=1)
+
+
+class EngineTest(IsolatedTestCase):
+    def test_keys_lead_to_a_snapshot(self) -> None:
+        engine = make_engine(Schema)
+        self.assertFalse(engine.snapshot().arguments[0].is_valid)
+        engine.feed(['ab', SpecialKey.BACKSPACE, 'c', SpecialKey.DOWN, SpecialKey.BACKSPACE, '42'])
+        self.assertEqual(engine.snapshot(), EngineSnapshot(
+            index=1,
+            inner_index=2,
+            finished=False,
+            arguments=(
+                ArgumentSnapshot(field_name='name', string_value='ac', is_none=False, is_valid=True),
+                ArgumentSnapshot(field_name='count', string_value='42', is_none=False, is_valid=True),
+            ),
+        ))
+
+    def test_enter_finishes_once_everything_is_valid(self) -> None:
+        engine = make_engine(Schema)
+        engine.feed([SpecialKey.ENTER])
+        self.assertFalse(engine.finished)
+        engine.feed(['me', SpecialKey.ENTER, 'ignored'])
+        self.assertTrue(engine.finished)
+        self.assertEqual(engine.create_named_tuple(), Schema(name='me', count=1))
+
+    def test_no_terminal_is_imported(self) -> None:
+        modules = subprocess.run(
+            [sys.executable, '-c', 'import sys, argbuilder.engine; print(*sorted(sys.modules))'],
+            capture_output=True, text=True, check=True,
+        ).stdout.split()
+        for module in ('argbuilder.builder', 'argbuilder.renderer', 'argbuilder.terminal', 'termios', 'msvcrt'):
+            self.assertNotIn(module, modules)
+
+
+if __name__ == '__main__':
+    unittest.main()
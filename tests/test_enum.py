@@ -0,0 +1,60 @@
+from argbuilder import arg
+from .support import IsolatedTestCase, make_engine
+
+from enum import Enum
+import unittest
+
+from typing import Any, NamedTuple, Optional
+
+
+class Colour(Enum):
+    RED = 1
+    REDDISH = 2
+    GREEN = 3
+    BLUE = 'b'
+
+
+Big = Enum('Big', {f'MEMBER_{i}': i for i in range(1000)})  # type: ignore
+
+
+class Schema(NamedTuple):
+    colour: Colour = arg(default=Colour.GREEN)
+    big: Big = arg(default=Big['MEMBER_0'])  # type: ignore
+
+
+class EnumIndexTest(IsolatedTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.engine = make_engine(Schema)
+
+    def parse(self, index: int, string_value: str) -> Optional[Any]:
+        argument = self.engine.arguments[index]
+        argument.string_value = string_value
+        argument.invalidate()
+        try:
+            return argument.get_value(builder=self.engine)
+        except ValueError:
+            return None
+
+    def test_lookup_order(self) -> None:
+        self.assertIs(self.parse(0, 'RED'), Colour.RED)  # exact name, although REDDISH starts with it
+        self.assertIs(self.parse(0, '3'), Colour.GREEN)
+        self.assertIs(self.parse(0, 'green'), Colour.GREEN)
+        self.assertIs(self.parse(0, 'B'), Colour.BLUE)  # lowercased value
+        self.assertIs(self.parse(0, 'reddish'), Colour.REDDISH)
+        self.assertIsNone(self.parse(0, 'RE'))  # RED and REDDISH both start with it
+        self.assertIsNone(self.parse(0, 'PURPLE'))
+
+    def test_parsed_value_is_shown_by_name(self) -> None:
+        self.parse(0, '2')
+        self.assertEqual(self.engine.arguments[0].string_value, 'REDDISH')
+
+    def test_large_enum(self) -> None:
+        self.assertIs(self.parse(1, 'MEMBER_999'), Big['MEMBER_999'])
+        self.assertIs(self.parse(1, '500'), Big['MEMBER_500'])
+        self.assertIs(self.parse(1, 'member_42'), Big['MEMBER_42'])
+        self.assertIsNone(self.parse(1, 'MEMBER_1000'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+from argbuilder import arg, Flag
+from argbuilder.flags import FlagPlan
+from .support import IsolatedTestCase, make_engine
+
+import unittest
+
+from typing import NamedTuple
+
+
+class FlagPlanTest(IsolatedTestCase):
+    def test_value_flags_merge_into_one_interval(self) -> None:
+        plan = FlagPlan((Flag.GreaterThan(2), Flag.GreaterThanOrEqual(5), Flag.LessThan(10), Flag.LessThanOrEqual(20)))
+        self.assertEqual((plan.lower, plan.lower_inclusive), (5, True))
+        self.assertEqual((plan.upper, plan.upper_inclusive), (10, False))
+        self.assertEqual(plan.stable_flags, [])
+        self.assertEqual([plan.check_interval(value) for value in (4, 5, 9, 10)], [False, True, True, False])
+        self.assertTrue(plan.check_interval('abcde'))  # strings are measured by their length
+
+    def test_path_flags_fold_into_one_stat(self) -> None:
+        plan = FlagPlan((Flag.Exists(), Flag.IsDir()))
+        self.assertTrue(plan.needs_stat)
+        self.assertTrue(plan.is_volatile)
+        self.assertEqual(plan.volatile_flags, [])
+        with self.assertRaises(ValueError):
+            FlagPlan((Flag.Exists(), Flag.DoesNotExist()))
+
+    def test_secret_flags_are_left_out(self) -> None:
+        plan = FlagPlan((Flag.Secret(),))
+        self.assertFalse(plan.is_volatile)
+        self.assertEqual(plan.stable_flags, [])
+
+    def test_flags_get_the_parsed_value(self) -> None:
+        class Schema(NamedTuple):
+            number: int = arg(default=7, flag=Flag.LessThan(10))
+            text: str = arg(default='abc', flag=Flag.GreaterThanOrEqual(3))
+
+        engine = make_engine(Schema)
+        number, text = engine.arguments
+        self.assertTrue(number.value_is_valid(builder=engine))
+        self.assertTrue(text.value_is_valid(builder=engine))
+        self.assertTrue(Flag.LessThan(10).check(number, 7, builder=engine))
+        self.assertFalse(Flag.LessThan(10).check(number, 12, builder=engine))
+        self.assertFalse(Flag.GreaterThanOrEqual(3).check(text, 'ab', builder=engine))
+
+
+if __name__ == '__main__':
+    unittest.main()
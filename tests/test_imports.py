@@ -0,0 +1,51 @@
+from argbuilder.bench.importtime import check_import, measure_import
+
+from pathlib import Path
+import subprocess
+import sys
+import unittest
+
+
+ROOT: Path = Path(__file__).resolve().parents[1]
+
+
+def run(code: str) -> str:
+    """Run `code` in a fresh interpreter, so nothing is imported yet."""
+    return subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True, cwd=ROOT).stdout.strip()
+
+
+class LazyImportTest(unittest.TestCase):
+    def test_names_after_their_submodule_is_imported(self) -> None:
+        output = run(
+            'import argbuilder.public._arg, argbuilder.public.flag, argbuilder.public.argparser, argbuilder.utils._colour\n'
+            'from argbuilder.public import arg, Flag, ArgParser\n'
+            'from argbuilder.utils import colour\n'
+            'from argbuilder import arg as top_arg\n'
+            'print(callable(arg), callable(colour), arg is top_arg, isinstance(Flag, type), isinstance(ArgParser, type))'
+        )
+        self.assertEqual(output, 'True True True True True')
+
+    def test_names_before_their_submodule_is_imported(self) -> None:
+        output = run(
+            'from argbuilder import arg, RememberMode\n'
+            'from argbuilder.utils import colour, Styled\n'
+            'print(callable(arg), callable(colour), isinstance(colour("x", hex="#ffffff"), Styled), RememberMode.NONE.name)'
+        )
+        self.assertEqual(output, 'True True True NONE')
+
+    def test_import_does_not_load_the_drawing_code(self) -> None:
+        output = run(
+            'import sys\n'
+            'from argbuilder import ArgParser, arg\n'
+            'print(sorted(m for m in ("argbuilder.builder", "argbuilder.utils._colour", "json") if m in sys.modules))'
+        )
+        self.assertEqual(output, '[]')
+
+
+class ImportBudgetTest(unittest.TestCase):
+    def test_import_fits_the_budget(self) -> None:
+        self.assertEqual(check_import(measure_import(repeat=5)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
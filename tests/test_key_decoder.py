@@ -0,0 +1,34 @@
+from argbuilder.terminal.posix import KeyDecoder
+from argbuilder.utils import SpecialKey
+
+import unittest
+
+
+class KeyDecoderTest(unittest.TestCase):
+    def test_character_split_across_reads(self) -> None:
+        decoder = KeyDecoder()
+        self.assertEqual(decoder.feed('\u00e9'.encode()[:1]), [])
+        self.assertEqual(decoder.feed('\u00e9'.encode()[1:]), ['\u00e9'])
+
+    def test_unfinished_character_is_replaced_on_final(self) -> None:
+        decoder = KeyDecoder()
+        self.assertEqual(decoder.feed(b'a\xc3', final=True), ['a\ufffd'])
+        self.assertEqual(decoder.feed(b'b'), ['b'])
+
+    def test_unfinished_character_before_a_key(self) -> None:
+        decoder = KeyDecoder()
+        self.assertEqual(decoder.feed(b'a\xc3\r\xa9'), ['a\ufffd', SpecialKey.ENTER, '\ufffd'])
+
+    def test_bracketed_paste_is_one_text_event(self) -> None:
+        decoder = KeyDecoder()
+        self.assertEqual(decoder.feed(b'x\x1b[200~one\rtwo\x1b[Athree\r\n\x1b[201~\r'), ['xone\ntwo[Athree', SpecialKey.ENTER])
+
+    def test_paste_split_across_reads(self) -> None:
+        decoder = KeyDecoder()
+        self.assertEqual(decoder.feed(b'\x1b[200~ab'), [])
+        self.assertEqual(decoder.feed(b'c\x1b[20'), [])
+        self.assertEqual(decoder.feed(b'1~'), ['abc'])
+
+
+if __name__ == '__main__':
+    unittest.main()
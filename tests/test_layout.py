@@ -0,0 +1,55 @@
+from argbuilder.bench import create_builder, make_schema
+from argbuilder.utils import SpecialKey
+from .support import IsolatedTestCase
+
+import unittest
+
+
+class LayoutTest(IsolatedTestCase):
+    def test_wrapped_rows_fit_a_narrow_terminal(self) -> None:
+        builder, _ = create_builder(make_schema(6), terminal_size=(30, 10))
+        for keys in ([], [SpecialKey.DOWN], [SpecialKey.UP]):
+            builder.feed(keys)
+            builder.display()
+            self.assertLess(builder.renderer.frame_rows, 10)  # the cursor rests on the row below the frame
+            self.assertIn(f'{builder.index + 1}/6', builder.renderer.lines[-2])
+
+    def test_cursor_at_the_end_of_a_long_value(self) -> None:
+        builder, _ = create_builder(make_schema(1), terminal_size=(80, 24))
+        start, end = builder.viewport(300, 300, 301, available=60)
+        self.assertEqual((start, end), (243, 300))  # the window ends on the cursor, after the last character
+        builder.feed([SpecialKey.CTRL_BACKSPACE, '1234567890' * 30])
+        builder.display()
+        self.assertIn('1234567890' * 4, builder.renderer.lines[2])
+
+    def test_window_keeps_the_highlighted_range(self) -> None:
+        builder, _ = create_builder(make_schema(1), terminal_size=(80, 24))
+        for left in range(0, 301, 7):
+            start, end = builder.viewport(300, left, left + 1, available=60)
+            self.assertLessEqual(start, left)
+            self.assertLessEqual(left + 1, start + 58)
+            self.assertLessEqual(end, 300)
+
+    def test_finished_frame_has_no_selection(self) -> None:
+        for size, height in ((3, 24), (12, 10)):
+            with self.subTest(size=size):
+                builder, _ = create_builder(make_schema(size), terminal_size=(80, height))
+                builder.feed([SpecialKey.CTRL_DOWN, SpecialKey.ENTER])
+                self.assertTrue(builder.finished)
+                rows = builder.renderer.lines[2:-1]
+                self.assertIn('field-0', rows[0])
+                self.assertFalse(any('\u276f' in row for row in rows))
+                self.assertFalse(any(f'/{size}' in row for row in rows))
+                self.assertEqual(len(set(rows)), len(rows))
+
+    def test_display_window_is_a_slice_of_the_display(self) -> None:
+        builder, _ = create_builder(make_schema(7), terminal_size=(80, 24))
+        for argument in builder.arguments:
+            display = argument.display(builder=builder)
+            self.assertEqual(argument.display_length(builder=builder), len(display))
+            for start, end in ((0, 1), (1, 3), (0, len(display))):
+                self.assertEqual(argument.display_window(start, end, builder=builder), display[start:end])
+
+
+if __name__ == '__main__':
+    unittest.main()
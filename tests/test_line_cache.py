@@ -0,0 +1,39 @@
+from argbuilder.bench import create_builder, make_schema
+from argbuilder.builder import Builder
+from argbuilder.utils import SpecialKey
+from .support import IsolatedTestCase
+
+import os
+import unittest
+from unittest import mock
+
+
+class LineCacheTest(IsolatedTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.builder, _ = create_builder(make_schema(5), terminal_size=(80, 24))
+        self.builder.display()
+
+    def built_rows(self, *events: str | SpecialKey) -> list[str]:
+        with mock.patch.object(Builder, 'build_line', autospec=True, side_effect=Builder.build_line) as build_line:
+            self.builder.feed(list(events))
+            self.builder.display()
+        return [call.args[1].name for call in build_line.call_args_list]
+
+    def test_typing_rebuilds_the_selected_row(self) -> None:
+        self.assertEqual(self.built_rows('7'), ['field_0'])
+
+    def test_moving_rebuilds_the_old_and_new_row(self) -> None:
+        self.assertEqual(sorted(self.built_rows(SpecialKey.DOWN)), ['field_0', 'field_1'])
+
+    def test_unchanged_frame_rebuilds_nothing(self) -> None:
+        self.assertEqual(self.built_rows(), [])
+
+    def test_resize_rebuilds_every_row(self) -> None:
+        self.builder.on_resize()
+        self.builder.terminal_size = os.terminal_size((60, 24))
+        self.assertEqual(len(self.built_rows()), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
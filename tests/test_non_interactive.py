@@ -0,0 +1,77 @@
+from argbuilder import arg, Flag
+from argbuilder.engine import parse_non_interactive
+from argbuilder.remember import RememberMode
+from .support import IsolatedTestCase
+
+import contextlib
+import io
+import sys
+import unittest
+
+from typing import NamedTuple, Optional
+
+
+class Schema(NamedTuple):
+    number: int = arg(flag=Flag.GreaterThan(0))
+    text: str = arg()
+
+
+class Defaults(NamedTuple):
+    number: int = arg(default=1)
+    text: str = arg(default='x')
+    level_of_detail: int = arg(default=0)
+
+
+def parse(*argv: str, schema: type[NamedTuple] = Schema) -> tuple[Optional[NamedTuple], int, list[str]]:
+    """The parsed arguments, the exit status and the lines written to stderr."""
+    before = sys.argv
+    sys.argv = ['test', *argv]
+    stderr = io.StringIO()
+    try:
+        with contextlib.redirect_stderr(stderr):
+            result = parse_non_interactive(schema, name='test', description='', author='', remember_mode=(RememberMode.NONE, -1))
+        return result, 0, stderr.getvalue().splitlines()
+    except SystemExit as exc:
+        return None, exc.code, stderr.getvalue().splitlines()  # type: ignore
+    finally:
+        sys.argv = before
+
+
+class NonInteractiveTest(IsolatedTestCase):
+    def test_valid(self) -> None:
+        self.assertEqual(parse('--number', '3', '--text', 'hi'), (Schema(3, 'hi'), 0, []))
+
+    def test_invalid_value_is_reported_once(self) -> None:
+        _, status, errors = parse('--number', 'abc', '--text', 'hi')
+        self.assertNotEqual(status, 0)
+        self.assertEqual(errors, ["test: invalid value 'abc' for \"--number\""])
+
+    def test_missing_and_invalid(self) -> None:
+        _, status, errors = parse('--number', '-4')
+        self.assertNotEqual(status, 0)
+        self.assertEqual(errors, [
+            "test: invalid value '-4' for \"--number\"",
+            'test: missing value for "--text"',
+        ])
+
+    def test_rejected_argv_does_not_fall_back_to_defaults(self) -> None:
+        self.assertEqual(parse(schema=Defaults), (Defaults(1, 'x', 0), 0, []))
+        for argv, error in (
+            (('--bogus', '3'), 'Error while reading argv: Invalid argument "bogus"'),
+            (('--number', '2', '--number', '3'), 'Error while reading argv: Key "number" used more than once'),
+            (('1', '2', '3', '4'), 'Error while reading argv: Too many positional arguments'),
+            (('--number', 'abc'), "test: invalid value 'abc' for \"--number\""),
+        ):
+            with self.subTest(argv=argv):
+                self.assertEqual(parse(*argv, schema=Defaults), (None, 2, [error]))
+
+    def test_option_names_are_dashed(self) -> None:
+        self.assertEqual(parse('--level-of-detail', '2', schema=Defaults), (Defaults(1, 'x', 2), 0, []))
+        self.assertEqual(
+            parse('--level-of-detail', 'high', schema=Defaults),
+            (None, 2, ["test: invalid value 'high' for \"--level-of-detail\""]),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+from argbuilder import arg
+from .support import IsolatedTestCase, make_engine
+
+import unittest
+
+from typing import Literal, NamedTuple
+
+
+class OptionTest(IsolatedTestCase):
+    def validity(self, schema: type[NamedTuple], *string_values: str) -> list[bool]:
+        engine = make_engine(schema)
+        argument = engine.arguments[0]
+        validity: list[bool] = []
+        for string_value in string_values:
+            argument.string_value = string_value
+            argument.invalidate()
+            validity.append(argument.value_is_valid(builder=engine))
+        return validity
+
+    def test_membership(self) -> None:
+        class Schema(NamedTuple):
+            number: int = arg(default=2, options=list(range(0, 2000, 2)))
+
+        self.assertEqual(self.validity(Schema, '1998', '1999', '2000'), [True, False, False])
+
+    def test_literal_and_options(self) -> None:
+        class Schema(NamedTuple):
+            letter: Literal['A', 'B', 'C'] = arg(default='A', options=['A', 'B'])
+
+        self.assertEqual(self.validity(Schema, 'B', 'C'), [True, False])  # only the options given to arg() are offered
+
+        class Mismatch(NamedTuple):
+            letter: Literal['A', 'B', 'C'] = arg(default='A', options=['A', 'D'])
+
+        with self.assertRaises(ValueError):
+            make_engine(Mismatch)
+
+    def test_duplicate_options(self) -> None:
+        class Schema(NamedTuple):
+            letter: str = arg(default='A', options=['A', 'B', 'A'])
+
+        with self.assertRaises(ValueError):
+            make_engine(Schema)
+
+
+if __name__ == '__main__':
+    unittest.main()
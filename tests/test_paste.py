@@ -0,0 +1,35 @@
+from argbuilder import arg
+from .support import IsolatedTestCase, make_engine, string_values
+
+import unittest
+from unittest import mock
+
+from typing import NamedTuple
+
+
+class Schema(NamedTuple):
+    text: str = arg()
+    number: int = arg()
+
+
+class PasteTest(IsolatedTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.engine = make_engine(Schema)
+
+    def test_burst_is_one_edit(self) -> None:
+        with mock.patch.object(self.engine, 'handle_text', wraps=self.engine.handle_text) as handle_text:
+            self.engine.handle_events(list('hello world'))
+        handle_text.assert_called_once_with('hello world')
+        self.assertEqual(string_values(self.engine)[0], 'hello world')
+        self.assertEqual(len(self.engine.command_manager.undo_stack), 1)
+
+    def test_numbers_keep_their_characters(self) -> None:
+        self.engine.index = 1
+        self.engine.inner_index = 0
+        self.engine.handle_events(['1,2', '34 x'])
+        self.assertEqual(string_values(self.engine)[1], '1234')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+from argbuilder.renderer import Renderer
+
+import io
+import unittest
+
+
+class RendererTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.stream = io.StringIO()
+        self.renderer = Renderer(self.stream)
+
+    def render(self, *lines: str, width: int = 20) -> str:
+        start = self.stream.tell()
+        self.renderer.render([(line, len(line)) for line in lines], width=width)
+        return self.stream.getvalue()[start:]
+
+    def test_first_frame_is_drawn_in_full(self) -> None:
+        written = self.render('first', 'second', 'third')
+        for line in ('first', 'second', 'third'):
+            self.assertIn(line, written)
+        self.assertEqual(self.renderer.frame_rows, 3)
+
+    def test_only_changed_lines_are_rewritten(self) -> None:
+        self.render('first', 'second', 'third')
+        written = self.render('first', 'changed', 'third')
+        self.assertIn('changed', written)
+        self.assertNotIn('first', written)
+        self.assertNotIn('third', written)
+        self.assertNotIn('\033[J', written)
+
+    def test_unchanged_frame_only_moves_the_cursor(self) -> None:
+        self.render('first', 'second')
+        written = self.render('first', 'second')
+        self.assertNotIn('first', written)
+        self.assertNotIn('second', written)
+        self.assertEqual(self.renderer.cursor_row, 1)
+
+    def test_shorter_frame_clears_the_rest(self) -> None:
+        self.render('first', 'second', 'third')
+        written = self.render('first', 'second')
+        self.assertIn('\033[J', written)
+        self.assertEqual(self.renderer.frame_rows, 2)
+
+    def test_wrapped_line_moves_everything_below(self) -> None:
+        self.render('first', 'second', 'third')
+        written = self.render('x' * 30, 'second', 'third')
+        self.assertIn('second', written)
+        self.assertIn('third', written)
+        self.assertEqual(self.renderer.frame_rows, 4)
+
+    def test_new_width_redraws_everything(self) -> None:
+        self.render('first', 'second')
+        written = self.render('first', 'second', width=30)
+        self.assertIn('first', written)
+        self.assertIn('second', written)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+from argbuilder import arg, Flag
+from argbuilder.bench import create_builder, make_schema
+from argbuilder.flags import STAT_CACHE
+from argbuilder.scheduler import FrameScheduler
+from argbuilder.utils import SpecialKey
+from .support import IsolatedTestCase
+
+from pathlib import Path
+import tempfile
+import time
+import unittest
+
+from typing import Any, NamedTuple, Optional
+
+
+class SchedulerTest(IsolatedTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.ttl = STAT_CACHE.ttl
+        STAT_CACHE.ttl = 0.05
+        STAT_CACHE.clear()
+
+    def tearDown(self) -> None:
+        STAT_CACHE.ttl = self.ttl
+        STAT_CACHE.clear()
+
+    def test_new_file_is_drawn_without_a_key_press(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            created = Path(directory) / 'created'
+
+            class Schema(NamedTuple):
+                path: Path = arg(default=created, flag=Flag.Exists())
+
+            builder, _ = create_builder(Schema, terminal_size=(80, 24))
+            frames: list[str] = []
+            display = builder.display
+
+            def counted_display() -> None:
+                display()
+                frames.append(builder.renderer.lines[2])
+
+            def fetch_events(timeout: Optional[float] = None) -> list:
+                if len(frames) == 1:
+                    self.assertEqual(timeout, STAT_CACHE.ttl)
+                    created.touch()
+                    time.sleep(STAT_CACHE.ttl * 2)
+                    return []
+                return [SpecialKey.ENTER]
+
+            builder.display = counted_display  # type: ignore
+            builder.fetch_events = fetch_events  # type: ignore
+            FrameScheduler(builder).run()
+            self.assertTrue(builder.finished)
+            self.assertEqual(len(frames), 3)  # the invalid path, the same path once it exists, and the finished frame
+            self.assertNotEqual(frames[0], frames[1])
+
+    def run_scripted(self, bursts: list[list[Any]], *, max_fps: int) -> int:
+        """Run a builder on `bursts` of events that arrive without any delay, return how many frames were drawn."""
+        builder, _ = create_builder(make_schema(3), terminal_size=(80, 24))
+        frames: list[None] = []
+        display = builder.display
+
+        def counted_display() -> None:
+            display()
+            frames.append(None)
+
+        def fetch_events(timeout: Optional[float] = None) -> list:
+            return bursts.pop(0) if bursts else [SpecialKey.CTRL_DOWN, SpecialKey.ENTER]
+
+        builder.display = counted_display  # type: ignore
+        builder.fetch_events = fetch_events  # type: ignore
+        FrameScheduler(builder, max_fps=max_fps).run()
+        self.assertTrue(builder.finished)
+        return len(frames)
+
+    def test_keys_within_a_frame_are_coalesced(self) -> None:
+        self.assertEqual(self.run_scripted([[key] for key in '123456'], max_fps=1), 2)  # the first frame and the finished one
+
+    def test_unchanged_state_is_not_drawn(self) -> None:
+        self.assertEqual(self.run_scripted([[], [], []], max_fps=1000), 2)
+
+    def test_fps_must_be_positive(self) -> None:
+        builder, _ = create_builder(make_schema(1), terminal_size=(80, 24))
+        with self.assertRaises(ValueError):
+            FrameScheduler(builder, max_fps=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+from argbuilder import arg, RememberMode
+from argbuilder.engine import Engine
+from argbuilder import schema_cache
+from argbuilder.schema_cache import cache_folder, cache_key, load_compiled_schema
+from .support import IsolatedTestCase
+
+import os
+from pathlib import Path
+import pathlib
+import pickle
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from typing import NamedTuple
+
+
+class Schema(NamedTuple):
+    text: str = arg(default='hello')
+    path: Path = arg(default=Path('.'))
+
+
+OPTIONS = dict(name='test', description='', author='', remember_mode=(RememberMode.NONE, -1), cache=True)
+
+
+class SchemaCacheTest(IsolatedTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        patcher = mock.patch.object(sys, 'argv', ['test'])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_cache_is_stored_in_the_user_cache_directory(self) -> None:
+        with tempfile.TemporaryDirectory() as directory, mock.patch.dict(os.environ, {'XDG_CACHE_HOME': directory}):
+            Engine.from_named_tuple_cls(Schema, **OPTIONS)
+            self.assertEqual(len(list((Path(directory) / 'argbuilder' / 'schemas').glob('*.pickle'))), 1)
+            arguments = load_compiled_schema(Schema)
+            self.assertIsNotNone(arguments)
+            self.assertEqual([argument.name for argument in arguments], ['text', 'path'])
+
+    def test_unwritable_cache_directory_falls_back_to_compiling(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            blocked = Path(directory) / 'file'
+            blocked.touch()
+            with mock.patch.dict(os.environ, {'XDG_CACHE_HOME': str(blocked)}):
+                engine = Engine.from_named_tuple_cls(Schema, **OPTIONS)
+                self.assertEqual([argument.name for argument in engine.arguments], ['text', 'path'])
+                self.assertIsNone(load_compiled_schema(Schema))
+
+    def test_key_covers_the_modules_of_annotations(self) -> None:
+        key = cache_key(Schema)
+        self.assertIsNotNone(key)
+        self.assertEqual(key.sources[0][0], __file__)
+        self.assertIn(pathlib.__file__, [source for source, _, _ in key.sources])
+
+    def test_upgrade_or_changed_values_miss_the_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as directory, mock.patch.dict(os.environ, {'XDG_CACHE_HOME': directory}):
+            Engine.from_named_tuple_cls(Schema, **OPTIONS)
+            self.assertIsNotNone(load_compiled_schema(Schema))
+            with mock.patch.object(schema_cache, 'package_checksum', return_value=0):
+                self.assertIsNone(load_compiled_schema(Schema))
+            unparsed = Schema._field_defaults['path']
+            with mock.patch.object(unparsed, 'default', Path('elsewhere')):
+                self.assertIsNone(load_compiled_schema(Schema))
+            self.assertIsNotNone(load_compiled_schema(Schema))
+
+    def test_key_is_stored_before_the_arguments(self) -> None:
+        with tempfile.TemporaryDirectory() as directory, mock.patch.dict(os.environ, {'XDG_CACHE_HOME': directory}):
+            Engine.from_named_tuple_cls(Schema, **OPTIONS)
+            folder = cache_folder()
+            assert folder is not None
+            [path] = folder.glob('*.pickle')
+            with path.open('rb') as file:
+                self.assertEqual(pickle.load(file), cache_key(Schema))
+
+
+if __name__ == '__main__':
+    unittest.main()
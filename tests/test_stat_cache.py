@@ -0,0 +1,55 @@
+from argbuilder import arg, Flag
+from argbuilder.flags import STAT_CACHE
+from .support import IsolatedTestCase, make_engine
+
+import os
+from pathlib import Path
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from typing import NamedTuple
+
+
+class StatCacheTest(IsolatedTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.ttl = STAT_CACHE.ttl
+        STAT_CACHE.ttl = 0.05
+        STAT_CACHE.clear()
+
+    def tearDown(self) -> None:
+        STAT_CACHE.ttl = self.ttl
+        STAT_CACHE.clear()
+
+    def test_headless_engine_sees_a_new_file(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            created = Path(directory) / 'created'
+
+            class Schema(NamedTuple):
+                path: Path = arg(default=created, flag=Flag.Exists())
+
+            engine = make_engine(Schema)
+            self.assertFalse(engine.snapshot().arguments[0].is_valid)
+            created.touch()
+            self.assertFalse(engine.snapshot().arguments[0].is_valid)  # still cached
+            time.sleep(STAT_CACHE.ttl * 2)
+            self.assertTrue(engine.snapshot().arguments[0].is_valid)
+
+    def test_one_stat_per_path(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            class Schema(NamedTuple):
+                folder: Path = arg(default=Path(directory), flags=(Flag.Exists(), Flag.IsDir()))
+                same: Path = arg(default=Path(directory), flag=Flag.IsDir())
+
+            engine = make_engine(Schema)
+            STAT_CACHE.clear()
+            with mock.patch('argbuilder.flags.path.os.stat', wraps=os.stat) as stat:
+                for _ in range(3):
+                    self.assertTrue(all(argument.is_valid for argument in engine.snapshot().arguments))
+            self.assertEqual(stat.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
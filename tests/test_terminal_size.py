@@ -0,0 +1,73 @@
+from argbuilder.bench import create_builder, make_schema
+from argbuilder.terminal import InputBackend, InputEvent
+from .support import IsolatedTestCase
+
+import os
+import signal
+import sys
+import time
+import unittest
+from unittest import mock
+
+from typing import Optional
+
+
+class ResizingBackend(InputBackend):
+    def read_events(self, timeout: Optional[float] = None) -> list[InputEvent]:
+        self.resized = True
+        return []
+
+
+class TerminalSizeTest(IsolatedTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.builder, _ = create_builder(make_schema(3), terminal_size=(80, 24))
+        self.builder.terminal_size = None
+
+    def test_size_is_asked_for_once(self) -> None:
+        with mock.patch('os.get_terminal_size', return_value=os.terminal_size((100, 30))) as get_terminal_size:
+            self.builder.display()
+            self.builder.display()
+            self.assertEqual(get_terminal_size.call_count, 1)
+            self.builder.on_resize()
+            self.builder.display()
+            self.assertEqual(get_terminal_size.call_count, 2)
+        self.assertEqual(self.builder.renderer.width, 100)
+
+    def test_unknown_size_falls_back(self) -> None:
+        for effect in (OSError(), [os.terminal_size((0, 0))]):
+            with self.subTest(effect=effect), mock.patch('os.get_terminal_size', side_effect=effect):
+                self.builder.terminal_size = None
+                self.assertEqual(self.builder.get_terminal_size(), os.terminal_size((80, 24)))
+
+    def test_backend_resize_drops_the_size(self) -> None:
+        self.builder.input_backend = ResizingBackend()
+        self.builder.get_terminal_size()
+        self.builder.fetch_events(0)
+        self.assertIsNone(self.builder.terminal_size)
+        self.assertEqual(self.builder.line_cache, {})
+
+
+@unittest.skipIf(sys.platform == 'win32', 'SIGWINCH is POSIX only')
+class ResizeSignalTest(unittest.TestCase):
+    def test_signal_wakes_the_wait(self) -> None:
+        from argbuilder.terminal.posix import PosixInputBackend
+
+        read_fd, write_fd = os.pipe()
+        self.addCleanup(os.close, read_fd)
+        self.addCleanup(os.close, write_fd)
+        backend = PosixInputBackend()
+        backend.fd = read_fd
+        backend.watch_resize()
+        self.addCleanup(backend.unwatch_resize)
+        previous = signal.signal(signal.SIGALRM, lambda signum, frame: os.kill(os.getpid(), signal.SIGWINCH))
+        self.addCleanup(signal.signal, signal.SIGALRM, previous)
+        start = time.monotonic()
+        signal.setitimer(signal.ITIMER_REAL, 0.05)  # resize while `read_events` waits
+        self.assertEqual(backend.read_events(5), [])
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertTrue(backend.take_resized())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+from argbuilder.utils import TextBuffer
+
+import random
+import unittest
+
+
+class TextBufferTest(unittest.TestCase):
+    def test_matches_a_plain_string(self) -> None:
+        rng = random.Random(0)
+        for reads_every in (1, 3, 50):
+            buffer = TextBuffer('hello world')
+            text = 'hello world'
+            for step in range(2000):
+                index = rng.randint(0, len(text))
+                if rng.random() < 0.6:
+                    inserted = rng.choice(('a', 'bc', ' ', 'xyz' * 5))
+                    buffer.insert(index, inserted)
+                    text = text[:index] + inserted + text[index:]
+                else:
+                    length = rng.randint(0, 4)
+                    self.assertEqual(buffer.delete(index, length), text[index:index + length])
+                    text = text[:index] + text[index + length:]
+                self.assertEqual(len(buffer), len(text))
+                start = rng.randint(0, len(text))
+                self.assertEqual(buffer.slice(start, start + 7), text[start:start + 7])
+                if step % reads_every == 0:
+                    self.assertEqual(str(buffer), text)
+            self.assertEqual(str(buffer), text)
+
+    def test_text_is_built_once_per_revision(self) -> None:
+        buffer = TextBuffer('x' * 1000)
+        buffer.insert(500, 'y')
+        joined = str(buffer)
+        self.assertIs(str(buffer), joined)
+        buffer.insert(0, 'z')
+        self.assertIsNot(str(buffer), joined)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+from argbuilder.bench import create_builder, make_schema
+from argbuilder.tracing import start_tracing, stop_tracing
+from .support import IsolatedTestCase
+
+import unittest
+
+from typing import Any
+
+
+class TracingTest(IsolatedTestCase):
+    def test_frame_phases_and_bytes(self) -> None:
+        builder, stream = create_builder(make_schema(7), terminal_size=(80, 24))
+        events: list[dict[str, Any]] = []
+        builder.feed(['\u00e9\u00e9'])  # two characters, four bytes in utf-8
+        before = stream.buffer.written
+        start_tracing(events.append)
+        try:
+            builder.display()
+        finally:
+            stop_tracing()
+        self.assertEqual([e['name'] for e in events if e.get('cat') == 'frame'], ['validation', 'layout', 'render'])
+        [frame] = [e for e in events if e['ph'] == 'C']
+        self.assertEqual(frame['args']['bytes'], stream.buffer.written - before)
+
+
+if __name__ == '__main__':
+    unittest.main()
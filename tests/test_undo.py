@@ -0,0 +1,43 @@
+from argbuilder import arg
+from argbuilder.utils import SpecialKey
+from .support import IsolatedTestCase, make_engine, string_values
+
+from enum import Enum
+import unittest
+
+from typing import NamedTuple
+
+
+class Colour(Enum):
+    RED = 1
+    GREEN = 2
+
+
+class UndoTest(IsolatedTestCase):
+    def test_enum_undo_after_the_value_is_rewritten(self) -> None:
+        class Schema(NamedTuple):
+            colour: Colour = arg(default=Colour.RED)
+
+        engine = make_engine(Schema)
+        for event in (SpecialKey.CTRL_BACKSPACE, '2', SpecialKey.BACKSPACE):
+            engine.feed([event])
+            engine.snapshot()  # validates like a drawn frame would, which parses "2" into "GREEN"
+        self.assertEqual(string_values(engine), ['GREE'])
+        for _ in range(3):
+            engine.feed([SpecialKey.CTRL_Z])
+            engine.snapshot()
+        self.assertEqual(string_values(engine), ['RED'])
+
+    def test_string_undo(self) -> None:
+        class Schema(NamedTuple):
+            text: str = arg(default='abc')
+
+        engine = make_engine(Schema)
+        engine.feed([SpecialKey.CTRL_BACKSPACE, 'xyz', SpecialKey.BACKSPACE])
+        self.assertEqual(string_values(engine), ['xy'])
+        engine.feed([SpecialKey.CTRL_Z] * 3)
+        self.assertEqual(string_values(engine), ['abc'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+from argbuilder import arg, Flag
+from argbuilder.arguments import IntegerArgument
+from argbuilder.command import SetCommand
+from argbuilder.utils import SpecialKey
+from .support import IsolatedTestCase, make_engine
+
+import unittest
+from unittest import mock
+
+from typing import NamedTuple
+
+
+class Schema(NamedTuple):
+    number: int = arg(default=3, flag=Flag.LessThan(10))
+
+
+class ValidityCacheTest(IsolatedTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.engine = make_engine(Schema)
+        self.argument = self.engine.arguments[0]
+
+    def test_value_is_parsed_once_per_state(self) -> None:
+        with mock.patch.object(IntegerArgument, 'raw_get_value', autospec=True, side_effect=IntegerArgument.raw_get_value) as raw_get_value:
+            for _ in range(3):
+                self.assertTrue(self.argument.value_is_valid(builder=self.engine))
+                self.assertEqual(self.argument.get_value(builder=self.engine), 3)
+            self.engine.create_named_tuple()
+        self.assertEqual(raw_get_value.call_count, 1)
+
+    def test_set_command_invalidates(self) -> None:
+        self.assertTrue(self.argument.value_is_valid(builder=self.engine))
+        self.engine.command_manager.do(SetCommand(self.argument, '42', False, 0, 0), builder=self.engine)
+        self.assertFalse(self.argument.value_is_valid(builder=self.engine))
+        self.engine.feed([SpecialKey.CTRL_Z])
+        self.assertTrue(self.argument.value_is_valid(builder=self.engine))
+        self.engine.feed([SpecialKey.CTRL_Y])
+        self.assertFalse(self.argument.value_is_valid(builder=self.engine))
+
+    def test_typing_invalidates(self) -> None:
+        self.assertTrue(self.argument.value_is_valid(builder=self.engine))
+        self.engine.feed(['5'])
+        self.assertFalse(self.argument.value_is_valid(builder=self.engine))
+        self.engine.feed([SpecialKey.CTRL_Z])
+        self.assertTrue(self.argument.value_is_valid(builder=self.engine))
+
+
+if __name__ == '__main__':
+    unittest.main()